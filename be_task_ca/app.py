@@ -1,30 +1,85 @@
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
+from be_task_ca.cache import TTLCache
+from be_task_ca.compression import CompressionMiddleware
 from be_task_ca.item.adapters.api.api import item_router
+from be_task_ca.item.adapters.api.async_api import async_item_router
+from be_task_ca.item.adapters.catalog_snapshot_refresher import (
+    install_catalog_snapshot_refresher,
+)
 from be_task_ca.user.adapters.api.api import user_router
+from be_task_ca.user.adapters.api.async_api import async_user_router
+from be_task_ca.observability.admin import admin_router
+from be_task_ca.observability.api import observability_router
+from be_task_ca.observability.http import ProfilingMiddleware, RequestMetricsMiddleware
+from be_task_ca.observability.metrics import REGISTRY
+from be_task_ca.observability.multiprocess import install_snapshot_writer
+from be_task_ca.observability.profiling import profile_store
+from be_task_ca.user.adapters.password_hashing import shutdown_password_hash_executor
+from be_task_ca.user.adapters.reservation_sweeper import install_reservation_sweeper
 from be_task_ca.item.adapters.db import model as _item_model  # noqa: F401
 from be_task_ca.user.adapters.db import model as _user_model  # noqa: F401
 
-from .database import SessionLocal, engine
+from .settings import settings
 
+DB_MODE_SYNC = "sync"
+DB_MODE_ASYNC = "async"
 
-app = FastAPI()
-app.include_router(user_router)
-app.include_router(item_router)
 
+def create_app(db_mode: str = DB_MODE_SYNC) -> FastAPI:
+    """Build the application wired to the sync or the async persistence stack."""
+    application = FastAPI()
+    if db_mode == DB_MODE_SYNC:
+        application.include_router(user_router)
+        application.include_router(item_router)
+    elif db_mode == DB_MODE_ASYNC:
+        application.include_router(async_user_router)
+        application.include_router(async_item_router)
+    else:
+        raise ValueError(f"Unknown db mode: {db_mode!r}")
+    application.include_router(observability_router)
+    application.include_router(admin_router)
+    if settings.admin_token is not None or settings.profile_sample_rate > 0:
+        # Added first so that it runs inside RequestMetricsMiddleware.
+        application.add_middleware(
+            ProfilingMiddleware,
+            store=profile_store,
+            sample_rate=settings.profile_sample_rate,
+            interval=settings.profile_interval_ms / 1000,
+        )
+    if settings.compression_enabled:
+        application.add_middleware(
+            CompressionMiddleware,
+            encodings=settings.compression_encodings,
+            minimum_size=settings.compression_minimum_size,
+            levels=settings.compression_levels,
+            route_levels=settings.compression_route_levels,
+            cache=TTLCache(
+                "compressed_responses",
+                maxsize=settings.compression_cache_size,
+                ttl=settings.compression_cache_ttl_seconds,
+            ),
+        )
+    application.add_middleware(RequestMetricsMiddleware)
+    if settings.metrics_multiprocess_dir is not None:
+        install_snapshot_writer(application, REGISTRY, settings)
+    if settings.reservation_sweeper_enabled:
+        install_reservation_sweeper(
+            application, settings, use_async=db_mode == DB_MODE_ASYNC
+        )
+    if settings.catalog_snapshot_enabled:
+        install_catalog_snapshot_refresher(
+            application, settings, use_async=db_mode == DB_MODE_ASYNC
+        )
+    application.add_event_handler("shutdown", shutdown_password_hash_executor)
 
-@app.middleware("http")
-async def db_session_middleware(request: Request, call_next):
-    response = Response("Internal server error", status_code=500)
-    try:
-        request.state.db = SessionLocal()
-        response = await call_next(request)
-    finally:
-        request.state.db.close()
-    return response
+    application.get("/")(root)
+    return application
 
 
-@app.get("/")
 async def root():
     return {
         "message": "Thanks for shopping at Nile!"
     }  # the Nile is 250km longer than the Amazon
+
+
+app = create_app(settings.db_mode)
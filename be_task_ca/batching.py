@@ -0,0 +1,13 @@
+"""Splitting an iterable into fixed-size lists."""
+
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+def batches(values: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield consecutive lists of at most `size` values, consuming lazily."""
+    values = iter(values)
+    while batch := list(islice(values, size)):
+        yield batch
@@ -0,0 +1,74 @@
+"""Bulk request bodies accepted either as a JSON array or as NDJSON."""
+
+import json
+from typing import Any, TypeVar
+
+from fastapi import HTTPException
+from pydantic import BaseModel, ValidationError, parse_obj_as
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def bulk_request_body(schema_name: str) -> dict[str, Any]:
+    """OpenAPI request body for a route that reads its bulk body by hand.
+
+    Such routes accept both formats, so FastAPI cannot derive the schema from
+    the signature and it is declared through `openapi_extra`.
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": f"#/components/schemas/{schema_name}"},
+                    }
+                },
+                NDJSON_MEDIA_TYPE: {
+                    "schema": {
+                        "type": "string",
+                        "description": f"One {schema_name} JSON object per line",
+                    }
+                },
+            },
+        }
+    }
+
+
+def parse_bulk_body(
+    body: bytes,
+    content_type: str | None,
+    model: type[ModelT],
+    max_count: int,
+    too_many_detail: str,
+) -> list[ModelT]:
+    """Parse a JSON array or NDJSON body into `model`s.
+
+    Invalid input is rejected with 422, naming the offending NDJSON line, and
+    more than `max_count` entries with 413 and `too_many_detail`.
+    """
+    if content_type is not None and NDJSON_MEDIA_TYPE in content_type:
+        entries = [
+            _parse_line(model, number, line)
+            for number, line in enumerate(body.splitlines(), start=1)
+            if line.strip()
+        ]
+    else:
+        try:
+            entries = parse_obj_as(list[model], json.loads(body))
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+    if len(entries) > max_count:
+        raise HTTPException(status_code=413, detail=too_many_detail)
+    return entries
+
+
+def _parse_line(model: type[ModelT], number: int, line: bytes) -> ModelT:
+    try:
+        return model.parse_raw(line)
+    except ValidationError as exc:
+        raise HTTPException(status_code=422, detail=f"Line {number}: {exc}") from exc
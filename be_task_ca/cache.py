@@ -0,0 +1,137 @@
+"""In-process TTL/LRU cache with an optional shared second tier."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Protocol
+
+from be_task_ca.observability.metrics import Counter, Gauge
+
+CACHE_HITS = Counter("cache_hits_total", "Cache lookups served from cache.", ["cache"])
+CACHE_MISSES = Counter("cache_misses_total", "Cache lookups that missed.", ["cache"])
+CACHE_EVICTIONS = Counter(
+    "cache_evictions_total", "Entries evicted to respect the size bound.", ["cache"]
+)
+CACHE_ENTRIES = Gauge("cache_entries", "Entries currently held in memory.", ["cache"])
+
+
+class CacheBackend(Protocol):
+    """Key/value store with per-entry expiry, e.g. a shared Redis instance."""
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value or None."""
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store a value for `ttl` seconds."""
+
+    def delete(self, key: Hashable) -> None:
+        """Drop a key if present."""
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after `ttl` seconds."""
+
+    def __init__(
+        self, name: str, maxsize: int, ttl: float, clock=time.monotonic
+    ) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        CACHE_ENTRIES.labels(name).set_function(lambda: len(self._entries))
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                CACHE_HITS.labels(self.name).inc()
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            CACHE_MISSES.labels(self.name).inc()
+            return None
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+                CACHE_EVICTIONS.labels(self.name).inc()
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class InMemoryCacheBackend:
+    """Local stand-in for a shared cache backend, used in tests and single-node runs."""
+
+    def __init__(self, clock=time.monotonic) -> None:
+        self._clock = clock
+        self._entries: dict[Hashable, tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= self._clock():
+                return None
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, self._clock() + ttl)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class TieredCache:
+    """Local TTLCache in front of an optional shared backend.
+
+    Reads fall through local -> shared and backfill the local tier; writes and
+    deletes go to both. Other processes only drop their local copy when it
+    expires, so the local TTL bounds cross-worker staleness.
+    """
+
+    def __init__(self, local: TTLCache, shared: CacheBackend | None = None) -> None:
+        self.local = local
+        self.shared = shared
+
+    def get(self, key: Hashable) -> Any | None:
+        value = self.local.get(key)
+        if value is None and self.shared is not None:
+            value = self.shared.get(key)
+            if value is not None:
+                self.local.set(key, value)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self.local.set(key, value)
+        if self.shared is not None:
+            self.shared.set(key, value, self.local.ttl)
+
+    def delete(self, key: Hashable) -> None:
+        self.local.delete(key)
+        if self.shared is not None:
+            self.shared.delete(key)
+
+    def delete_many(self, keys: Iterable[Hashable]) -> None:
+        for key in keys:
+            self.delete(key)
@@ -2,9 +2,14 @@ from .database import engine, Base
 
 # just importing all the models is enough to have them created
 # flake8: noqa
-from .item.adapters.db.model import Item
+from .item.adapters.db.model import Item, StockReservation
 from .user.adapters.db.model import CartItem, User
 
 
 def create_db_schema():
     Base.metadata.create_all(bind=engine)
+    # create_all skips tables that exist, so indexes added to a model later,
+    # such as the item search indexes, are created here.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
@@ -1,5 +1,25 @@
-from fastapi import Request
+from typing import AsyncIterator, Iterator
 
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
-def get_db(request: Request):
-    return request.state.db
+from .database import AsyncSessionLocal, SessionLocal
+
+
+def get_db() -> Iterator[Session]:
+    """Open a session only for routes that depend on it; closed after the response.
+
+    Routes depending on it are plain `def`, so FastAPI runs them in the
+    threadpool: a route waiting for a pooled connection then never blocks the
+    event loop that closes the sessions of finished requests.
+    """
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,230 @@
+"""ASGI middleware compressing response bodies with gzip, brotli or zstd."""
+
+import gzip
+import zlib
+from typing import Callable, Iterable, Mapping
+
+import brotli
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from be_task_ca.cache import TTLCache
+
+CONTENT_CODINGS = ("zstd", "br", "gzip")
+DEFAULT_LEVELS = {"zstd": 3, "br": 4, "gzip": 6}
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+# Larger compressed bodies are not cached, so that a few huge responses cannot
+# take the whole cache's memory.
+CACHE_MAX_BODY_BYTES = 1 << 20
+
+
+def negotiate_content_coding(
+    accept_encoding: str | None, offered: Iterable[str]
+) -> str | None:
+    """Return the first `offered` coding the Accept-Encoding header accepts."""
+    weights = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, parameters = part.partition(";")
+        name, _, value = parameters.strip().partition("=")
+        try:
+            weight = float(value) if name.strip() == "q" else 1.0
+        except ValueError:
+            weight = 0.0
+        weights[coding.strip().lower()] = weight
+    for coding in offered:
+        if weights.get(coding, weights.get("*", 0.0)) > 0:
+            return coding
+    return None
+
+
+def compress(body: bytes, coding: str, level: int) -> bytes:
+    if coding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(body)
+    if coding == "br":
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, level, mtime=0)
+
+
+def stream_compressor(coding: str, level: int) -> Callable[[bytes, bool], bytes]:
+    """Return a function compressing successive chunks of one body.
+
+    The output is flushed after every chunk, so that a streamed response keeps
+    reaching the client as it is produced; `last` ends the stream.
+    """
+    if coding == "zstd":
+        zstd = zstandard.ZstdCompressor(level=level).compressobj()
+
+        def process(chunk: bytes, last: bool) -> bytes:
+            flush_mode = (
+                zstandard.COMPRESSOBJ_FLUSH_FINISH
+                if last
+                else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            )
+            return zstd.compress(chunk) + zstd.flush(flush_mode)
+
+    elif coding == "br":
+        br = brotli.Compressor(quality=level)
+
+        def process(chunk: bytes, last: bool) -> bytes:
+            return br.process(chunk) + (br.finish() if last else br.flush())
+
+    else:
+        deflate = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+        def process(chunk: bytes, last: bool) -> bytes:
+            flush_mode = zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+            return deflate.compress(chunk) + deflate.flush(flush_mode)
+
+    return process
+
+
+class CompressionMiddleware:
+    """Compress compressible responses of at least `minimum_size` bytes.
+
+    The coding is the first of `encodings` the client accepts, at the level of
+    `levels`, unless `route_levels` sets one for the matched route's path
+    template, e.g. `{"/items/": {"br": 5}}`. Streamed responses are compressed
+    chunk by chunk whatever their size.
+
+    Responses that already carry a Content-Encoding, such as the pre-compressed
+    catalog snapshot, are passed through. Compressed bodies of responses with a
+    strong ETag are kept in `cache`, so that a representation requested again
+    is not compressed again; their ETag is sent weak since the compressed bytes
+    are only equivalent to, not identical with, the tagged ones.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: Iterable[str] = CONTENT_CODINGS,
+        minimum_size: int = 1024,
+        levels: Mapping[str, int] | None = None,
+        route_levels: Mapping[str, Mapping[str, int]] | None = None,
+        cache: TTLCache | None = None,
+    ) -> None:
+        self.app = app
+        self.encodings = tuple(encodings)
+        unknown = set(self.encodings) - set(CONTENT_CODINGS)
+        if unknown:
+            raise ValueError(f"Unknown content codings: {sorted(unknown)}")
+        self.minimum_size = minimum_size
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+        self.route_levels = route_levels or {}
+        self.cache = cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        coding = negotiate_content_coding(
+            Headers(scope=scope).get("accept-encoding"), self.encodings
+        )
+        responder = _CompressionResponder(self, scope, send, coding)
+        await self.app(scope, receive, responder.send)
+
+    def level(self, scope: Scope, coding: str) -> int:
+        route = scope.get("route")
+        overrides = self.route_levels.get(getattr(route, "path", None), {})
+        return overrides.get(coding, self.levels[coding])
+
+
+class _CompressionResponder:
+    """Per-response state: holds the start message until the body is known."""
+
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        scope: Scope,
+        send: Send,
+        coding: str | None,
+    ) -> None:
+        self.middleware = middleware
+        self.scope = scope
+        self.coding = coding
+        self._send = send
+        self._start: Message | None = None
+        self._compress: Callable[[bytes, bool], bytes] | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+        elif message["type"] == "http.response.start":
+            self._start = message
+            self._passthrough = not self._eligible(MutableHeaders(scope=message))
+            if self._passthrough:
+                await self._send(message)
+        elif self._compress is not None:
+            last = not message.get("more_body", False)
+            body = self._compress(message.get("body", b""), last)
+            await self._send({**message, "body": body})
+        else:
+            await self._first_body(message)
+
+    def _eligible(self, headers: MutableHeaders) -> bool:
+        """Whether the response may be compressed; marks it Vary if so."""
+        status = self._start["status"]
+        content_type = headers.get("content-type", "")
+        if (
+            status < 200
+            or status in (204, 304)
+            or "content-encoding" in headers
+            or "no-transform" in headers.get("cache-control", "")
+            or not content_type.startswith(COMPRESSIBLE_TYPES)
+        ):
+            return False
+        vary = headers.get("vary")
+        if vary is None:
+            headers["Vary"] = "Accept-Encoding"
+        elif "accept-encoding" not in vary.lower():
+            headers["Vary"] = f"{vary}, Accept-Encoding"
+        return self.coding is not None
+
+    async def _first_body(self, message: Message) -> None:
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        headers = MutableHeaders(scope=self._start)
+        if not more_body and len(body) < self.middleware.minimum_size:
+            self._passthrough = True
+            await self._send(self._start)
+            await self._send(message)
+            return
+
+        level = self.middleware.level(self.scope, self.coding)
+        headers["Content-Encoding"] = self.coding
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        if more_body:
+            del headers["content-length"]
+            self._compress = stream_compressor(self.coding, level)
+            await self._send(self._start)
+            await self.send(message)
+            return
+
+        compressed = self._compress_whole(body, etag, headers, level)
+        headers["Content-Length"] = str(len(compressed))
+        await self._send(self._start)
+        await self._send({**message, "body": compressed})
+
+    def _compress_whole(
+        self, body: bytes, etag: str | None, headers: MutableHeaders, level: int
+    ) -> bytes:
+        cache = self.middleware.cache
+        if (
+            cache is None
+            or etag is None
+            or etag.startswith("W/")
+            or "no-store" in headers.get("cache-control", "")
+        ):
+            return compress(body, self.coding, level)
+        # The ETag identifies the body within its route only.
+        key = (self.scope["path"], etag, self.coding, level)
+        compressed = cache.get(key)
+        if compressed is None:
+            compressed = compress(body, self.coding, level)
+            if len(compressed) <= CACHE_MAX_BODY_BYTES:
+                cache.set(key, compressed)
+        return compressed
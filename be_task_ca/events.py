@@ -0,0 +1,24 @@
+"""In-process notifications fired after rows are committed."""
+
+from typing import Callable, Iterable
+from uuid import UUID
+
+ChangeListener = Callable[[list[UUID]], None]
+
+
+class ChangeNotifier:
+    """Fan out the ids of committed writes to subscribed listeners."""
+
+    def __init__(self) -> None:
+        self._listeners: list[ChangeListener] = []
+
+    def subscribe(self, listener: ChangeListener) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: ChangeListener) -> None:
+        self._listeners.remove(listener)
+
+    def notify(self, ids: Iterable[UUID]) -> None:
+        changed_ids = list(ids)
+        for listener in list(self._listeners):
+            listener(changed_ids)
@@ -0,0 +1,30 @@
+"""Conflict-skipping bulk inserts shared by the item and user repositories."""
+
+from typing import Iterable
+
+from sqlalchemy import Column, Insert, Table
+from sqlalchemy.dialects import postgresql, sqlite
+
+_DIALECT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def insert_skipping_conflicts(
+    table: Table, dialect_name: str, index_elements: Iterable[Column]
+) -> Insert:
+    """`INSERT ... ON CONFLICT (index_elements) DO NOTHING` for the given dialect.
+
+    Executed with a list of parameter sets, SQLAlchemy batches the rows into
+    multi-row VALUES statements. Callers add the RETURNING clause they need.
+    """
+    try:
+        dialect_insert = _DIALECT_INSERTS[dialect_name]
+    except KeyError:
+        raise NotImplementedError(
+            f"Bulk insert into {table.name!r} is not supported on {dialect_name!r}"
+        ) from None
+    return dialect_insert(table).on_conflict_do_nothing(
+        index_elements=list(index_elements)
+    )
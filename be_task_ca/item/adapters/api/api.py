@@ -1,29 +1,128 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from be_task_ca.common import get_db
-from be_task_ca.item.adapters.api.schema import CreateItemRequest, CreateItemResponse
+from be_task_ca.item.adapters.api.schema import (
+    AllItemsRepsonse,
+    CreateItemRequest,
+    CreateItemResponse,
+    ImportItemsResponse,
+)
+from be_task_ca.item.application.dto import ItemSearchCriteria
 from be_task_ca.item.adapters.db.repository import SqlAlchemyItemRepository
 from be_task_ca.item.application.usecases.create_item import CreateItemUseCase
+from be_task_ca.item.application.usecases.import_items import ImportItemsUseCase
 from be_task_ca.item.application.usecases.list_items import ListItemsUseCase
-from be_task_ca.item.adapters.api.handlers import create_item, get_all
+from be_task_ca.item.application.usecases.search_items import SearchItemsUseCase
+from be_task_ca.item.adapters.api.handlers import (
+    IMPORT_REQUEST_BODY,
+    MAX_PAGE_SIZE,
+    MAX_SEARCH_TEXT_LENGTH,
+    create_item,
+    get_all,
+    import_items,
+    parse_import_body,
+    search,
+    stream_all,
+    wants_ndjson,
+)
+from be_task_ca.item.adapters.api.http_cache import (
+    cache_headers,
+    is_not_modified,
+    listing_validators,
+    not_modified_response,
+    snapshot_response,
+)
+from be_task_ca.item.adapters.cache.catalog_snapshot import catalog_snapshots
+from be_task_ca.item.adapters.cache.catalog_version import catalog_version
+from be_task_ca.transactions import SqlAlchemyUnitOfWork
 
 
 item_router = APIRouter(
     prefix="/items",
     tags=["item"],
+    default_response_class=ORJSONResponse,
 )
 
 
 @item_router.post("/")
-async def post_item(
+def post_item(
     item: CreateItemRequest, db: Session = Depends(get_db)
 ) -> CreateItemResponse:
-    use_case = CreateItemUseCase(SqlAlchemyItemRepository(db))
+    use_case = CreateItemUseCase(SqlAlchemyItemRepository(db), SqlAlchemyUnitOfWork(db))
     return create_item(item, use_case)
 
 
-@item_router.get("/")
-async def get_items(db: Session = Depends(get_db)):
+@item_router.post("/bulk", openapi_extra=IMPORT_REQUEST_BODY)
+async def post_items_bulk(
+    request: Request, db: Session = Depends(get_db)
+) -> ImportItemsResponse:
+    # Only the body is read on the event loop; parsing and the batched
+    # inserts of up to MAX_IMPORT_ITEMS rows run in the threadpool.
+    body = await request.body()
+    return await run_in_threadpool(
+        _import_items_body, body, request.headers.get("content-type"), db
+    )
+
+
+def _import_items_body(
+    body: bytes, content_type: str | None, db: Session
+) -> ImportItemsResponse:
+    commands = parse_import_body(body, content_type)
+    use_case = ImportItemsUseCase(
+        SqlAlchemyItemRepository(db), SqlAlchemyUnitOfWork(db)
+    )
+    return import_items(commands, use_case)
+
+
+@item_router.get("/search", response_model=AllItemsRepsonse)
+def search_items(
+    request: Request,
+    q: str | None = Query(default=None, max_length=MAX_SEARCH_TEXT_LENGTH),
+    min_price: float | None = Query(default=None, ge=0),
+    max_price: float | None = Query(default=None, ge=0),
+    in_stock: bool | None = None,
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    db: Session = Depends(get_db),
+):
+    validators = listing_validators(request, catalog_version.current(), ndjson=False)
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+
+    criteria = ItemSearchCriteria(q, min_price, max_price, in_stock)
+    use_case = SearchItemsUseCase(SqlAlchemyItemRepository(db))
+    response = search(criteria, use_case, limit, after)
+    response.headers.update(cache_headers(validators))
+    return response
+
+
+@item_router.get("/", response_model=AllItemsRepsonse)
+def get_items(
+    request: Request,
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    accept: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+):
+    # Read before querying: a write committed meanwhile then bumps the version
+    # past the one the response is tagged with, never the other way round.
+    validators = listing_validators(
+        request, catalog_version.current(), wants_ndjson(accept)
+    )
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+    if limit is None and after is None and not wants_ndjson(accept):
+        snapshot = catalog_snapshots.get()
+        if snapshot is not None:
+            return snapshot_response(request, snapshot)
+
     use_case = ListItemsUseCase(SqlAlchemyItemRepository(db))
-    return get_all(use_case)
+    if wants_ndjson(accept):
+        response = stream_all(use_case)
+    else:
+        response = get_all(use_case, limit, after)
+    response.headers.update(cache_headers(validators))
+    return response
@@ -0,0 +1,122 @@
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from be_task_ca.common import get_async_db
+from be_task_ca.item.adapters.api.schema import (
+    AllItemsRepsonse,
+    CreateItemRequest,
+    CreateItemResponse,
+    ImportItemsResponse,
+)
+from be_task_ca.item.application.dto import ItemSearchCriteria
+from be_task_ca.item.adapters.db.async_repository import AsyncSqlAlchemyItemRepository
+from be_task_ca.item.application.usecases.create_item import AsyncCreateItemUseCase
+from be_task_ca.item.application.usecases.import_items import AsyncImportItemsUseCase
+from be_task_ca.item.application.usecases.list_items import AsyncListItemsUseCase
+from be_task_ca.item.application.usecases.search_items import AsyncSearchItemsUseCase
+from be_task_ca.item.adapters.api.handlers import (
+    IMPORT_REQUEST_BODY,
+    MAX_PAGE_SIZE,
+    MAX_SEARCH_TEXT_LENGTH,
+    create_item_async,
+    get_all_async,
+    import_items_async,
+    parse_import_body,
+    search_async,
+    stream_all_async,
+    wants_ndjson,
+)
+from be_task_ca.item.adapters.api.http_cache import (
+    cache_headers,
+    is_not_modified,
+    listing_validators,
+    not_modified_response,
+    snapshot_response,
+)
+from be_task_ca.item.adapters.cache.catalog_snapshot import catalog_snapshots
+from be_task_ca.item.adapters.cache.catalog_version import catalog_version
+from be_task_ca.transactions import AsyncSqlAlchemyUnitOfWork
+
+
+async_item_router = APIRouter(
+    prefix="/items",
+    tags=["item"],
+    default_response_class=ORJSONResponse,
+)
+
+
+@async_item_router.post("/")
+async def post_item(
+    item: CreateItemRequest, db: AsyncSession = Depends(get_async_db)
+) -> CreateItemResponse:
+    use_case = AsyncCreateItemUseCase(
+        AsyncSqlAlchemyItemRepository(db), AsyncSqlAlchemyUnitOfWork(db)
+    )
+    return await create_item_async(item, use_case)
+
+
+@async_item_router.post("/bulk", openapi_extra=IMPORT_REQUEST_BODY)
+async def post_items_bulk(
+    request: Request, db: AsyncSession = Depends(get_async_db)
+) -> ImportItemsResponse:
+    commands = parse_import_body(
+        await request.body(), request.headers.get("content-type")
+    )
+    use_case = AsyncImportItemsUseCase(
+        AsyncSqlAlchemyItemRepository(db), AsyncSqlAlchemyUnitOfWork(db)
+    )
+    return await import_items_async(commands, use_case)
+
+
+@async_item_router.get("/search", response_model=AllItemsRepsonse)
+async def search_items(
+    request: Request,
+    q: str | None = Query(default=None, max_length=MAX_SEARCH_TEXT_LENGTH),
+    min_price: float | None = Query(default=None, ge=0),
+    max_price: float | None = Query(default=None, ge=0),
+    in_stock: bool | None = None,
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    validators = listing_validators(request, catalog_version.current(), ndjson=False)
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+
+    criteria = ItemSearchCriteria(q, min_price, max_price, in_stock)
+    use_case = AsyncSearchItemsUseCase(AsyncSqlAlchemyItemRepository(db))
+    response = await search_async(criteria, use_case, limit, after)
+    response.headers.update(cache_headers(validators))
+    return response
+
+
+@async_item_router.get("/", response_model=AllItemsRepsonse)
+async def get_items(
+    request: Request,
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    accept: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    # Read before querying: a write committed meanwhile then bumps the version
+    # past the one the response is tagged with, never the other way round.
+    validators = listing_validators(
+        request, catalog_version.current(), wants_ndjson(accept)
+    )
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+    if limit is None and after is None and not wants_ndjson(accept):
+        snapshot = catalog_snapshots.get()
+        if snapshot is not None:
+            # The first request for a coding compresses the snapshot body.
+            return await run_in_threadpool(snapshot_response, request, snapshot)
+
+    use_case = AsyncListItemsUseCase(AsyncSqlAlchemyItemRepository(db))
+    if wants_ndjson(accept):
+        response = stream_all_async(use_case)
+    else:
+        response = await get_all_async(use_case, limit, after)
+    response.headers.update(cache_headers(validators))
+    return response
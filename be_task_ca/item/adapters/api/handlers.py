@@ -1,35 +1,201 @@
+import base64
+import binascii
+import json
+from typing import AsyncIterator, Iterator
+from uuid import UUID
+
+import orjson
 from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
+from be_task_ca.batching import batches
+from be_task_ca.bulk_bodies import (
+    NDJSON_MEDIA_TYPE,
+    bulk_request_body,
+    parse_bulk_body,
+)
 from be_task_ca.item.adapters.api.schema import (
-    AllItemsRepsonse,
     CreateItemRequest,
     CreateItemResponse,
+    ImportItemRowResponse,
+    ImportItemsResponse,
+)
+from be_task_ca.item.adapters.serialization import item_to_json
+from be_task_ca.item.application.dto import (
+    CreateItemCommand,
+    CreateItemResult,
+    ImportItemsResult,
+    ItemCursor,
+    ItemSearchCriteria,
+    ItemView,
+    ListItemsResult,
 )
-from be_task_ca.item.application.dto import CreateItemCommand, CreateItemResult
 from be_task_ca.item.application.exceptions import ItemAlreadyExistsError
-from be_task_ca.item.application.usecases.create_item import CreateItemUseCase
-from be_task_ca.item.application.usecases.list_items import ListItemsUseCase
+from be_task_ca.item.application.usecases.create_item import (
+    AsyncCreateItemUseCase,
+    CreateItemUseCase,
+)
+from be_task_ca.item.application.usecases.import_items import (
+    AsyncImportItemsUseCase,
+    ImportItemsUseCase,
+)
+from be_task_ca.item.application.usecases.list_items import (
+    AsyncListItemsUseCase,
+    ListItemsUseCase,
+)
+from be_task_ca.item.application.usecases.search_items import (
+    AsyncSearchItemsUseCase,
+    SearchItemsUseCase,
+)
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+MAX_SEARCH_TEXT_LENGTH = 200
+NDJSON_LINES_PER_CHUNK = 100
+MAX_IMPORT_ITEMS = 250_000
+
+IMPORT_REQUEST_BODY = bulk_request_body("CreateItemRequest")
 
 
 def create_item(item: CreateItemRequest, use_case: CreateItemUseCase) -> CreateItemResponse:
-    command = CreateItemCommand(
-        name=item.name,
-        description=item.description,
-        price=item.price,
-        quantity=item.quantity,
-    )
+    try:
+        result = use_case.execute(request_to_command(item))
+    except ItemAlreadyExistsError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
 
+    return result_to_schema(result)
+
+
+async def create_item_async(
+    item: CreateItemRequest, use_case: AsyncCreateItemUseCase
+) -> CreateItemResponse:
     try:
-        result = use_case.execute(command)
+        result = await use_case.execute(request_to_command(item))
     except ItemAlreadyExistsError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
 
     return result_to_schema(result)
 
 
-def get_all(use_case: ListItemsUseCase):
-    item_list = use_case.execute()
-    return AllItemsRepsonse(items=list(map(result_to_schema, item_list.items)))
+def import_items(
+    commands: list[CreateItemCommand], use_case: ImportItemsUseCase
+) -> ImportItemsResponse:
+    return import_result_to_schema(use_case.execute(commands))
+
+
+async def import_items_async(
+    commands: list[CreateItemCommand], use_case: AsyncImportItemsUseCase
+) -> ImportItemsResponse:
+    return import_result_to_schema(await use_case.execute(commands))
+
+
+def get_all(
+    use_case: ListItemsUseCase, limit: int | None = None, after: str | None = None
+) -> ORJSONResponse:
+    if limit is None and after is None:
+        return list_result_to_response(use_case.execute())
+
+    page = use_case.execute_page(limit or DEFAULT_PAGE_SIZE, decode_cursor(after))
+    return list_result_to_response(page)
+
+
+async def get_all_async(
+    use_case: AsyncListItemsUseCase, limit: int | None = None, after: str | None = None
+) -> ORJSONResponse:
+    if limit is None and after is None:
+        return list_result_to_response(await use_case.execute())
+
+    page = await use_case.execute_page(limit or DEFAULT_PAGE_SIZE, decode_cursor(after))
+    return list_result_to_response(page)
+
+
+def search(
+    criteria: ItemSearchCriteria,
+    use_case: SearchItemsUseCase,
+    limit: int | None = None,
+    after: str | None = None,
+) -> ORJSONResponse:
+    page = use_case.execute(criteria, limit or DEFAULT_PAGE_SIZE, decode_cursor(after))
+    return list_result_to_response(page)
+
+
+async def search_async(
+    criteria: ItemSearchCriteria,
+    use_case: AsyncSearchItemsUseCase,
+    limit: int | None = None,
+    after: str | None = None,
+) -> ORJSONResponse:
+    page = await use_case.execute(
+        criteria, limit or DEFAULT_PAGE_SIZE, decode_cursor(after)
+    )
+    return list_result_to_response(page)
+
+
+def stream_all(use_case: ListItemsUseCase) -> StreamingResponse:
+    return StreamingResponse(
+        _ndjson_chunks(use_case.stream()), media_type=NDJSON_MEDIA_TYPE
+    )
+
+
+def stream_all_async(use_case: AsyncListItemsUseCase) -> StreamingResponse:
+    return StreamingResponse(
+        _ndjson_chunks_async(use_case.stream()), media_type=NDJSON_MEDIA_TYPE
+    )
+
+
+def wants_ndjson(accept: str | None) -> bool:
+    return accept is not None and NDJSON_MEDIA_TYPE in accept
+
+
+def encode_cursor(cursor: ItemCursor) -> str:
+    payload = json.dumps([cursor.name, str(cursor.id)]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(token: str | None) -> ItemCursor | None:
+    if token is None:
+        return None
+    try:
+        name, item_id = json.loads(base64.urlsafe_b64decode(token.encode()))
+        return ItemCursor(name=name, id=UUID(item_id))
+    except (binascii.Error, TypeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+def parse_import_body(body: bytes, content_type: str | None) -> list[CreateItemCommand]:
+    """Parse a bulk import body sent as a JSON array or as NDJSON."""
+    items = parse_bulk_body(
+        body,
+        content_type,
+        CreateItemRequest,
+        MAX_IMPORT_ITEMS,
+        f"At most {MAX_IMPORT_ITEMS} items per import",
+    )
+    return [request_to_command(item) for item in items]
+
+
+def request_to_command(item: CreateItemRequest) -> CreateItemCommand:
+    return CreateItemCommand(
+        name=item.name,
+        description=item.description,
+        price=item.price,
+        quantity=item.quantity,
+    )
+
+
+def list_result_to_response(item_list: ListItemsResult) -> ORJSONResponse:
+    """Encode an AllItemsRepsonse body straight from the item views.
+
+    The views come from typed columns, so building and validating one pydantic
+    model per item and running jsonable_encoder over them would only add copies.
+    Returning a response also skips FastAPI's response model validation.
+    """
+    next_cursor = None
+    if item_list.next_cursor is not None:
+        next_cursor = encode_cursor(item_list.next_cursor)
+    return ORJSONResponse(
+        {"items": list(map(item_to_json, item_list.items)), "next_cursor": next_cursor}
+    )
 
 
 def result_to_schema(item: CreateItemResult) -> CreateItemResponse:
@@ -40,3 +206,42 @@ def result_to_schema(item: CreateItemResult) -> CreateItemResponse:
         price=item.price,
         quantity=item.quantity,
     )
+
+
+def import_result_to_schema(result: ImportItemsResult) -> ImportItemsResponse:
+    return ImportItemsResponse(
+        created=result.created,
+        conflicts=result.conflicts,
+        items=[
+            ImportItemRowResponse(
+                name=row.name,
+                status=row.status.value,
+                id=row.item.id if row.item is not None else None,
+            )
+            for row in result.rows
+        ],
+    )
+
+
+def result_to_json_line(item: ItemView) -> bytes:
+    return orjson.dumps(item_to_json(item)) + b"\n"
+
+
+def _ndjson_chunks(items: Iterator[ItemView]) -> Iterator[bytes]:
+    # Each yielded chunk becomes one ASGI body message; batching lines keeps
+    # the per-message overhead independent of the catalog size.
+    for lines in batches(items, NDJSON_LINES_PER_CHUNK):
+        yield b"".join(map(result_to_json_line, lines))
+
+
+async def _ndjson_chunks_async(
+    items: AsyncIterator[ItemView],
+) -> AsyncIterator[bytes]:
+    lines = []
+    async for item in items:
+        lines.append(result_to_json_line(item))
+        if len(lines) == NDJSON_LINES_PER_CHUNK:
+            yield b"".join(lines)
+            lines = []
+    if lines:
+        yield b"".join(lines)
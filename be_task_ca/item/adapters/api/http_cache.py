@@ -0,0 +1,87 @@
+"""Conditional GET support for the item listing."""
+
+import hashlib
+import math
+from email.utils import formatdate, parsedate_to_datetime
+from typing import NamedTuple
+
+from fastapi import Request, Response
+
+from be_task_ca.compression import negotiate_content_coding
+from be_task_ca.item.adapters.cache.catalog_snapshot import CatalogSnapshot
+from be_task_ca.item.adapters.cache.catalog_version import CatalogState
+from be_task_ca.settings import settings
+
+
+class CacheValidators(NamedTuple):
+    etag: str
+    last_modified: int
+
+
+def listing_validators(
+    request: Request, state: CatalogState, ndjson: bool
+) -> CacheValidators:
+    """Return strong validators for one representation of the listing.
+
+    The query string selects the page and `ndjson` the format, so both are part
+    of the ETag together with the catalog version.
+    """
+    variant = hashlib.blake2b(
+        f"{request.url.query}|{ndjson}".encode(), digest_size=8
+    ).hexdigest()
+    return CacheValidators(f'"{state.tag}-{variant}"', math.floor(state.last_modified))
+
+
+def is_not_modified(request: Request, validators: CacheValidators) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since when it is absent."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etags = {etag.strip().removeprefix("W/") for etag in if_none_match.split(",")}
+        return "*" in etags or validators.etag in etags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return validators.last_modified <= since
+
+
+def cache_headers(validators: CacheValidators) -> dict[str, str]:
+    return {
+        "ETag": validators.etag,
+        "Last-Modified": formatdate(validators.last_modified, usegmt=True),
+        "Cache-Control": settings.catalog_cache_control,
+        "Vary": "Accept, Accept-Encoding",
+    }
+
+
+def not_modified_response(validators: CacheValidators) -> Response:
+    return Response(status_code=304, headers=cache_headers(validators))
+
+
+def preferred_content_coding(accept_encoding: str | None) -> str | None:
+    """Return "br" or "gzip", in that order of preference, if the client accepts it."""
+    return negotiate_content_coding(accept_encoding, ("br", "gzip"))
+
+
+def snapshot_response(request: Request, snapshot: CatalogSnapshot) -> Response:
+    """Serve the snapshot body in the best content coding the client accepts.
+
+    Each coding is a different representation, so it gets its own strong ETag.
+    """
+    coding = preferred_content_coding(request.headers.get("accept-encoding"))
+    validators = listing_validators(request, snapshot.state, ndjson=False)
+    if coding is not None:
+        validators = validators._replace(etag=f'{validators.etag[:-1]}-{coding}"')
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+
+    headers = cache_headers(validators)
+    if coding is not None:
+        headers["Content-Encoding"] = coding
+    return Response(
+        snapshot.body(coding), media_type="application/json", headers=headers
+    )
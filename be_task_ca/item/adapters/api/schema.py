@@ -17,3 +17,16 @@ class CreateItemResponse(CreateItemRequest):
 
 class AllItemsRepsonse(BaseModel):
     items: List[CreateItemResponse]
+    next_cursor: str | None = None
+
+
+class ImportItemRowResponse(BaseModel):
+    name: str
+    status: str
+    id: UUID | None = None
+
+
+class ImportItemsResponse(BaseModel):
+    created: int
+    conflicts: int
+    items: List[ImportItemRowResponse]
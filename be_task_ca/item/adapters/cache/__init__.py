@@ -0,0 +1 @@
+"""Item cache adapter package."""
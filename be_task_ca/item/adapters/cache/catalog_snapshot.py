@@ -0,0 +1,170 @@
+"""In-memory, pre-serialized `GET /items/` body with compressed variants."""
+
+import gzip
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterable
+from uuid import UUID
+
+import brotli
+import orjson
+
+from be_task_ca.item.adapters.cache.catalog_version import CatalogState
+from be_task_ca.item.adapters.serialization import item_to_json
+from be_task_ca.item.application.dto import ItemView
+from be_task_ca.item.adapters.db.events import item_changes
+from be_task_ca.settings import settings
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+_BODY_START = b'{"items":['
+_BODY_END = b'],"next_cursor":null}'
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """The full, unpaginated item listing, encoded once per content coding.
+
+    `state` is derived from the body itself, so its ETag identifies these
+    exact bytes whichever writes they do or do not include yet. A compressed
+    variant is only encoded when first requested: stock reservations replace
+    the snapshot every refresh, mostly before anyone asked for it compressed.
+    """
+
+    state: CatalogState
+    identity: bytes
+    items: int
+
+    @cached_property
+    def gzip(self) -> bytes:
+        return gzip.compress(self.identity, GZIP_LEVEL)
+
+    @cached_property
+    def br(self) -> bytes:
+        return brotli.compress(self.identity, quality=BROTLI_QUALITY)
+
+    def body(self, content_coding: str | None) -> bytes:
+        if content_coding == "br":
+            return self.br
+        if content_coding == "gzip":
+            return self.gzip
+        return self.identity
+
+
+class CatalogSnapshotStore:
+    """Latest catalog snapshot of this process, patched as items are written.
+
+    Item writes are collected from `item_changes`; the snapshot is rebuilt from
+    the rows of just those items while the encoding of every other item is
+    reused. It is served until it has been stale for `max_staleness` seconds,
+    after which `get` returns None and requests fall back to the database until
+    the next refresh.
+    """
+
+    def __init__(self, max_staleness: float, clock=time.monotonic) -> None:
+        self.max_staleness = max_staleness
+        self._clock = clock
+        self._snapshot: CatalogSnapshot | None = None
+        self._fragments: dict[UUID, tuple[tuple[str, UUID], bytes]] = {}
+        self._order: list[UUID] = []
+        # Written ids not yet taken, since when, and since when the published
+        # snapshot misses a write.
+        self._changed: set[UUID] = set()
+        self._changed_since: float | None = None
+        self._stale_since: float | None = None
+        self._tracking = False
+        self._lock = threading.Lock()
+
+    def get(self) -> CatalogSnapshot | None:
+        with self._lock:
+            stale_since = self._stale_since
+            snapshot = self._snapshot
+        if stale_since is not None and self._clock() - stale_since > self.max_staleness:
+            return None
+        return snapshot
+
+    def mark_changed(self, item_ids: Iterable[UUID]) -> None:
+        item_ids = set(item_ids)
+        with self._lock:
+            if not self._tracking or not item_ids:
+                return
+            if not self._changed:
+                self._changed_since = self._clock()
+            self._changed.update(item_ids)
+            if self._stale_since is None:
+                self._stale_since = self._changed_since
+
+    def take_changes(self) -> set[UUID]:
+        """Return the ids written since the last call, for `apply_changes`.
+
+        Writes are only tracked from the first call on, so that a process
+        without a refresher does not collect ids forever.
+        """
+        with self._lock:
+            self._tracking = True
+            changed, self._changed = self._changed, set()
+            return changed
+
+    def rebuild(self, items: Iterable[ItemView]) -> CatalogSnapshot:
+        """Encode every item again, e.g. at startup or to pick up foreign writes."""
+        fragments = {item.id: self._fragment(item) for item in items}
+        self._fragments = fragments
+        self._order = sorted(fragments, key=lambda item_id: fragments[item_id][0])
+        return self._publish()
+
+    def apply_changes(
+        self, changed_ids: set[UUID], items: Iterable[ItemView]
+    ) -> CatalogSnapshot:
+        """Re-encode the `items` loaded for `changed_ids`; missing ids are dropped."""
+        missing_ids = set(changed_ids)
+        reorder = False
+        for item in items:
+            previous = self._fragments.get(item.id)
+            fragment = self._fragment(item)
+            reorder = reorder or previous is None or previous[0] != fragment[0]
+            self._fragments[item.id] = fragment
+            missing_ids.discard(item.id)
+        for item_id in missing_ids:
+            reorder = self._fragments.pop(item_id, None) is not None or reorder
+        if reorder:
+            self._order = sorted(
+                self._fragments, key=lambda item_id: self._fragments[item_id][0]
+            )
+        return self._publish()
+
+    @staticmethod
+    def _fragment(item: ItemView) -> tuple[tuple[str, UUID], bytes]:
+        return (item.name, item.id), orjson.dumps(item_to_json(item))
+
+    def _publish(self) -> CatalogSnapshot:
+        identity = b"".join(
+            (
+                _BODY_START,
+                b",".join(self._fragments[item_id][1] for item_id in self._order),
+                _BODY_END,
+            )
+        )
+        digest = hashlib.blake2b(identity, digest_size=12).hexdigest()
+        previous = self._snapshot
+        if previous is not None and previous.state.tag == digest:
+            snapshot = previous
+        else:
+            snapshot = CatalogSnapshot(
+                state=CatalogState(digest, time.time()),
+                identity=identity,
+                items=len(self._order),
+            )
+        with self._lock:
+            self._snapshot = snapshot
+            self._stale_since = self._changed_since if self._changed else None
+        return snapshot
+
+
+catalog_snapshots = CatalogSnapshotStore(
+    settings.catalog_snapshot_max_staleness_seconds
+)
+item_changes.subscribe(catalog_snapshots.mark_changed)
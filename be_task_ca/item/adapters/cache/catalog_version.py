@@ -0,0 +1,52 @@
+"""Version of the item catalog, used to validate cached listings."""
+
+import math
+import secrets
+import threading
+import time
+from typing import NamedTuple
+
+from be_task_ca.item.adapters.db.events import item_changes
+from be_task_ca.settings import settings
+
+
+class CatalogState(NamedTuple):
+    tag: str
+    last_modified: float
+
+
+class CatalogVersion:
+    """Counter bumped after every item write committed by this process.
+
+    Writes committed by other workers are not notified here, so with `ttl` set
+    the version also rolls over every `ttl` seconds, which bounds how long a
+    listing cached against it can miss them. The tag carries a random
+    per-process prefix, so a restarted or different worker never reuses a tag.
+    """
+
+    def __init__(self, ttl: float | None, clock=time.time) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._instance = secrets.token_hex(4)
+        self._counter = 0
+        self._changed_at = clock()
+        self._lock = threading.Lock()
+
+    def bump(self) -> None:
+        with self._lock:
+            self._counter += 1
+            self._changed_at = self._clock()
+
+    def current(self) -> CatalogState:
+        with self._lock:
+            counter, changed_at = self._counter, self._changed_at
+        if self.ttl is None:
+            return CatalogState(f"{self._instance}.{counter}", changed_at)
+        period = math.floor(self._clock() / self.ttl)
+        return CatalogState(
+            f"{self._instance}.{counter}.{period}", max(changed_at, period * self.ttl)
+        )
+
+
+catalog_version = CatalogVersion(settings.catalog_version_ttl_seconds)
+item_changes.subscribe(lambda item_ids: catalog_version.bump())
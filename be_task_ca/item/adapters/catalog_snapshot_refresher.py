@@ -0,0 +1,130 @@
+"""Background task keeping the in-memory catalog snapshot up to date."""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+from uuid import UUID
+
+from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
+
+from be_task_ca.database import AsyncSessionLocal, SessionLocal
+from be_task_ca.item.adapters.cache.catalog_snapshot import (
+    CatalogSnapshotStore,
+    catalog_snapshots,
+)
+from be_task_ca.item.adapters.db.async_repository import AsyncSqlAlchemyItemRepository
+from be_task_ca.item.adapters.db.repository import SqlAlchemyItemRepository
+from be_task_ca.item.application.dto import ItemView
+from be_task_ca.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+LOAD_BATCH_SIZE = 1000
+
+# Loads the given items, or every item when passed None.
+CatalogLoader = Callable[[set[UUID] | None], Awaitable[list[ItemView]]]
+
+
+def load_catalog(item_ids: set[UUID] | None) -> list[ItemView]:
+    with SessionLocal() as db:
+        repository = SqlAlchemyItemRepository(db)
+        if item_ids is None:
+            return list(repository.iter_all_items(LOAD_BATCH_SIZE))
+        return repository.get_items_by_ids(list(item_ids))
+
+
+async def load_catalog_async(item_ids: set[UUID] | None) -> list[ItemView]:
+    """Async variant of load_catalog."""
+    async with AsyncSessionLocal() as db:
+        repository = AsyncSqlAlchemyItemRepository(db)
+        if item_ids is None:
+            return [item async for item in repository.iter_all_items(LOAD_BATCH_SIZE)]
+        return await repository.get_items_by_ids(list(item_ids))
+
+
+class CatalogSnapshotRefresher:
+    """Patch the snapshot with the items written meanwhile every `interval`
+    seconds, and rebuild it from every item every `rebuild_interval` seconds.
+
+    Encoding and compressing run in the threadpool, off the event loop.
+    """
+
+    def __init__(
+        self,
+        store: CatalogSnapshotStore,
+        load: CatalogLoader,
+        interval: float,
+        rebuild_interval: float,
+        clock=time.monotonic,
+    ) -> None:
+        self._store = store
+        self._load = load
+        self._interval = interval
+        self._rebuild_interval = rebuild_interval
+        self._clock = clock
+        self._rebuilt_at: float | None = None
+        self._task: asyncio.Task | None = None
+
+    async def refresh(self) -> None:
+        now = self._clock()
+        if self._rebuilt_at is None or now - self._rebuilt_at >= self._rebuild_interval:
+            self._store.take_changes()
+            items = await self._load(None)
+            snapshot = await run_in_threadpool(self._store.rebuild, items)
+            self._rebuilt_at = now
+            logger.info("Rebuilt the catalog snapshot of %d items", snapshot.items)
+            return
+
+        changed = self._store.take_changes()
+        if not changed:
+            return
+        try:
+            items = await self._load(changed)
+        except Exception:
+            self._store.mark_changed(changed)
+            raise
+        await run_in_threadpool(self._store.apply_changes, changed, items)
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Catalog snapshot refresh failed")
+            await asyncio.sleep(self._interval)
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+def install_catalog_snapshot_refresher(
+    application: FastAPI, settings: Settings, use_async: bool
+) -> None:
+    """Start the refresher with the application and stop it on shutdown."""
+    if use_async:
+        load = load_catalog_async
+    else:
+
+        async def load(item_ids: set[UUID] | None) -> list[ItemView]:
+            return await run_in_threadpool(load_catalog, item_ids)
+
+    refresher = CatalogSnapshotRefresher(
+        catalog_snapshots,
+        load,
+        settings.catalog_snapshot_refresh_seconds,
+        settings.catalog_snapshot_rebuild_seconds,
+    )
+    application.add_event_handler("startup", refresher.start)
+    application.add_event_handler("shutdown", refresher.stop)
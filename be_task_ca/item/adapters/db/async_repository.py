@@ -0,0 +1,110 @@
+"""Async SQLAlchemy-backed item repository adapter."""
+
+from typing import AsyncIterator
+from uuid import UUID
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from be_task_ca.events import ChangeNotifier
+from be_task_ca.item.application.dto import ItemCursor, ItemSearchCriteria, ItemView
+from be_task_ca.item.application.interfaces.item_repository_interface import (
+    AsyncItemRepositoryInterface,
+)
+from be_task_ca.item.domain.entities import ItemEntity
+from be_task_ca.item.adapters.db.model import Item
+from be_task_ca.observability.instrument import counted_repository
+from be_task_ca.transactions import notify_after_commit
+
+from .bulk import entity_to_row, insert_items_skipping_conflicts, row_to_entity
+from .events import item_detail_changes
+from .mappers import ITEM_VIEW_COLUMNS, to_entity, to_model
+from .search import search_items_query
+
+
+@counted_repository
+class AsyncSqlAlchemyItemRepository(AsyncItemRepositoryInterface):
+    """AsyncSession implementation of async item repository interface."""
+
+    def __init__(
+        self, db: AsyncSession, notifier: ChangeNotifier = item_detail_changes
+    ) -> None:
+        self._db = db
+        self._notifier = notifier
+
+    async def save_item(self, item: ItemEntity) -> ItemEntity:
+        model = to_model(item)
+        self._db.add(model)
+        await self._db.flush()
+        notify_after_commit(self._db, self._notifier, [model.id])
+        return to_entity(model)
+
+    async def save_item_if_absent(self, item: ItemEntity) -> ItemEntity | None:
+        statement = insert_items_skipping_conflicts(self._db.get_bind().dialect.name)
+        row = (await self._db.execute(statement, entity_to_row(item))).first()
+        if row is None:
+            return None
+        notify_after_commit(self._db, self._notifier, [row.id])
+        return row_to_entity(row)
+
+    async def save_items(self, items: list[ItemEntity]) -> list[ItemEntity]:
+        if not items:
+            return []
+        statement = insert_items_skipping_conflicts(self._db.get_bind().dialect.name)
+        rows = await self._db.execute(
+            statement, [entity_to_row(item) for item in items]
+        )
+        saved_items = [row_to_entity(row) for row in rows]
+        notify_after_commit(
+            self._db, self._notifier, [item.id for item in saved_items]
+        )
+        return saved_items
+
+    async def get_all_items(self) -> list[ItemView]:
+        rows = await self._db.execute(
+            select(*ITEM_VIEW_COLUMNS).order_by(Item.name, Item.id)
+        )
+        return list(map(ItemView._make, rows))
+
+    async def get_items_page(
+        self, limit: int, after: ItemCursor | None = None
+    ) -> list[ItemView]:
+        query = select(*ITEM_VIEW_COLUMNS).order_by(Item.name, Item.id).limit(limit)
+        if after is not None:
+            query = query.where(tuple_(Item.name, Item.id) > (after.name, after.id))
+        return list(map(ItemView._make, await self._db.execute(query)))
+
+    async def iter_all_items(self, batch_size: int) -> AsyncIterator[ItemView]:
+        query = (
+            select(*ITEM_VIEW_COLUMNS)
+            .order_by(Item.name, Item.id)
+            .execution_options(yield_per=batch_size)
+        )
+        rows = await self._db.stream(query)
+        async for row in rows:
+            yield ItemView._make(row)
+
+    async def get_items_by_ids(self, item_ids: list[UUID]) -> list[ItemView]:
+        query = select(*ITEM_VIEW_COLUMNS).where(Item.id.in_(item_ids))
+        return list(map(ItemView._make, await self._db.execute(query)))
+
+    async def search_items(
+        self, criteria: ItemSearchCriteria, limit: int, after: ItemCursor | None = None
+    ) -> list[ItemView]:
+        dialect_name = self._db.get_bind().dialect.name
+        query = search_items_query(dialect_name, criteria, limit, after)
+        return list(map(ItemView._make, await self._db.execute(query)))
+
+    async def find_item_by_name(self, name: str) -> ItemEntity | None:
+        model = await self._db.scalar(select(Item).where(Item.name == name))
+        if model is None:
+            return None
+
+        return to_entity(model)
+
+    async def find_item_by_id(self, item_id: UUID) -> ItemEntity | None:
+        model = await self._db.scalar(select(Item).where(Item.id == item_id))
+        if model is None:
+            return None
+
+        return to_entity(model)
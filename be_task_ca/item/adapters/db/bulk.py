@@ -0,0 +1,42 @@
+"""Conflict-skipping item insert shared by the sync and async item repositories."""
+
+from uuid import uuid4
+
+from sqlalchemy import Insert
+
+from be_task_ca.inserts import insert_skipping_conflicts
+from be_task_ca.item.adapters.db.model import Item
+from be_task_ca.item.domain.entities import ItemEntity
+
+_items = Item.__table__
+
+
+def insert_items_skipping_conflicts(dialect_name: str) -> Insert:
+    """`INSERT ... ON CONFLICT (name) DO NOTHING RETURNING` for the given dialect.
+
+    Executed with a list of parameter sets, SQLAlchemy batches the rows into
+    multi-row VALUES statements; only inserted rows come back.
+    """
+    return insert_skipping_conflicts(
+        _items, dialect_name, [_items.c.name]
+    ).returning(*_items.c)
+
+
+def entity_to_row(entity: ItemEntity) -> dict:
+    return {
+        "id": entity.id or uuid4(),
+        "name": entity.name,
+        "description": entity.description,
+        "price": entity.price,
+        "quantity": entity.quantity,
+    }
+
+
+def row_to_entity(row) -> ItemEntity:
+    return ItemEntity(
+        id=row.id,
+        name=row.name,
+        description=row.description,
+        price=row.price,
+        quantity=row.quantity,
+    )
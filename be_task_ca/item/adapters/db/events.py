@@ -0,0 +1,10 @@
+"""In-process notifications fired after item rows are written."""
+
+from be_task_ca.events import ChangeNotifier
+
+# Listeners receive the ids of the committed items, whichever columns changed.
+item_changes = ChangeNotifier()
+# Listeners receive the ids of items whose name, description or price were
+# written; stock-only writes such as reservations only fire item_changes.
+item_detail_changes = ChangeNotifier()
+item_detail_changes.subscribe(item_changes.notify)
@@ -3,6 +3,10 @@
 from be_task_ca.item.domain.entities import ItemEntity
 from be_task_ca.item.adapters.db.model import Item
 
+# Selected by listing queries, in ItemView field order, so that rows map to
+# views without loading ORM objects.
+ITEM_VIEW_COLUMNS = (Item.id, Item.name, Item.description, Item.price, Item.quantity)
+
 
 def to_entity(model: Item) -> ItemEntity:
     """Map SQLAlchemy model to domain entity."""
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID, uuid4
 
+from sqlalchemy import DDL, DateTime, ForeignKey, Index, event, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from be_task_ca.database import Base
@@ -12,10 +14,49 @@ class Item(Base):
 
     id: Mapped[UUID] = mapped_column(
         primary_key=True,
-        default=uuid4(),
+        default=uuid4,
         index=True,
     )
     name: Mapped[str] = mapped_column(unique=True, index=True)
     description: Mapped[str]
     price: Mapped[float]
     quantity: Mapped[int]
+
+
+# Full-text document of an item. Search queries must use this exact expression,
+# with the text search configuration as a literal, for Postgres to pick the
+# index over it.
+ITEM_SEARCH_DOCUMENT = func.to_tsvector(
+    text("'simple'::regconfig"),
+    Item.__table__.c.name.op("||")(text("' '")).op("||")(Item.__table__.c.description),
+)
+
+Index(
+    "ix_items_search_document", ITEM_SEARCH_DOCUMENT, postgresql_using="gin"
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_items_name_trgm",
+    Item.__table__.c.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+Index("ix_items_price_quantity", Item.__table__.c.price, Item.__table__.c.quantity)
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+@dataclass
+class StockReservation(Base):
+    """Units taken off `items.quantity` for a holder until `expires_at`."""
+
+    __tablename__ = "stock_reservations"
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    item_id: Mapped[UUID] = mapped_column(ForeignKey("items.id"), index=True)
+    holder_id: Mapped[UUID]
+    quantity: Mapped[int]
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
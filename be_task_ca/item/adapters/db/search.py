@@ -0,0 +1,76 @@
+"""Item search query shared by the sync and async item repositories."""
+
+import re
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    func,
+    or_,
+    select,
+    text,
+    tuple_,
+)
+
+from be_task_ca.item.adapters.db.model import ITEM_SEARCH_DOCUMENT, Item
+from be_task_ca.item.application.dto import ItemCursor, ItemSearchCriteria
+
+from .mappers import ITEM_VIEW_COLUMNS
+
+_WORD = re.compile(r"\w+")
+
+
+def search_items_query(
+    dialect_name: str,
+    criteria: ItemSearchCriteria,
+    limit: int,
+    after: ItemCursor | None = None,
+) -> Select:
+    """Select the items matching `criteria`, a keyset page in (name, id) order.
+
+    On Postgres the text is matched with the full-text and trigram indexes on
+    `items`; elsewhere, e.g. on SQLite in tests, with equivalent LIKE patterns
+    over a table scan.
+    """
+    query = select(*ITEM_VIEW_COLUMNS).order_by(Item.name, Item.id).limit(limit)
+    if after is not None:
+        query = query.where(tuple_(Item.name, Item.id) > (after.name, after.id))
+    if criteria.min_price is not None:
+        query = query.where(Item.price >= criteria.min_price)
+    if criteria.max_price is not None:
+        query = query.where(Item.price <= criteria.max_price)
+    if criteria.in_stock is not None:
+        query = query.where(
+            Item.quantity > 0 if criteria.in_stock else Item.quantity <= 0
+        )
+
+    phrase = (criteria.text or "").strip()
+    if not phrase:
+        return query
+    matches = Item.name.ilike(f"%{_escape_like(phrase)}%", escape="\\")
+    words = _WORD.findall(phrase.lower())
+    if words:
+        match_words = _WORD_MATCHERS.get(dialect_name, _match_words_like)
+        matches = or_(match_words(words), matches)
+    return query.where(matches)
+
+
+def _match_words_postgresql(words: list[str]) -> ColumnElement[bool]:
+    prefixes = " & ".join(f"{word}:*" for word in words)
+    tsquery = func.to_tsquery(text("'simple'::regconfig"), prefixes)
+    return ITEM_SEARCH_DOCUMENT.bool_op("@@")(tsquery)
+
+
+def _match_words_like(words: list[str]) -> ColumnElement[bool]:
+    document = " " + Item.name + " " + Item.description
+    return and_(
+        *(document.ilike(f"% {_escape_like(word)}%", escape="\\") for word in words)
+    )
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+_WORD_MATCHERS = {"postgresql": _match_words_postgresql}
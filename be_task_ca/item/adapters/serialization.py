@@ -0,0 +1,14 @@
+"""JSON form of items shared by the API handlers and the catalog snapshot."""
+
+from be_task_ca.item.application.dto import ItemView
+
+
+def item_to_json(item: ItemView) -> dict:
+    """Return the CreateItemResponse object of an item, for orjson to encode."""
+    return {
+        "name": item.name,
+        "description": item.description,
+        "price": item.price,
+        "quantity": item.quantity,
+        "id": item.id,
+    }
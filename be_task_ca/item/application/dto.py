@@ -1,6 +1,8 @@
 """Application DTOs for item use cases."""
 
 from dataclasses import dataclass
+from enum import Enum
+from typing import NamedTuple
 from uuid import UUID
 
 
@@ -21,6 +23,60 @@ class CreateItemResult:
     quantity: int
 
 
+class ItemView(NamedTuple):
+    """Read-only item built straight from a result row by listing queries."""
+
+    id: UUID
+    name: str
+    description: str | None
+    price: float
+    quantity: int
+
+
+@dataclass(frozen=True)
+class ItemCursor:
+    """Keyset position: the (name, id) of the last item on a page."""
+
+    name: str
+    id: UUID
+
+
+@dataclass(frozen=True)
+class ItemSearchCriteria:
+    """Filters of an item search; a None filter is left out.
+
+    `text` matches items having a word in their name or description that
+    starts with each of its words, or whose name contains it.
+    """
+
+    text: str | None = None
+    min_price: float | None = None
+    max_price: float | None = None
+    in_stock: bool | None = None
+
+
 @dataclass(frozen=True)
 class ListItemsResult:
-    items: list[CreateItemResult]
+    items: list[ItemView]
+    next_cursor: ItemCursor | None = None
+
+
+class ItemImportStatus(Enum):
+    CREATED = "created"
+    CONFLICT = "conflict"
+
+
+@dataclass(frozen=True)
+class ItemImportRow:
+    """Outcome for one imported item; `item` is set only when it was created."""
+
+    name: str
+    status: ItemImportStatus
+    item: CreateItemResult | None = None
+
+
+@dataclass(frozen=True)
+class ImportItemsResult:
+    rows: list[ItemImportRow]
+    created: int
+    conflicts: int
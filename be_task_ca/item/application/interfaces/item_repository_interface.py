@@ -1,17 +1,48 @@
 """Repository interfaces for item application layer."""
 
-from typing import Protocol
+from typing import AsyncIterator, Iterator, Protocol
 from uuid import UUID
 
+from be_task_ca.item.application.dto import ItemCursor, ItemSearchCriteria, ItemView
 from be_task_ca.item.domain.entities import ItemEntity
 
 
 class ItemRepositoryInterface(Protocol):
     def save_item(self, item: ItemEntity) -> ItemEntity:
-        """Persist an item model and return it."""
+        """Add an item to the current unit of work and return it."""
 
-    def get_all_items(self) -> list[ItemEntity]:
-        """Return all item models."""
+    def save_item_if_absent(self, item: ItemEntity) -> ItemEntity | None:
+        """Insert an item unless its name is taken and return it, or None if taken.
+
+        Relies on the unique index on the name, so concurrent creations of the
+        same name insert at most one item.
+        """
+
+    def save_items(self, items: list[ItemEntity]) -> list[ItemEntity]:
+        """Insert items in one batch, skipping names that already exist.
+
+        Return the inserted items; a name that occurs more than once is
+        inserted only for its first occurrence.
+        """
+
+    def get_all_items(self) -> list[ItemView]:
+        """Return all items."""
+
+    def get_items_page(
+        self, limit: int, after: ItemCursor | None = None
+    ) -> list[ItemView]:
+        """Return up to `limit` items ordered by (name, id), strictly after `after`."""
+
+    def iter_all_items(self, batch_size: int) -> Iterator[ItemView]:
+        """Yield all items ordered by (name, id), `batch_size` rows per fetch."""
+
+    def get_items_by_ids(self, item_ids: list[UUID]) -> list[ItemView]:
+        """Return the existing items among `item_ids`, in no particular order."""
+
+    def search_items(
+        self, criteria: ItemSearchCriteria, limit: int, after: ItemCursor | None = None
+    ) -> list[ItemView]:
+        """Return up to `limit` matching items ordered by (name, id), after `after`."""
 
     def find_item_by_name(self, name: str) -> ItemEntity | None:
         """Return item model by name, or None if missing."""
@@ -20,3 +51,45 @@ class ItemRepositoryInterface(Protocol):
         """Return item model by id, or None if missing."""
 
 
+class AsyncItemRepositoryInterface(Protocol):
+    async def save_item(self, item: ItemEntity) -> ItemEntity:
+        """Add an item to the current unit of work and return it."""
+
+    async def save_item_if_absent(self, item: ItemEntity) -> ItemEntity | None:
+        """Insert an item unless its name is taken and return it, or None if taken.
+
+        Relies on the unique index on the name, so concurrent creations of the
+        same name insert at most one item.
+        """
+
+    async def save_items(self, items: list[ItemEntity]) -> list[ItemEntity]:
+        """Insert items in one batch, skipping names that already exist.
+
+        Return the inserted items; a name that occurs more than once is
+        inserted only for its first occurrence.
+        """
+
+    async def get_all_items(self) -> list[ItemView]:
+        """Return all items."""
+
+    async def get_items_page(
+        self, limit: int, after: ItemCursor | None = None
+    ) -> list[ItemView]:
+        """Return up to `limit` items ordered by (name, id), strictly after `after`."""
+
+    def iter_all_items(self, batch_size: int) -> AsyncIterator[ItemView]:
+        """Yield all items ordered by (name, id), `batch_size` rows per fetch."""
+
+    async def get_items_by_ids(self, item_ids: list[UUID]) -> list[ItemView]:
+        """Return the existing items among `item_ids`, in no particular order."""
+
+    async def search_items(
+        self, criteria: ItemSearchCriteria, limit: int, after: ItemCursor | None = None
+    ) -> list[ItemView]:
+        """Return up to `limit` matching items ordered by (name, id), after `after`."""
+
+    async def find_item_by_name(self, name: str) -> ItemEntity | None:
+        """Return item model by name, or None if missing."""
+
+    async def find_item_by_id(self, item_id: UUID) -> ItemEntity | None:
+        """Return item model by id, or None if missing."""
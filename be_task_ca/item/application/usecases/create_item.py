@@ -3,35 +3,81 @@
 from be_task_ca.item.application.dto import CreateItemCommand, CreateItemResult
 from be_task_ca.item.application.exceptions import ItemAlreadyExistsError
 from be_task_ca.item.application.interfaces.item_repository_interface import (
+    AsyncItemRepositoryInterface,
     ItemRepositoryInterface,
 )
 from be_task_ca.item.domain.entities import ItemEntity
+from be_task_ca.observability.instrument import timed_use_case
+from be_task_ca.unit_of_work import AsyncUnitOfWorkInterface, UnitOfWorkInterface
 
 
+@timed_use_case
 class CreateItemUseCase:
-    """Create an item if no item with the same name exists."""
+    """Create an item if no item with the same name exists.
 
-    def __init__(self, item_repository: ItemRepositoryInterface) -> None:
+    The name is not looked up first: the insert itself skips a taken name, so
+    concurrent requests for one name create a single item.
+    """
+
+    def __init__(
+        self,
+        item_repository: ItemRepositoryInterface,
+        unit_of_work: UnitOfWorkInterface,
+    ) -> None:
         self._item_repository = item_repository
+        self._unit_of_work = unit_of_work
 
     def execute(self, command: CreateItemCommand) -> CreateItemResult:
-        existing_item = self._item_repository.find_item_by_name(command.name)
-        if existing_item is not None:
-            raise ItemAlreadyExistsError("An item with this name already exists")
-
-        new_item = ItemEntity(
-            id=None,
-            name=command.name,
-            description=command.description,
-            price=command.price,
-            quantity=command.quantity,
-        )
-        saved_item = self._item_repository.save_item(new_item)
-
-        return CreateItemResult(
-            id=saved_item.id,
-            name=saved_item.name,
-            description=saved_item.description,
-            price=saved_item.price,
-            quantity=saved_item.quantity,
-        )
+        with self._unit_of_work:
+            saved_item = self._item_repository.save_item_if_absent(
+                _command_to_entity(command)
+            )
+            if saved_item is None:
+                raise ItemAlreadyExistsError("An item with this name already exists")
+            self._unit_of_work.commit()
+
+        return _entity_to_result(saved_item)
+
+
+@timed_use_case
+class AsyncCreateItemUseCase:
+    """Async variant of CreateItemUseCase for the async persistence stack."""
+
+    def __init__(
+        self,
+        item_repository: AsyncItemRepositoryInterface,
+        unit_of_work: AsyncUnitOfWorkInterface,
+    ) -> None:
+        self._item_repository = item_repository
+        self._unit_of_work = unit_of_work
+
+    async def execute(self, command: CreateItemCommand) -> CreateItemResult:
+        async with self._unit_of_work:
+            saved_item = await self._item_repository.save_item_if_absent(
+                _command_to_entity(command)
+            )
+            if saved_item is None:
+                raise ItemAlreadyExistsError("An item with this name already exists")
+            await self._unit_of_work.commit()
+
+        return _entity_to_result(saved_item)
+
+
+def _command_to_entity(command: CreateItemCommand) -> ItemEntity:
+    return ItemEntity(
+        id=None,
+        name=command.name,
+        description=command.description,
+        price=command.price,
+        quantity=command.quantity,
+    )
+
+
+def _entity_to_result(item: ItemEntity) -> CreateItemResult:
+    return CreateItemResult(
+        id=item.id,
+        name=item.name,
+        description=item.description,
+        price=item.price,
+        quantity=item.quantity,
+    )
@@ -0,0 +1,121 @@
+"""Bulk item import use case implementation."""
+
+from typing import Iterable, Iterator
+
+from be_task_ca.batching import batches
+from be_task_ca.item.application.dto import (
+    CreateItemCommand,
+    CreateItemResult,
+    ImportItemsResult,
+    ItemImportRow,
+    ItemImportStatus,
+)
+from be_task_ca.item.application.interfaces.item_repository_interface import (
+    AsyncItemRepositoryInterface,
+    ItemRepositoryInterface,
+)
+from be_task_ca.item.domain.entities import ItemEntity
+from be_task_ca.observability.instrument import timed_use_case
+from be_task_ca.unit_of_work import AsyncUnitOfWorkInterface, UnitOfWorkInterface
+
+IMPORT_BATCH_SIZE = 1000
+
+
+@timed_use_case
+class ImportItemsUseCase:
+    """Create many items, reporting per row whether it was created or its name
+    was already taken.
+
+    Items are written in batches of `batch_size`, each committed on its own, so
+    a large import neither holds one long transaction nor all rows in one
+    statement.
+    """
+
+    def __init__(
+        self,
+        item_repository: ItemRepositoryInterface,
+        unit_of_work: UnitOfWorkInterface,
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ) -> None:
+        self._item_repository = item_repository
+        self._unit_of_work = unit_of_work
+        self._batch_size = batch_size
+
+    def execute(self, commands: Iterable[CreateItemCommand]) -> ImportItemsResult:
+        rows = []
+        with self._unit_of_work:
+            for batch in batches(commands, self._batch_size):
+                saved_items = self._item_repository.save_items(
+                    [_command_to_entity(command) for command in batch]
+                )
+                self._unit_of_work.commit()
+                rows.extend(_batch_to_rows(batch, saved_items))
+        return _rows_to_result(rows)
+
+
+@timed_use_case
+class AsyncImportItemsUseCase:
+    """Async variant of ImportItemsUseCase for the async persistence stack."""
+
+    def __init__(
+        self,
+        item_repository: AsyncItemRepositoryInterface,
+        unit_of_work: AsyncUnitOfWorkInterface,
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ) -> None:
+        self._item_repository = item_repository
+        self._unit_of_work = unit_of_work
+        self._batch_size = batch_size
+
+    async def execute(self, commands: Iterable[CreateItemCommand]) -> ImportItemsResult:
+        rows = []
+        async with self._unit_of_work:
+            for batch in batches(commands, self._batch_size):
+                saved_items = await self._item_repository.save_items(
+                    [_command_to_entity(command) for command in batch]
+                )
+                await self._unit_of_work.commit()
+                rows.extend(_batch_to_rows(batch, saved_items))
+        return _rows_to_result(rows)
+
+
+def _batch_to_rows(
+    batch: list[CreateItemCommand], saved_items: list[ItemEntity]
+) -> Iterator[ItemImportRow]:
+    saved_by_name = {item.name: item for item in saved_items}
+    for command in batch:
+        # pop: only the first occurrence of a name repeated in the batch was inserted.
+        saved_item = saved_by_name.pop(command.name, None)
+        if saved_item is None:
+            yield ItemImportRow(name=command.name, status=ItemImportStatus.CONFLICT)
+        else:
+            yield ItemImportRow(
+                name=command.name,
+                status=ItemImportStatus.CREATED,
+                item=_entity_to_result(saved_item),
+            )
+
+
+def _rows_to_result(rows: list[ItemImportRow]) -> ImportItemsResult:
+    created = sum(row.status is ItemImportStatus.CREATED for row in rows)
+    return ImportItemsResult(rows=rows, created=created, conflicts=len(rows) - created)
+
+
+def _command_to_entity(command: CreateItemCommand) -> ItemEntity:
+    return ItemEntity(
+        id=None,
+        name=command.name,
+        description=command.description,
+        price=command.price,
+        quantity=command.quantity,
+    )
+
+
+def _entity_to_result(item: ItemEntity) -> CreateItemResult:
+    return CreateItemResult(
+        id=item.id,
+        name=item.name,
+        description=item.description,
+        price=item.price,
+        quantity=item.quantity,
+    )
@@ -1,28 +1,71 @@
 """List items use case implementation."""
 
-from be_task_ca.item.application.dto import CreateItemResult, ListItemsResult
+from typing import AsyncIterator, Iterator
+
+from be_task_ca.item.application.dto import ItemCursor, ItemView, ListItemsResult
 from be_task_ca.item.application.interfaces.item_repository_interface import (
+    AsyncItemRepositoryInterface,
     ItemRepositoryInterface,
 )
+from be_task_ca.observability.instrument import timed_use_case
+
+STREAM_BATCH_SIZE = 500
 
 
+@timed_use_case
 class ListItemsUseCase:
-    """Return all items."""
+    """Return all items, one keyset page of items, or a stream of every item.
+
+    Items are passed on as the repository's read-only views, without copying.
+    """
 
     def __init__(self, item_repository: ItemRepositoryInterface) -> None:
         self._item_repository = item_repository
 
     def execute(self) -> ListItemsResult:
-        items = self._item_repository.get_all_items()
-        return ListItemsResult(
-            items=[
-                CreateItemResult(
-                    id=item.id,
-                    name=item.name,
-                    description=item.description,
-                    price=item.price,
-                    quantity=item.quantity,
-                )
-                for item in items
-            ]
-        )
+        return ListItemsResult(items=self._item_repository.get_all_items())
+
+    def execute_page(
+        self, limit: int, after: ItemCursor | None = None
+    ) -> ListItemsResult:
+        # One extra row tells whether another page exists without a count query.
+        items = self._item_repository.get_items_page(limit + 1, after)
+        return page_to_result(items, limit)
+
+    def stream(self, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[ItemView]:
+        yield from self._item_repository.iter_all_items(batch_size)
+
+
+@timed_use_case
+class AsyncListItemsUseCase:
+    """Async variant of ListItemsUseCase for the async persistence stack."""
+
+    def __init__(self, item_repository: AsyncItemRepositoryInterface) -> None:
+        self._item_repository = item_repository
+
+    async def execute(self) -> ListItemsResult:
+        return ListItemsResult(items=await self._item_repository.get_all_items())
+
+    async def execute_page(
+        self, limit: int, after: ItemCursor | None = None
+    ) -> ListItemsResult:
+        items = await self._item_repository.get_items_page(limit + 1, after)
+        return page_to_result(items, limit)
+
+    async def stream(
+        self, batch_size: int = STREAM_BATCH_SIZE
+    ) -> AsyncIterator[ItemView]:
+        async for item in self._item_repository.iter_all_items(batch_size):
+            yield item
+
+
+def page_to_result(items: list[ItemView], limit: int) -> ListItemsResult:
+    """Cut a page fetched with one extra row, which tells that another follows."""
+    if len(items) <= limit:
+        return ListItemsResult(items=items)
+
+    items = items[:limit]
+    last_item = items[-1]
+    return ListItemsResult(
+        items=items, next_cursor=ItemCursor(name=last_item.name, id=last_item.id)
+    )
@@ -0,0 +1,41 @@
+"""Search items use case implementation."""
+
+from be_task_ca.item.application.dto import (
+    ItemCursor,
+    ItemSearchCriteria,
+    ListItemsResult,
+)
+from be_task_ca.item.application.interfaces.item_repository_interface import (
+    AsyncItemRepositoryInterface,
+    ItemRepositoryInterface,
+)
+from be_task_ca.item.application.usecases.list_items import page_to_result
+from be_task_ca.observability.instrument import timed_use_case
+
+
+@timed_use_case
+class SearchItemsUseCase:
+    """Return one keyset page of the items matching the search criteria."""
+
+    def __init__(self, item_repository: ItemRepositoryInterface) -> None:
+        self._item_repository = item_repository
+
+    def execute(
+        self, criteria: ItemSearchCriteria, limit: int, after: ItemCursor | None = None
+    ) -> ListItemsResult:
+        items = self._item_repository.search_items(criteria, limit + 1, after)
+        return page_to_result(items, limit)
+
+
+@timed_use_case
+class AsyncSearchItemsUseCase:
+    """Async variant of SearchItemsUseCase for the async persistence stack."""
+
+    def __init__(self, item_repository: AsyncItemRepositoryInterface) -> None:
+        self._item_repository = item_repository
+
+    async def execute(
+        self, criteria: ItemSearchCriteria, limit: int, after: ItemCursor | None = None
+    ) -> ListItemsResult:
+        items = await self._item_repository.search_items(criteria, limit + 1, after)
+        return page_to_result(items, limit)
@@ -0,0 +1 @@
+"""Metrics and instrumentation package."""
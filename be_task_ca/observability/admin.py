@@ -0,0 +1,128 @@
+"""Runtime controls for observability features, guarded by the admin token."""
+
+import secrets
+from datetime import datetime
+from enum import Enum
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import JSONResponse, PlainTextResponse
+from pydantic import BaseModel, confloat
+
+from be_task_ca.observability.profiling import (
+    RequestProfile,
+    profile_store,
+    to_collapsed,
+    to_speedscope,
+)
+from be_task_ca.observability.queries import query_instrumentation
+from be_task_ca.settings import settings
+
+
+def is_admin_token(token: str | None) -> bool:
+    return (
+        settings.admin_token is not None
+        and token is not None
+        and secrets.compare_digest(token, settings.admin_token)
+    )
+
+
+def require_admin_token(x_admin_token: str | None = Header(default=None)) -> None:
+    if settings.admin_token is None:
+        raise HTTPException(status_code=403, detail="Admin API is disabled")
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+admin_router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin_token)],
+)
+
+
+class QueryInstrumentationSettings(BaseModel):
+    enabled: bool
+    sample_rate: confloat(ge=0, le=1)
+    slow_query_ms: confloat(ge=0) | None
+
+
+class QueryInstrumentationUpdate(BaseModel):
+    enabled: bool | None = None
+    sample_rate: confloat(ge=0, le=1) | None = None
+    slow_query_ms: confloat(ge=0) | None = None
+
+
+@admin_router.get("/query-instrumentation")
+async def get_query_instrumentation() -> QueryInstrumentationSettings:
+    return _current_query_instrumentation()
+
+
+@admin_router.patch("/query-instrumentation")
+async def patch_query_instrumentation(
+    update: QueryInstrumentationUpdate,
+) -> QueryInstrumentationSettings:
+    """Change query instrumentation in the worker process serving the request."""
+    for name, value in update.dict(exclude_unset=True).items():
+        setattr(query_instrumentation, name, value)
+    return _current_query_instrumentation()
+
+
+def _current_query_instrumentation() -> QueryInstrumentationSettings:
+    return QueryInstrumentationSettings(
+        enabled=query_instrumentation.enabled,
+        sample_rate=query_instrumentation.sample_rate,
+        slow_query_ms=query_instrumentation.slow_query_ms,
+    )
+
+
+class ProfileSummary(BaseModel):
+    id: str
+    method: str
+    path: str
+    route: str
+    status: int
+    started_at: datetime
+    duration_ms: float
+    db_ms: float
+    python_ms: float
+    db_statements: int
+    samples: int
+
+
+class ProfileFormat(str, Enum):
+    speedscope = "speedscope"
+    collapsed = "collapsed"
+
+
+@admin_router.get("/profiles")
+async def list_profiles() -> list[ProfileSummary]:
+    """List the profiles recorded by the worker serving the request, newest first."""
+    return [_profile_summary(profile) for profile in profile_store.list()]
+
+
+@admin_router.get("/profiles/{profile_id}")
+async def get_profile(
+    profile_id: str, format: ProfileFormat = ProfileFormat.speedscope
+):
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    if format == ProfileFormat.collapsed:
+        return PlainTextResponse(to_collapsed(profile))
+    return JSONResponse(to_speedscope(profile))
+
+
+def _profile_summary(profile: RequestProfile) -> ProfileSummary:
+    return ProfileSummary(
+        id=profile.id,
+        method=profile.method,
+        path=profile.path,
+        route=profile.route,
+        status=profile.status,
+        started_at=profile.started_at,
+        duration_ms=profile.duration_seconds * 1000,
+        db_ms=profile.db_seconds * 1000,
+        python_ms=profile.python_seconds * 1000,
+        db_statements=profile.db_statements,
+        samples=profile.samples,
+    )
@@ -0,0 +1,21 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
+
+from be_task_ca.observability.metrics import REGISTRY
+from be_task_ca.observability.multiprocess import render_aggregated
+from be_task_ca.settings import settings
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+observability_router = APIRouter(tags=["observability"])
+
+
+@observability_router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    directory = settings.metrics_multiprocess_dir
+    if directory is None:
+        body = REGISTRY.render()
+    else:
+        body = await run_in_threadpool(render_aggregated, REGISTRY, directory)
+    return PlainTextResponse(body, media_type=PROMETHEUS_CONTENT_TYPE)
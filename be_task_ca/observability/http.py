@@ -0,0 +1,223 @@
+"""ASGI middleware recording request metrics per route template, and profiling."""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, NamedTuple
+from uuid import uuid4
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from be_task_ca.observability.admin import is_admin_token
+from be_task_ca.observability.metrics import Counter, Histogram
+from be_task_ca.observability.profiling import (
+    ProfileStore,
+    RequestProfile,
+    StackSampler,
+)
+from be_task_ca.observability.request_stats import RequestStats, current_request_stats
+
+UNMATCHED_ROUTE = "unmatched"
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+ADMIN_TOKEN_HEADER = b"x-admin-token"
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 500)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests handled.", ["method", "route", "status"]
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Time to handle an HTTP request, including streaming the body.",
+    ["method", "route"],
+)
+HTTP_REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Time spent executing SQL statements per request.",
+    ["method", "route"],
+)
+HTTP_REQUEST_DB_STATEMENTS = Histogram(
+    "http_request_db_statements",
+    "SQL statements executed per request.",
+    ["method", "route"],
+    buckets=COUNT_BUCKETS,
+)
+HTTP_REQUEST_REPOSITORY_CALLS = Histogram(
+    "http_request_repository_calls",
+    "Repository and gateway calls per request.",
+    ["method", "route"],
+    buckets=COUNT_BUCKETS,
+)
+
+
+class RequestMetricsMiddleware:
+    """Record count, latency, DB time and repository calls of every request.
+
+    Requests are labelled with the matched route's path template, e.g.
+    `/users/{user_id}/cart`, so the label set stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_request_stats.reset(token)
+            _record(scope, status, elapsed, stats)
+
+
+class _RouteMetrics(NamedTuple):
+    seconds: Any
+    db_seconds: Any
+    db_statements: Any
+    repository_calls: Any
+
+
+# Label lookups are cached per route since the set of route templates is fixed.
+_route_metrics: dict[tuple[str, str], _RouteMetrics] = {}
+_request_counters: dict[tuple[str, str, int], Any] = {}
+
+
+def _record(scope: Scope, status: int, elapsed: float, stats: RequestStats) -> None:
+    route = scope.get("route")
+    key = (scope["method"], getattr(route, "path", UNMATCHED_ROUTE))
+    metrics = _route_metrics.get(key)
+    if metrics is None:
+        metrics = _route_metrics.setdefault(
+            key,
+            _RouteMetrics(
+                HTTP_REQUEST_SECONDS.labels(*key),
+                HTTP_REQUEST_DB_SECONDS.labels(*key),
+                HTTP_REQUEST_DB_STATEMENTS.labels(*key),
+                HTTP_REQUEST_REPOSITORY_CALLS.labels(*key),
+            ),
+        )
+    counter = _request_counters.get((*key, status))
+    if counter is None:
+        counter = _request_counters.setdefault(
+            (*key, status), HTTP_REQUESTS.labels(*key, status)
+        )
+
+    counter.inc()
+    metrics.seconds.observe(elapsed)
+    metrics.db_seconds.observe(stats.db_seconds)
+    metrics.db_statements.observe(stats.db_statements)
+    metrics.repository_calls.observe(stats.repository_calls)
+
+
+class ProfilingMiddleware:
+    """Profile requests sending `X-Profile: 1` with the admin token, or sampled.
+
+    The request runs under a StackSampler and its profile, with the DB time
+    counted by RequestMetricsMiddleware, is added to `store`; the response
+    carries its id in `X-Profile-Id`. One request per process is profiled at a
+    time, others asking for it meanwhile run unprofiled.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: ProfileStore,
+        sample_rate: float = 0.0,
+        interval: float = 0.005,
+        sample: Callable[[], float] = random.random,
+    ) -> None:
+        self.app = app
+        self.store = store
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self._sample = sample
+        self._lock = threading.Lock()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+        if not self._lock.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self._profile(scope, receive, send)
+        finally:
+            self._lock.release()
+
+    def _requested(self, scope: Scope) -> bool:
+        if self.sample_rate and self._sample() < self.sample_rate:
+            return True
+        requested = token = None
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                requested = value
+            elif name == ADMIN_TOKEN_HEADER:
+                token = value.decode("latin-1")
+        return requested == b"1" and is_admin_token(token)
+
+    async def _profile(self, scope: Scope, receive: Receive, send: Send) -> None:
+        profile_id = uuid4().hex
+        status = 500
+        stats = current_request_stats.get()
+        token = None
+        if stats is None:
+            stats = RequestStats()
+            token = current_request_stats.set(stats)
+
+        async def send_with_profile_id(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", ()),
+                        (PROFILE_ID_HEADER, profile_id.encode()),
+                    ],
+                }
+            await send(message)
+
+        sampler = StackSampler(threading.get_ident(), self.interval)
+        db_seconds = stats.db_seconds
+        db_statements = stats.db_statements
+        started_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stop()
+            elapsed = time.perf_counter() - started
+            if token is not None:
+                current_request_stats.reset(token)
+            self.store.add(
+                RequestProfile(
+                    id=profile_id,
+                    method=scope["method"],
+                    path=scope["path"],
+                    route=getattr(scope.get("route"), "path", UNMATCHED_ROUTE),
+                    status=status,
+                    started_at=started_at,
+                    duration_seconds=elapsed,
+                    db_seconds=stats.db_seconds - db_seconds,
+                    db_statements=stats.db_statements - db_statements,
+                    samples=sampler.samples,
+                    weights=sampler.weights,
+                )
+            )
@@ -0,0 +1,98 @@
+"""Class decorators timing use cases and counting repository calls."""
+
+import functools
+import inspect
+import time
+from typing import Callable, Iterator, TypeVar
+
+from be_task_ca.observability.metrics import Counter, Histogram
+from be_task_ca.observability.request_stats import current_request_stats
+
+USE_CASE_SECONDS = Histogram(
+    "use_case_duration_seconds", "Use case execution time.", ["use_case", "method"]
+)
+REPOSITORY_CALLS = Counter(
+    "repository_calls_total",
+    "Calls made to repository and gateway adapters.",
+    ["repository", "method"],
+)
+
+T = TypeVar("T", bound=type)
+
+
+def timed_use_case(cls: T) -> T:
+    """Observe every public method of a use case in use_case_duration_seconds.
+
+    Generator methods are left alone: they return before doing any work.
+    """
+    for name, function in _public_methods(cls):
+        if inspect.isgeneratorfunction(function) or inspect.isasyncgenfunction(
+            function
+        ):
+            continue
+        histogram = USE_CASE_SECONDS.labels(cls.__name__, name)
+        setattr(cls, name, _timed(function, histogram))
+    return cls
+
+
+def counted_repository(cls: T) -> T:
+    """Count calls to every public method of a repository or gateway adapter."""
+    for name, function in _public_methods(cls):
+        counter = REPOSITORY_CALLS.labels(cls.__name__, name)
+        setattr(cls, name, _counted(function, counter))
+    return cls
+
+
+def _public_methods(cls: type) -> Iterator[tuple[str, Callable]]:
+    for name, function in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.isfunction(function):
+            yield name, function
+
+
+def _timed(function: Callable, histogram) -> Callable:
+    if inspect.iscoroutinefunction(function):
+
+        @functools.wraps(function)
+        async def timed_coroutine(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await function(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - started)
+
+        return timed_coroutine
+
+    @functools.wraps(function)
+    def timed(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - started)
+
+    return timed
+
+
+def _count_call(counter) -> None:
+    counter.inc()
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.repository_calls += 1
+
+
+def _counted(function: Callable, counter) -> Callable:
+    if inspect.iscoroutinefunction(function):
+
+        @functools.wraps(function)
+        async def counted_coroutine(*args, **kwargs):
+            _count_call(counter)
+            return await function(*args, **kwargs)
+
+        return counted_coroutine
+
+    @functools.wraps(function)
+    def counted(*args, **kwargs):
+        _count_call(counter)
+        return function(*args, **kwargs)
+
+    return counted
@@ -0,0 +1,292 @@
+"""Prometheus-style metric primitives and the process-wide registry."""
+
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Iterable
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together in the text exposition format."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, "_Metric"] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: "_Metric") -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name!r} is already registered")
+            self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> "_Metric | None":
+        return self._metrics.get(name)
+
+    def metrics(self) -> list["_Metric"]:
+        return list(self._metrics.values())
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self.metrics():
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+class _Shards:
+    """Per-thread accumulators of `width` numbers.
+
+    Each thread only ever writes its own shard, so updates take no lock and
+    threads never contend; readers add the shards up.
+    """
+
+    def __init__(self, width: int) -> None:
+        self._width = width
+        self._shards: dict[int, list[float]] = {}
+
+    def local(self) -> list[float]:
+        ident = threading.get_ident()
+        shard = self._shards.get(ident)
+        if shard is None:
+            shard = self._shards.setdefault(ident, [0.0] * self._width)
+        return shard
+
+    def totals(self) -> list[float]:
+        totals = [0.0] * self._width
+        for shard in list(self._shards.values()):
+            for index, value in enumerate(shard):
+                totals[index] += value
+        return totals
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        registry: MetricsRegistry | None = REGISTRY,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if registry is not None:
+            registry.register(self)
+
+    def labels(self, *values: str, **kwargs: str):
+        if kwargs:
+            values = tuple(kwargs[name] for name in self.labelnames)
+        key = tuple(str(value) for value in values)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    def snapshot(self) -> dict[tuple[str, ...], Any]:
+        """Current value of every child as plain data, see `data_samples`."""
+        return {
+            key: self._child_data(child) for key, child in list(self._children.items())
+        }
+
+    def samples(self) -> list[str]:
+        lines = []
+        for key, data in sorted(self.snapshot().items()):
+            lines.extend(self.data_samples(key, data))
+        return lines
+
+    def merge(self, left: Any, right: Any) -> Any:
+        """Combine two snapshots of the same child from different processes."""
+        raise NotImplementedError
+
+    def data_samples(
+        self, key: tuple[str, ...], data: Any, extra: str = ""
+    ) -> list[str]:
+        raise NotImplementedError
+
+    def _format_labels(self, key: tuple[str, ...], extra: str = "") -> str:
+        pairs = [
+            f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, key)
+        ]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _child_data(self, child) -> Any:
+        raise NotImplementedError
+
+
+class _Value:
+    def __init__(self) -> None:
+        self._base = 0.0
+        self._shards = _Shards(1)
+        self._function: Callable[[], float] | None = None
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._shards.local()[0] += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._base = value - self._shards.totals()[0]
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the value lazily at render time instead of storing it."""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        if self._function is not None:
+            return float(self._function())
+        return self._base + self._shards.totals()[0]
+
+
+class Counter(_Metric):
+    """Monotonically increasing value."""
+
+    type_name = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def merge(self, left: float, right: float) -> float:
+        return left + right
+
+    def data_samples(
+        self, key: tuple[str, ...], data: float, extra: str = ""
+    ) -> list[str]:
+        return [f"{self.name}{self._format_labels(key, extra)} {_format_value(data)}"]
+
+    def _child_data(self, child: _Value) -> float:
+        return child.value
+
+
+class Gauge(Counter):
+    """Value that can go up and down or be computed on demand."""
+
+    type_name = "gauge"
+
+
+class _HistogramValue:
+    """Bucket counts, then the count above the last bucket, then the sum."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self._shards = _Shards(len(buckets) + 2)
+
+    def observe(self, value: float) -> None:
+        shard = self._shards.local()
+        shard[bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+
+    def data(self) -> list[float]:
+        return self._shards.totals()
+
+    @property
+    def counts(self) -> list[int]:
+        return [int(count) for count in self.data()[: len(self.buckets)]]
+
+    @property
+    def count(self) -> int:
+        return int(sum(self.data()[:-1]))
+
+    @property
+    def sum(self) -> float:
+        return self.data()[-1]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+        registry: MetricsRegistry | None = REGISTRY,
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def merge(self, left: list[float], right: list[float]) -> list[float]:
+        return [a + b for a, b in zip(left, right)]
+
+    def data_samples(
+        self, key: tuple[str, ...], data: list[float], extra: str = ""
+    ) -> list[str]:
+        labels = self._format_labels(key, extra)
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, data):
+            cumulative += int(count)
+            le = f'le="{_format_value(bound)}"'
+            bucket_labels = self._format_labels(key, f"{extra},{le}" if extra else le)
+            lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+        count = int(sum(data[:-1]))
+        inf = 'le="+Inf"'
+        inf_labels = self._format_labels(key, f"{extra},{inf}" if extra else inf)
+        lines.append(f"{self.name}_bucket{inf_labels} {count}")
+        lines.append(f"{self.name}_sum{labels} {_format_value(data[-1])}")
+        lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+    def _child_data(self, child: _HistogramValue) -> list[float]:
+        return child.data()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
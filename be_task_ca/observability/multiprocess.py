@@ -0,0 +1,133 @@
+"""Metrics aggregation across worker processes through a shared directory.
+
+Every worker periodically writes a snapshot of its registry to
+`<directory>/<pid>.json`; `/metrics` served by any worker merges all of them.
+Counters and histograms are summed, including the last snapshot of workers
+that have exited, so totals stay monotonic across restarts. Gauges describe
+live state and are reported per live worker with a `pid` label. The
+directory should be emptied before the server starts.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from fastapi import FastAPI
+
+from be_task_ca.observability.metrics import Gauge, MetricsRegistry
+from be_task_ca.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+
+def write_snapshot(registry: MetricsRegistry, directory: str) -> None:
+    snapshot = {
+        metric.name: [[list(key), data] for key, data in metric.snapshot().items()]
+        for metric in registry.metrics()
+    }
+    path = Path(directory) / f"{os.getpid()}.json"
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(snapshot))
+    os.replace(temporary, path)
+
+
+def render_aggregated(registry: MetricsRegistry, directory: str) -> str:
+    write_snapshot(registry, directory)
+    summed: dict[str, dict[tuple[str, ...], Any]] = {}
+    gauges: dict[str, list[tuple[int, tuple[str, ...], float]]] = {}
+    for pid, snapshot in _read_snapshots(directory):
+        alive = _is_alive(pid)
+        for name, children in snapshot.items():
+            metric = registry.get(name)
+            if metric is None:
+                continue
+            for key, data in children:
+                key = tuple(key)
+                if isinstance(metric, Gauge):
+                    if alive:
+                        gauges.setdefault(name, []).append((pid, key, data))
+                    continue
+                merged = summed.setdefault(name, {})
+                merged[key] = metric.merge(merged[key], data) if key in merged else data
+
+    lines: list[str] = []
+    for metric in registry.metrics():
+        lines.extend(metric.header())
+        if isinstance(metric, Gauge):
+            for pid, key, data in sorted(gauges.get(metric.name, [])):
+                lines.extend(metric.data_samples(key, data, extra=f'pid="{pid}"'))
+        else:
+            for key, data in sorted(summed.get(metric.name, {}).items()):
+                lines.extend(metric.data_samples(key, data))
+    return "\n".join(lines) + "\n"
+
+
+def _read_snapshots(directory: str):
+    for path in Path(directory).glob("*.json"):
+        try:
+            yield int(path.stem), json.loads(path.read_text())
+        except (OSError, ValueError):
+            # Unreadable or half-written by a crashed worker; skip it this time.
+            continue
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SnapshotWriter:
+    """Write the registry snapshot every `interval` seconds until stopped."""
+
+    def __init__(
+        self, registry: MetricsRegistry, directory: str, interval: float
+    ) -> None:
+        self._registry = registry
+        self._directory = directory
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                write_snapshot(self._registry, self._directory)
+            except OSError:
+                logger.exception("Writing the metrics snapshot failed")
+
+    def start(self) -> None:
+        os.makedirs(self._directory, exist_ok=True)
+        write_snapshot(self._registry, self._directory)
+        self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        write_snapshot(self._registry, self._directory)
+
+
+def install_snapshot_writer(
+    application: FastAPI, registry: MetricsRegistry, settings: Settings
+) -> None:
+    """Start writing snapshots with the application and flush on shutdown."""
+    writer = SnapshotWriter(
+        registry,
+        settings.metrics_multiprocess_dir,
+        settings.metrics_snapshot_interval_seconds,
+    )
+    application.add_event_handler("startup", writer.start)
+    application.add_event_handler("shutdown", writer.stop)
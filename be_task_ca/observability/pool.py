@@ -0,0 +1,84 @@
+"""Connection pool instrumentation exposed through the metrics registry."""
+
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from be_task_ca.observability.metrics import Counter, Gauge, Histogram
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection.",
+    ["pool"],
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout.",
+    ["pool"],
+)
+POOL_OVERFLOW_EVENTS = Counter(
+    "db_pool_overflow_events_total",
+    "Connections opened beyond pool_size.",
+    ["pool"],
+)
+POOL_SIZE = Gauge("db_pool_size", "Configured pool_size.", ["pool"])
+POOL_MAX_OVERFLOW = Gauge("db_pool_max_overflow", "Configured max_overflow.", ["pool"])
+POOL_IN_USE = Gauge(
+    "db_pool_connections_in_use", "Connections currently checked out.", ["pool"]
+)
+POOL_IDLE = Gauge("db_pool_connections_idle", "Connections idle in the pool.", ["pool"])
+POOL_SATURATION = Gauge(
+    "db_pool_saturation",
+    "Checked out connections divided by pool_size + max_overflow.",
+    ["pool"],
+)
+
+
+class _InstrumentedPoolMixin:
+    """Record checkout wait time, timeouts and overflow growth for a QueuePool.
+
+    The pool's `logging_name` (create_engine's `pool_logging_name`) is used as
+    the metric label, which survives `Pool.recreate()` on engine disposal.
+    """
+
+    def connect(self):
+        pool_name = self.logging_name or "default"
+        overflow_before = self.overflow()
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.labels(pool_name).inc()
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.labels(pool_name).observe(time.perf_counter() - started)
+
+        if self.overflow() > max(overflow_before, 0):
+            POOL_OVERFLOW_EVENTS.labels(pool_name).inc()
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def register_pool_gauges(engine: Engine, pool_name: str) -> None:
+    """Expose live pool occupancy; values are read from `engine.pool` on render."""
+
+    def capacity() -> int:
+        pool = engine.pool
+        return pool.size() + max(pool._max_overflow, 0)
+
+    POOL_SIZE.labels(pool_name).set_function(lambda: engine.pool.size())
+    POOL_MAX_OVERFLOW.labels(pool_name).set_function(lambda: engine.pool._max_overflow)
+    POOL_IN_USE.labels(pool_name).set_function(lambda: engine.pool.checkedout())
+    POOL_IDLE.labels(pool_name).set_function(lambda: engine.pool.checkedin())
+    POOL_SATURATION.labels(pool_name).set_function(
+        lambda: engine.pool.checkedout() / capacity() if capacity() else 0.0
+    )
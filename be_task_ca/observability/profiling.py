@@ -0,0 +1,210 @@
+"""Sampling profiler for single requests, rendered as collapsed stacks or speedscope."""
+
+import concurrent.futures.thread
+import selectors
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import NamedTuple
+
+from be_task_ca.settings import settings
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# Leaf functions of background threads blocked on work queues or I/O, e.g. pool
+# workers and the process pool's manager; samples of another thread ending in
+# one are idle time unrelated to the profiled request.
+_IDLE_CODE = frozenset(
+    {
+        threading.Condition.wait.__code__,
+        concurrent.futures.thread._worker.__code__,
+        selectors.SelectSelector.select.__code__,
+        selectors._PollLikeSelector.select.__code__,
+    }
+)
+
+
+class Frame(NamedTuple):
+    name: str
+    file: str = ""
+    line: int = 0
+
+    def __str__(self) -> str:
+        if not self.file:
+            return self.name
+        return f"{self.name} ({self.file}:{self.line})"
+
+
+Stack = tuple[Frame, ...]
+
+
+class StackSampler:
+    """Periodically record the Python stacks of a thread and of busy pool threads.
+
+    Every `interval` seconds the stack of `thread_id` is sampled, together with
+    those of other threads that are not blocked waiting, e.g. the threadpool
+    running a sync dependency. Each sample is weighted by the time elapsed since
+    the previous one, since under GIL contention samples arrive late.
+    """
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = 0
+        self.weights: dict[Stack, float] = {}
+        self._frames: dict[object, Frame] = {}
+        self._thread_names: dict[int, str] = {}
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="request-profiler", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        previous = time.perf_counter()
+        while not self._stopped.wait(self.interval):
+            now = time.perf_counter()
+            self.sample(now - previous)
+            previous = now
+
+    def sample(self, weight: float) -> None:
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == self._thread.ident:
+                continue
+            if thread_id != self.thread_id and frame.f_code in _IDLE_CODE:
+                continue
+            stack = (Frame(self._thread_name(thread_id)), *self._stack(frame))
+            self.weights[stack] = self.weights.get(stack, 0.0) + weight
+        self.samples += 1
+
+    def _stack(self, frame) -> list[Frame]:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            entry = self._frames.get(code)
+            if entry is None:
+                entry = self._frames[code] = Frame(
+                    code.co_qualname, code.co_filename, code.co_firstlineno
+                )
+            stack.append(entry)
+            frame = frame.f_back
+        stack.reverse()
+        return stack
+
+    def _thread_name(self, thread_id: int) -> str:
+        name = self._thread_names.get(thread_id)
+        if name is None:
+            self._thread_names = {
+                thread.ident: thread.name for thread in threading.enumerate()
+            }
+            name = self._thread_names.get(thread_id, f"thread-{thread_id}")
+        return name
+
+
+@dataclass(frozen=True)
+class RequestProfile:
+    id: str
+    method: str
+    path: str
+    route: str
+    status: int
+    started_at: datetime
+    duration_seconds: float
+    db_seconds: float
+    db_statements: int
+    samples: int
+    weights: dict[Stack, float]
+
+    @property
+    def python_seconds(self) -> float:
+        """Wall time outside SQL statements: Python code plus any other waits."""
+        return max(self.duration_seconds - self.db_seconds, 0.0)
+
+
+class ProfileStore:
+    """Keep the `maxsize` most recent request profiles of this process."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._profiles: deque[RequestProfile] = deque(maxlen=maxsize)
+        self._lock = threading.Lock()
+
+    def add(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._profiles.append(profile)
+
+    def get(self, profile_id: str) -> RequestProfile | None:
+        with self._lock:
+            for profile in self._profiles:
+                if profile.id == profile_id:
+                    return profile
+        return None
+
+    def list(self) -> list[RequestProfile]:
+        """Return the stored profiles, most recent first."""
+        with self._lock:
+            return list(reversed(self._profiles))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+
+def to_collapsed(profile: RequestProfile) -> str:
+    """Render `frame;frame;... weight` lines, weights in microseconds.
+
+    This is the input format of flamegraph.pl and most flame graph viewers.
+    """
+    return "".join(
+        f"{';'.join(map(str, stack))} {round(weight * 1_000_000)}\n"
+        for stack, weight in profile.weights.items()
+    )
+
+
+def to_speedscope(profile: RequestProfile) -> dict:
+    """Render a sampled profile in the speedscope file format, weights in ms."""
+    frame_indexes: dict[Frame, int] = {}
+    samples = []
+    weights = []
+    for stack, weight in profile.weights.items():
+        samples.append(
+            [frame_indexes.setdefault(frame, len(frame_indexes)) for frame in stack]
+        )
+        weights.append(weight * 1000)
+    name = f"{profile.method} {profile.path}"
+    return {
+        "$schema": SPEEDSCOPE_SCHEMA,
+        "name": name,
+        "exporter": "be_task_ca",
+        "activeProfileIndex": 0,
+        "shared": {
+            "frames": [
+                {"name": frame.name, "file": frame.file, "line": frame.line}
+                if frame.file
+                else {"name": frame.name}
+                for frame in frame_indexes
+            ]
+        },
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        ],
+    }
+
+
+profile_store = ProfileStore(settings.profile_store_size)
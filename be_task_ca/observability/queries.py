@@ -0,0 +1,155 @@
+"""Sampled per-statement latency histograms and a slow query log."""
+
+import logging
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, NamedTuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from be_task_ca.observability.metrics import Counter, Histogram
+from be_task_ca.observability.request_stats import current_request_stats
+from be_task_ca.settings import Settings, settings
+
+logger = logging.getLogger(__name__)
+
+QUERY_SECONDS = Histogram(
+    "db_query_seconds", "Sampled statement execution time.", ["statement"]
+)
+SLOW_QUERIES = Counter(
+    "db_slow_queries_total",
+    "Sampled statements slower than the threshold.",
+    ["statement"],
+)
+
+MAX_STATEMENT_LABELS = 500
+MAX_CACHED_STATEMENTS = 2000
+MAX_STATEMENT_LENGTH = 300
+OTHER_STATEMENT = "other"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_OR_PLACEHOLDER = re.compile(r"%\(\w+\)s|\$\d+|\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_REPEATED_GROUP = re.compile(r"(\(\?(?:, \?)*\)|\(\?\.\.\.\))(?:, \1)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """Reduce a statement to its shape: literals and parameters become `?`,
+    and parameter lists or multi-row VALUES of any length look the same.
+    """
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING_LITERAL.sub("?", normalized)
+    normalized = _NUMBER_OR_PLACEHOLDER.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(?...)", normalized)
+    normalized = _REPEATED_GROUP.sub(r"\1, ...", normalized)
+    return normalized[:MAX_STATEMENT_LENGTH]
+
+
+class _StatementMetrics(NamedTuple):
+    label: str
+    seconds: Any
+    slow: Any
+
+
+class QueryInstrumentation:
+    """Time statements executed on installed engines.
+
+    Every statement adds to the current request's DB time. A `sample_rate`
+    fraction is also observed in `db_query_seconds` under its normalized text,
+    and logged when it took at least `slow_query_ms`. The attributes can be
+    changed at runtime; they apply to this process only.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        sample_rate: float = 1.0,
+        slow_query_ms: float | None = None,
+        sample: Callable[[], float] = random.random,
+    ) -> None:
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.slow_query_ms = slow_query_ms
+        self._sample = sample
+        self._labels: set[str] = set()
+        self._statements: dict[str, _StatementMetrics] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "QueryInstrumentation":
+        return cls(
+            enabled=settings.db_query_instrumentation_enabled,
+            sample_rate=settings.db_query_sample_rate,
+            slow_query_ms=settings.db_slow_query_ms,
+        )
+
+    def install(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        if self.enabled:
+            context._query_started = time.perf_counter()
+
+    def _after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        started = getattr(context, "_query_started", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        context._query_started = None
+
+        stats = current_request_stats.get()
+        if stats is not None:
+            stats.db_seconds += elapsed
+            stats.db_statements += 1
+        if self._sample() >= self.sample_rate:
+            return
+
+        metrics = self._statement_metrics(statement)
+        metrics.seconds.observe(elapsed)
+        if self.slow_query_ms is not None and elapsed * 1000 >= self.slow_query_ms:
+            metrics.slow.inc()
+            logger.warning(
+                "Slow query: %.1f ms: %s",
+                elapsed * 1000,
+                metrics.label,
+                extra={
+                    "duration_ms": round(elapsed * 1000, 3),
+                    "statement": metrics.label,
+                    "executemany": executemany,
+                    "rowcount": cursor.rowcount,
+                },
+            )
+
+    def _statement_metrics(self, statement: str) -> _StatementMetrics:
+        # Compiled statements repeat verbatim, so normalize each one only once.
+        metrics = self._statements.get(statement)
+        if metrics is None:
+            label = self._label(normalize_sql(statement))
+            metrics = _StatementMetrics(
+                label, QUERY_SECONDS.labels(label), SLOW_QUERIES.labels(label)
+            )
+            if len(self._statements) < MAX_CACHED_STATEMENTS:
+                self._statements[statement] = metrics
+        return metrics
+
+    def _label(self, normalized: str) -> str:
+        """Bound the label set so ad hoc statements cannot grow it forever."""
+        if normalized in self._labels:
+            return normalized
+        with self._lock:
+            if len(self._labels) >= MAX_STATEMENT_LABELS:
+                return OTHER_STATEMENT
+            self._labels.add(normalized)
+        return normalized
+
+
+query_instrumentation = QueryInstrumentation.from_settings(settings)
@@ -0,0 +1,19 @@
+"""Per-request accumulators filled in by the DB and repository instrumentation."""
+
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+@dataclass
+class RequestStats:
+    db_seconds: float = 0.0
+    db_statements: int = 0
+    repository_calls: int = 0
+
+
+# Set by RequestMetricsMiddleware for the duration of each HTTP request; the
+# threadpool and SQLAlchemy's greenlets run with a copy of the request context,
+# so they see and update the same RequestStats object.
+current_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "current_request_stats", default=None
+)
@@ -0,0 +1,75 @@
+"""SQLAlchemy unit of work and notifications deferred until commit."""
+
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from be_task_ca.events import ChangeNotifier
+from be_task_ca.unit_of_work import AsyncUnitOfWorkInterface, UnitOfWorkInterface
+
+_PENDING_NOTIFICATIONS = "pending_notifications"
+
+
+class SqlAlchemyUnitOfWork(UnitOfWorkInterface):
+    """Unit of work over the session shared by a use case's repositories."""
+
+    def __init__(self, db: Session) -> None:
+        self._db = db
+
+    def __enter__(self) -> "SqlAlchemyUnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self._db.rollback()
+
+    def commit(self) -> None:
+        self._db.commit()
+
+    def rollback(self) -> None:
+        self._db.rollback()
+
+
+class AsyncSqlAlchemyUnitOfWork(AsyncUnitOfWorkInterface):
+    """AsyncSession variant of SqlAlchemyUnitOfWork."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    async def __aenter__(self) -> "AsyncSqlAlchemyUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        await self._db.rollback()
+
+    async def commit(self) -> None:
+        await self._db.commit()
+
+    async def rollback(self) -> None:
+        await self._db.rollback()
+
+
+def notify_after_commit(
+    db: Session | AsyncSession, notifier: ChangeNotifier, ids: Iterable[UUID]
+) -> None:
+    """Fan `ids` out through `notifier` once the session's transaction commits.
+
+    The notification is dropped when the transaction is rolled back instead.
+    """
+    db.info.setdefault(_PENDING_NOTIFICATIONS, []).append((notifier, list(ids)))
+
+
+@event.listens_for(Session, "after_commit")
+def _send_pending_notifications(session: Session) -> None:
+    for notifier, ids in session.info.pop(_PENDING_NOTIFICATIONS, ()):
+        notifier.notify(ids)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_pending_notifications(
+    session: Session, previous_transaction: SessionTransaction
+) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_NOTIFICATIONS, None)
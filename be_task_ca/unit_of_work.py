@@ -0,0 +1,81 @@
+"""Unit-of-work ports owning the transaction of a use case."""
+
+from typing import Protocol
+
+
+class UnitOfWorkInterface(Protocol):
+    """Transaction boundary shared by the repositories a use case writes through.
+
+    Repositories only send their writes to the database; the use case makes
+    them durable together with `commit`. Leaving the `with` block rolls back
+    whatever was not committed, so a raised error discards the use case's
+    writes.
+    """
+
+    def __enter__(self) -> "UnitOfWorkInterface":
+        """Start the unit of work."""
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        """Roll back the writes made since the last commit."""
+
+    def commit(self) -> None:
+        """Commit the writes made since the last commit."""
+
+    def rollback(self) -> None:
+        """Discard the writes made since the last commit."""
+
+
+class AsyncUnitOfWorkInterface(Protocol):
+    async def __aenter__(self) -> "AsyncUnitOfWorkInterface":
+        """Start the unit of work."""
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        """Roll back the writes made since the last commit."""
+
+    async def commit(self) -> None:
+        """Commit the writes made since the last commit."""
+
+    async def rollback(self) -> None:
+        """Discard the writes made since the last commit."""
+
+
+class InMemoryUnitOfWork(UnitOfWorkInterface):
+    """Unit of work for in-memory repositories, recording commits and rollbacks."""
+
+    def __init__(self) -> None:
+        self.commits = 0
+        self.rolled_back = False
+
+    def __enter__(self) -> "InMemoryUnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is not None:
+            self.rollback()
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rolled_back = True
+
+
+class AsyncInMemoryUnitOfWork(AsyncUnitOfWorkInterface):
+    """Async variant of InMemoryUnitOfWork."""
+
+    def __init__(self) -> None:
+        self.commits = 0
+        self.rolled_back = False
+
+    async def __aenter__(self) -> "AsyncInMemoryUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is not None:
+            await self.rollback()
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rolled_back = True
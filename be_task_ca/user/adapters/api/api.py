@@ -1,48 +1,120 @@
+from datetime import timedelta
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from be_task_ca.common import get_db
-from be_task_ca.user.adapters.api.schema import AddToCartRequest, CreateUserRequest
+from be_task_ca.settings import settings
+from be_task_ca.transactions import SqlAlchemyUnitOfWork
+from be_task_ca.user.adapters.api.schema import (
+    AddItemsToCartRequest,
+    AddToCartRequest,
+    CartResponse,
+    CreateUserRequest,
+    CreateUsersResponse,
+)
+from be_task_ca.user.adapters.cache.cart_view import cached_cart_view_reader
+from be_task_ca.user.adapters.cache.inventory_gateway import cached_inventory_gateway
 from be_task_ca.user.adapters.db.cart_repository import SqlAlchemyCartRepository
+from be_task_ca.user.adapters.db.cart_view_reader import SqlAlchemyCartViewReader
 from be_task_ca.user.adapters.db.inventory_gateway import SqlAlchemyInventoryGateway
 from be_task_ca.user.adapters.db.user_repository import SqlAlchemyUserRepository
+from be_task_ca.user.adapters.password_hashing import password_hasher
 from be_task_ca.user.application.usecases.add_item_to_cart import AddItemToCartUseCase
+from be_task_ca.user.application.usecases.add_items_to_cart import (
+    AddItemsToCartUseCase,
+)
 from be_task_ca.user.application.usecases.create_user import CreateUserUseCase
+from be_task_ca.user.application.usecases.create_users import CreateUsersUseCase
 from be_task_ca.user.application.usecases.list_cart_items import ListCartItemsUseCase
 from be_task_ca.user.adapters.api.handlers import (
+    CREATE_USERS_REQUEST_BODY,
     add_item_to_cart,
+    add_items_to_cart,
     create_user,
+    create_users,
     list_items_in_cart,
+    parse_create_users_body,
 )
 
 
 user_router = APIRouter(
     prefix="/users",
     tags=["user"],
+    default_response_class=ORJSONResponse,
 )
 
 
 @user_router.post("/")
-async def post_customer(user: CreateUserRequest, db: Session = Depends(get_db)):
-    use_case = CreateUserUseCase(SqlAlchemyUserRepository(db))
+def post_customer(user: CreateUserRequest, db: Session = Depends(get_db)):
+    use_case = CreateUserUseCase(
+        SqlAlchemyUserRepository(db), password_hasher(), SqlAlchemyUnitOfWork(db)
+    )
     return create_user(user, use_case)
 
 
+@user_router.post("/bulk", openapi_extra=CREATE_USERS_REQUEST_BODY)
+async def post_customers_bulk(
+    request: Request, db: Session = Depends(get_db)
+) -> CreateUsersResponse:
+    # Only the body is read on the event loop; parsing, hashing and the
+    # inserts run in the threadpool.
+    body = await request.body()
+    return await run_in_threadpool(
+        _create_users_body, body, request.headers.get("content-type"), db
+    )
+
+
+def _create_users_body(
+    body: bytes, content_type: str | None, db: Session
+) -> CreateUsersResponse:
+    commands = parse_create_users_body(body, content_type)
+    use_case = CreateUsersUseCase(
+        SqlAlchemyUserRepository(db), password_hasher(), SqlAlchemyUnitOfWork(db)
+    )
+    return create_users(commands, use_case)
+
+
 @user_router.post("/{user_id}/cart")
-async def post_cart(
+def post_cart(
     user_id: UUID, cart_item: AddToCartRequest, db: Session = Depends(get_db)
 ):
     use_case = AddItemToCartUseCase(
-        user_repository=SqlAlchemyUserRepository(db),
         cart_repository=SqlAlchemyCartRepository(db),
-        inventory_gateway=SqlAlchemyInventoryGateway(db),
+        inventory_gateway=SqlAlchemyInventoryGateway(
+            db,
+            reservation_ttl=timedelta(seconds=settings.stock_reservation_ttl_seconds),
+        ),
+        unit_of_work=SqlAlchemyUnitOfWork(db),
     )
     return add_item_to_cart(user_id, cart_item, use_case)
 
 
-@user_router.get("/{user_id}/cart")
-async def get_cart(user_id: UUID, db: Session = Depends(get_db)):
-    use_case = ListCartItemsUseCase(SqlAlchemyCartRepository(db))
+@user_router.post("/{user_id}/cart/batch")
+def post_cart_batch(
+    user_id: UUID, cart_items: AddItemsToCartRequest, db: Session = Depends(get_db)
+):
+    use_case = AddItemsToCartUseCase(
+        cart_repository=SqlAlchemyCartRepository(db),
+        inventory_gateway=cached_inventory_gateway(
+            SqlAlchemyInventoryGateway(
+                db,
+                reservation_ttl=timedelta(
+                    seconds=settings.stock_reservation_ttl_seconds
+                ),
+            )
+        ),
+        unit_of_work=SqlAlchemyUnitOfWork(db),
+    )
+    return add_items_to_cart(user_id, cart_items, use_case)
+
+
+@user_router.get("/{user_id}/cart", response_model=CartResponse)
+def get_cart(user_id: UUID, db: Session = Depends(get_db)):
+    use_case = ListCartItemsUseCase(
+        cached_cart_view_reader(SqlAlchemyCartViewReader(db))
+    )
     return list_items_in_cart(user_id, use_case)
@@ -0,0 +1,132 @@
+from datetime import timedelta
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from be_task_ca.common import get_async_db
+from be_task_ca.settings import settings
+from be_task_ca.transactions import AsyncSqlAlchemyUnitOfWork
+from be_task_ca.user.adapters.api.schema import (
+    AddItemsToCartRequest,
+    AddToCartRequest,
+    CartResponse,
+    CreateUserRequest,
+    CreateUsersResponse,
+)
+from be_task_ca.user.adapters.cache.cart_view import async_cached_cart_view_reader
+from be_task_ca.user.adapters.cache.inventory_gateway import (
+    async_cached_inventory_gateway,
+)
+from be_task_ca.user.adapters.db.async_cart_repository import (
+    AsyncSqlAlchemyCartRepository,
+)
+from be_task_ca.user.adapters.db.async_cart_view_reader import (
+    AsyncSqlAlchemyCartViewReader,
+)
+from be_task_ca.user.adapters.db.async_inventory_gateway import (
+    AsyncSqlAlchemyInventoryGateway,
+)
+from be_task_ca.user.adapters.db.async_user_repository import (
+    AsyncSqlAlchemyUserRepository,
+)
+from be_task_ca.user.adapters.password_hashing import async_password_hasher
+from be_task_ca.user.application.usecases.add_item_to_cart import (
+    AsyncAddItemToCartUseCase,
+)
+from be_task_ca.user.application.usecases.add_items_to_cart import (
+    AsyncAddItemsToCartUseCase,
+)
+from be_task_ca.user.application.usecases.create_user import AsyncCreateUserUseCase
+from be_task_ca.user.application.usecases.create_users import AsyncCreateUsersUseCase
+from be_task_ca.user.application.usecases.list_cart_items import (
+    AsyncListCartItemsUseCase,
+)
+from be_task_ca.user.adapters.api.handlers import (
+    CREATE_USERS_REQUEST_BODY,
+    add_item_to_cart_async,
+    add_items_to_cart_async,
+    create_user_async,
+    create_users_async,
+    list_items_in_cart_async,
+    parse_create_users_body,
+)
+
+
+async_user_router = APIRouter(
+    prefix="/users",
+    tags=["user"],
+    default_response_class=ORJSONResponse,
+)
+
+
+@async_user_router.post("/")
+async def post_customer(
+    user: CreateUserRequest, db: AsyncSession = Depends(get_async_db)
+):
+    use_case = AsyncCreateUserUseCase(
+        AsyncSqlAlchemyUserRepository(db),
+        async_password_hasher(),
+        AsyncSqlAlchemyUnitOfWork(db),
+    )
+    return await create_user_async(user, use_case)
+
+
+@async_user_router.post("/bulk", openapi_extra=CREATE_USERS_REQUEST_BODY)
+async def post_customers_bulk(
+    request: Request, db: AsyncSession = Depends(get_async_db)
+) -> CreateUsersResponse:
+    commands = parse_create_users_body(
+        await request.body(), request.headers.get("content-type")
+    )
+    use_case = AsyncCreateUsersUseCase(
+        AsyncSqlAlchemyUserRepository(db),
+        async_password_hasher(),
+        AsyncSqlAlchemyUnitOfWork(db),
+    )
+    return await create_users_async(commands, use_case)
+
+
+@async_user_router.post("/{user_id}/cart")
+async def post_cart(
+    user_id: UUID, cart_item: AddToCartRequest, db: AsyncSession = Depends(get_async_db)
+):
+    use_case = AsyncAddItemToCartUseCase(
+        cart_repository=AsyncSqlAlchemyCartRepository(db),
+        inventory_gateway=AsyncSqlAlchemyInventoryGateway(
+            db,
+            reservation_ttl=timedelta(seconds=settings.stock_reservation_ttl_seconds),
+        ),
+        unit_of_work=AsyncSqlAlchemyUnitOfWork(db),
+    )
+    return await add_item_to_cart_async(user_id, cart_item, use_case)
+
+
+@async_user_router.post("/{user_id}/cart/batch")
+async def post_cart_batch(
+    user_id: UUID,
+    cart_items: AddItemsToCartRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    use_case = AsyncAddItemsToCartUseCase(
+        cart_repository=AsyncSqlAlchemyCartRepository(db),
+        inventory_gateway=async_cached_inventory_gateway(
+            AsyncSqlAlchemyInventoryGateway(
+                db,
+                reservation_ttl=timedelta(
+                    seconds=settings.stock_reservation_ttl_seconds
+                ),
+            )
+        ),
+        unit_of_work=AsyncSqlAlchemyUnitOfWork(db),
+    )
+    return await add_items_to_cart_async(user_id, cart_items, use_case)
+
+
+@async_user_router.get("/{user_id}/cart", response_model=CartResponse)
+async def get_cart(user_id: UUID, db: AsyncSession = Depends(get_async_db)):
+    use_case = AsyncListCartItemsUseCase(
+        async_cached_cart_view_reader(AsyncSqlAlchemyCartViewReader(db))
+    )
+    return await list_items_in_cart_async(user_id, use_case)
@@ -1,45 +1,143 @@
 from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 
+from be_task_ca.bulk_bodies import bulk_request_body, parse_bulk_body
 from be_task_ca.user.adapters.api.schema import (
+    AddItemsToCartRequest,
     AddToCartRequest,
     AddToCartResponse,
+    CartLineErrorResponse,
     CreateUserRequest,
     CreateUserResponse,
+    CreateUserRowResponse,
+    CreateUsersResponse,
 )
 from be_task_ca.user.application.dto import (
+    AddItemsToCartCommand,
     AddToCartCommand,
+    CartLineCommand,
+    CartResult,
     CreateUserCommand,
     CreateUserResult,
+    CreateUsersResult,
+    ListCartItemsResult,
 )
 from be_task_ca.user.application.exceptions import (
+    CartItemsRejectedError,
     ItemAlreadyInCartError,
     ItemNotFoundError,
     NotEnoughStockError,
+    PasswordHasherBusyError,
     UserAlreadyExistsError,
     UserNotFoundError,
 )
-from be_task_ca.user.application.usecases.add_item_to_cart import AddItemToCartUseCase
-from be_task_ca.user.application.usecases.create_user import CreateUserUseCase
-from be_task_ca.user.application.usecases.list_cart_items import ListCartItemsUseCase
+from be_task_ca.user.application.usecases.add_item_to_cart import (
+    AddItemToCartUseCase,
+    AsyncAddItemToCartUseCase,
+)
+from be_task_ca.user.application.usecases.add_items_to_cart import (
+    AddItemsToCartUseCase,
+    AsyncAddItemsToCartUseCase,
+)
+from be_task_ca.user.application.usecases.create_user import (
+    AsyncCreateUserUseCase,
+    CreateUserUseCase,
+)
+from be_task_ca.user.application.usecases.create_users import (
+    AsyncCreateUsersUseCase,
+    CreateUsersUseCase,
+)
+from be_task_ca.user.application.usecases.list_cart_items import (
+    AsyncListCartItemsUseCase,
+    ListCartItemsUseCase,
+)
+
+MAX_CREATE_USERS = 100_000
+MAX_ADD_TO_CART_ITEMS = 1000
+PASSWORD_HASH_RETRY_AFTER_SECONDS = 1
+
+CREATE_USERS_REQUEST_BODY = bulk_request_body("CreateUserRequest")
 
 
 def create_user(create_user: CreateUserRequest, use_case: CreateUserUseCase) -> CreateUserResponse:
-    command = CreateUserCommand(
-        first_name=create_user.first_name,
-        last_name=create_user.last_name,
-        email=create_user.email,
-        password=create_user.password,
-        shipping_address=create_user.shipping_address,
-    )
+    try:
+        result = use_case.execute(request_to_create_user_command(create_user))
+    except UserAlreadyExistsError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    except PasswordHasherBusyError as exc:
+        raise hasher_busy_exception(exc) from exc
+
+    return result_to_create_user_schema(result)
+
 
+async def create_user_async(
+    create_user: CreateUserRequest, use_case: AsyncCreateUserUseCase
+) -> CreateUserResponse:
     try:
-        result = use_case.execute(command)
+        result = await use_case.execute(request_to_create_user_command(create_user))
     except UserAlreadyExistsError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
+    except PasswordHasherBusyError as exc:
+        raise hasher_busy_exception(exc) from exc
 
     return result_to_create_user_schema(result)
 
 
+def create_users(
+    commands: list[CreateUserCommand], use_case: CreateUsersUseCase
+) -> CreateUsersResponse:
+    try:
+        result = use_case.execute(commands)
+    except PasswordHasherBusyError as exc:
+        raise hasher_busy_exception(exc) from exc
+
+    return create_users_result_to_schema(result)
+
+
+async def create_users_async(
+    commands: list[CreateUserCommand], use_case: AsyncCreateUsersUseCase
+) -> CreateUsersResponse:
+    try:
+        result = await use_case.execute(commands)
+    except PasswordHasherBusyError as exc:
+        raise hasher_busy_exception(exc) from exc
+
+    return create_users_result_to_schema(result)
+
+
+def hasher_busy_exception(exc: PasswordHasherBusyError) -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail=str(exc),
+        headers={"Retry-After": str(PASSWORD_HASH_RETRY_AFTER_SECONDS)},
+    )
+
+
+def parse_create_users_body(
+    body: bytes, content_type: str | None
+) -> list[CreateUserCommand]:
+    """Parse a bulk user body sent as a JSON array or as NDJSON."""
+    users = parse_bulk_body(
+        body,
+        content_type,
+        CreateUserRequest,
+        MAX_CREATE_USERS,
+        f"At most {MAX_CREATE_USERS} users per request",
+    )
+    return [request_to_create_user_command(user) for user in users]
+
+
+def request_to_create_user_command(create_user: CreateUserRequest) -> CreateUserCommand:
+    return CreateUserCommand(
+        first_name=create_user.first_name,
+        last_name=create_user.last_name,
+        email=create_user.email,
+        password=create_user.password,
+        shipping_address=create_user.shipping_address,
+    )
+
+
 def result_to_create_user_schema(result: CreateUserResult) -> CreateUserResponse:
     return CreateUserResponse(
         id=result.id,
@@ -50,9 +148,37 @@ def result_to_create_user_schema(result: CreateUserResult) -> CreateUserResponse
     )
 
 
-def list_items_in_cart(user_id, use_case: ListCartItemsUseCase):
-    cart_items = use_case.execute(user_id)
-    return AddToCartResponse(items=list(map(cart_item_result_to_schema, cart_items.items)))
+def create_users_result_to_schema(result: CreateUsersResult) -> CreateUsersResponse:
+    return CreateUsersResponse(
+        created=result.created,
+        conflicts=result.conflicts,
+        users=[
+            CreateUserRowResponse(
+                email=row.email,
+                status=row.status.value,
+                id=row.user.id if row.user is not None else None,
+            )
+            for row in result.rows
+        ],
+    )
+
+
+def list_items_in_cart(user_id, use_case: ListCartItemsUseCase) -> ORJSONResponse:
+    return cart_result_to_response(use_case.execute(user_id))
+
+
+async def list_items_in_cart_async(
+    user_id, use_case: AsyncListCartItemsUseCase
+) -> ORJSONResponse:
+    return cart_result_to_response(await use_case.execute(user_id))
+
+
+def cart_result_to_response(cart: ListCartItemsResult | CartResult) -> ORJSONResponse:
+    """Encode an AddToCartResponse or CartResponse body without building models.
+
+    The result dataclasses have the schema's fields, so orjson encodes them as is.
+    """
+    return ORJSONResponse(cart)
 
 
 def cart_item_result_to_schema(result):
@@ -64,14 +190,26 @@ def add_item_to_cart(
     cart_item: AddToCartRequest,
     use_case: AddItemToCartUseCase,
 ) -> AddToCartResponse:
-    command = AddToCartCommand(
-        user_id=user_id,
-        item_id=cart_item.item_id,
-        quantity=cart_item.quantity,
-    )
+    try:
+        result = use_case.execute(request_to_add_to_cart_command(user_id, cart_item))
+    except UserNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ItemNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except (NotEnoughStockError, ItemAlreadyInCartError) as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+
+    return AddToCartResponse(items=list(map(cart_item_result_to_schema, result.items)))
 
+
+async def add_item_to_cart_async(
+    user_id: int,
+    cart_item: AddToCartRequest,
+    use_case: AsyncAddItemToCartUseCase,
+) -> AddToCartResponse:
     try:
-        result = use_case.execute(command)
+        command = request_to_add_to_cart_command(user_id, cart_item)
+        result = await use_case.execute(command)
     except UserNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except ItemNotFoundError as exc:
@@ -80,3 +218,83 @@ def add_item_to_cart(
         raise HTTPException(status_code=409, detail=str(exc)) from exc
 
     return AddToCartResponse(items=list(map(cart_item_result_to_schema, result.items)))
+
+
+# Status of each line rejected by POST /users/{user_id}/cart/batch, as the
+# single-item endpoint would answer it.
+CART_LINE_ERROR_STATUS = {
+    ItemNotFoundError: 404,
+    NotEnoughStockError: 409,
+    ItemAlreadyInCartError: 409,
+}
+
+
+def add_items_to_cart(
+    user_id, request: AddItemsToCartRequest, use_case: AddItemsToCartUseCase
+) -> AddToCartResponse:
+    command = request_to_add_items_to_cart_command(user_id, request)
+    try:
+        result = use_case.execute(command)
+    except UserNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except CartItemsRejectedError as exc:
+        raise cart_items_rejected_exception(command, exc) from exc
+
+    return AddToCartResponse(items=list(map(cart_item_result_to_schema, result.items)))
+
+
+async def add_items_to_cart_async(
+    user_id, request: AddItemsToCartRequest, use_case: AsyncAddItemsToCartUseCase
+) -> AddToCartResponse:
+    command = request_to_add_items_to_cart_command(user_id, request)
+    try:
+        result = await use_case.execute(command)
+    except UserNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except CartItemsRejectedError as exc:
+        raise cart_items_rejected_exception(command, exc) from exc
+
+    return AddToCartResponse(items=list(map(cart_item_result_to_schema, result.items)))
+
+
+def request_to_add_items_to_cart_command(
+    user_id, request: AddItemsToCartRequest
+) -> AddItemsToCartCommand:
+    if len(request.items) > MAX_ADD_TO_CART_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {MAX_ADD_TO_CART_ITEMS} items per request",
+        )
+    return AddItemsToCartCommand(
+        user_id=user_id,
+        items=[
+            CartLineCommand(item_id=item.item_id, quantity=item.quantity)
+            for item in request.items
+        ],
+    )
+
+
+def cart_items_rejected_exception(
+    command: AddItemsToCartCommand, exc: CartItemsRejectedError
+) -> HTTPException:
+    """Answer 409 with one entry per rejected line; nothing was added."""
+    errors = [
+        CartLineErrorResponse(
+            index=index,
+            item_id=command.items[index].item_id,
+            status=CART_LINE_ERROR_STATUS[type(error)],
+            detail=str(error),
+        )
+        for index, error in sorted(exc.errors.items())
+    ]
+    return HTTPException(status_code=409, detail=jsonable_encoder(errors))
+
+
+def request_to_add_to_cart_command(
+    user_id, cart_item: AddToCartRequest
+) -> AddToCartCommand:
+    return AddToCartCommand(
+        user_id=user_id,
+        item_id=cart_item.item_id,
+        quantity=cart_item.quantity,
+    )
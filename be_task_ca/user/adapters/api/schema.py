@@ -1,7 +1,8 @@
+from datetime import datetime
 from typing import List
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, conint, conlist
 
 
 class CreateUserRequest(BaseModel):
@@ -20,10 +21,46 @@ class CreateUserResponse(BaseModel):
     shipping_address: str | None
 
 
+class CreateUserRowResponse(BaseModel):
+    email: str
+    status: str
+    id: UUID | None = None
+
+
+class CreateUsersResponse(BaseModel):
+    created: int
+    conflicts: int
+    users: List[CreateUserRowResponse]
+
+
 class AddToCartRequest(BaseModel):
     item_id: UUID
-    quantity: int
+    quantity: conint(gt=0)
 
 
 class AddToCartResponse(BaseModel):
     items: List[AddToCartRequest]
+
+
+class AddItemsToCartRequest(BaseModel):
+    items: conlist(AddToCartRequest, min_items=1)
+
+
+class CartLineErrorResponse(BaseModel):
+    index: int
+    item_id: UUID
+    status: int
+    detail: str
+
+
+class CartLineResponse(AddToCartRequest):
+    name: str
+    price: float
+    line_total: float
+    # The line is removed from the cart, and its stock released, at this time.
+    expires_at: datetime | None
+
+
+class CartResponse(BaseModel):
+    items: List[CartLineResponse]
+    total: float
@@ -0,0 +1 @@
+"""User cache adapter package."""
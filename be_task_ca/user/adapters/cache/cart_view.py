@@ -0,0 +1,175 @@
+"""Read-through caching decorators for the cart read model."""
+
+import threading
+from collections import defaultdict
+from typing import Iterable
+from uuid import UUID
+
+from be_task_ca.cache import TieredCache, TTLCache
+from be_task_ca.item.adapters.db.events import item_detail_changes
+from be_task_ca.settings import settings
+from be_task_ca.user.adapters.db.events import cart_changes
+from be_task_ca.user.application.dto import CartLineView
+from be_task_ca.user.application.interfaces.cart_view_reader_interface import (
+    AsyncCartViewReaderInterface,
+    CartViewReaderInterface,
+)
+
+
+def cart_view_cache_key(user_id: UUID) -> str:
+    return f"cart_view:{user_id}"
+
+
+class CartViewCache:
+    """Per-user cart lines, dropped when the cart or one of its items changes.
+
+    A read that started before a write can finish after the write's
+    invalidation. Each read is registered with `begin_fill`; invalidating a
+    user cancels that user's reads in flight, and `set` skips storing the
+    lines of a cancelled one, which may predate the write. A read does not yet
+    know the items it loads, so an item change cancels every read in flight.
+
+    The index from items to the users whose cached carts hold them is bounded
+    to twice the cache size; a cart dropped from it is no longer invalidated
+    by item changes and may show stale item details until its TTL expires.
+    """
+
+    def __init__(self, cache: TieredCache) -> None:
+        self._cache = cache
+        self._fills: defaultdict[UUID, set[int]] = defaultdict(set)
+        self._last_fill = 0
+        self._max_indexed = 2 * cache.local.maxsize
+        self._cart_items: dict[UUID, tuple[UUID, ...]] = {}
+        self._holders: defaultdict[UUID, set[UUID]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def get(self, user_id: UUID) -> list[CartLineView] | None:
+        lines = self._cache.get(cart_view_cache_key(user_id))
+        return None if lines is None else list(lines)
+
+    def begin_fill(self, user_id: UUID) -> int:
+        """Register a read of the user's cart lines; pass the token to `set`."""
+        with self._lock:
+            self._last_fill += 1
+            self._fills[user_id].add(self._last_fill)
+            return self._last_fill
+
+    def end_fill(self, user_id: UUID, fill: int) -> None:
+        with self._lock:
+            self._discard_fill(user_id, fill)
+
+    def set(self, user_id: UUID, lines: list[CartLineView], fill: int) -> None:
+        with self._lock:
+            if fill not in self._fills.get(user_id, ()):
+                return
+            self._discard_fill(user_id, fill)
+            self._unindex(user_id)
+            self._cart_items[user_id] = tuple(line.item_id for line in lines)
+            for line in lines:
+                self._holders[line.item_id].add(user_id)
+            while len(self._cart_items) > self._max_indexed:
+                self._unindex(next(iter(self._cart_items)))
+            self._cache.set(cart_view_cache_key(user_id), tuple(lines))
+
+    def invalidate_users(self, user_ids: Iterable[UUID]) -> None:
+        with self._lock:
+            for user_id in user_ids:
+                self._invalidate(user_id)
+
+    def invalidate_items(self, item_ids: Iterable[UUID]) -> None:
+        """Drop the cached carts holding any of `item_ids`."""
+        with self._lock:
+            user_ids = set(self._fills)
+            for item_id in item_ids:
+                user_ids.update(self._holders.get(item_id, ()))
+            for user_id in user_ids:
+                self._invalidate(user_id)
+
+    def _invalidate(self, user_id: UUID) -> None:
+        self._fills.pop(user_id, None)
+        self._unindex(user_id)
+        self._cache.delete(cart_view_cache_key(user_id))
+
+    def _discard_fill(self, user_id: UUID, fill: int) -> None:
+        fills = self._fills.get(user_id)
+        if fills is not None:
+            fills.discard(fill)
+            if not fills:
+                del self._fills[user_id]
+
+    def _unindex(self, user_id: UUID) -> None:
+        for item_id in self._cart_items.pop(user_id, ()):
+            holders = self._holders[item_id]
+            holders.discard(user_id)
+            if not holders:
+                del self._holders[item_id]
+
+
+class CachingCartViewReader(CartViewReaderInterface):
+    """Serve cart lines from cache, falling back to the wrapped reader."""
+
+    def __init__(self, inner: CartViewReaderInterface, cache: CartViewCache) -> None:
+        self._inner = inner
+        self._cache = cache
+
+    def get_cart_lines(self, user_id: UUID) -> list[CartLineView]:
+        lines = self._cache.get(user_id)
+        if lines is None:
+            fill = self._cache.begin_fill(user_id)
+            try:
+                lines = self._inner.get_cart_lines(user_id)
+                self._cache.set(user_id, lines, fill)
+            finally:
+                self._cache.end_fill(user_id, fill)
+        return lines
+
+
+class AsyncCachingCartViewReader(AsyncCartViewReaderInterface):
+    """Async variant of CachingCartViewReader."""
+
+    def __init__(
+        self, inner: AsyncCartViewReaderInterface, cache: CartViewCache
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+
+    async def get_cart_lines(self, user_id: UUID) -> list[CartLineView]:
+        lines = self._cache.get(user_id)
+        if lines is None:
+            fill = self._cache.begin_fill(user_id)
+            try:
+                lines = await self._inner.get_cart_lines(user_id)
+                self._cache.set(user_id, lines, fill)
+            finally:
+                self._cache.end_fill(user_id, fill)
+        return lines
+
+
+cart_view_cache = CartViewCache(
+    TieredCache(
+        TTLCache(
+            "cart_view",
+            maxsize=settings.cart_view_cache_size,
+            ttl=settings.cart_view_cache_ttl_seconds,
+        )
+    )
+)
+cart_changes.subscribe(cart_view_cache.invalidate_users)
+# The cart view shows item names and prices, not stock: reservations do not
+# invalidate it.
+item_detail_changes.subscribe(cart_view_cache.invalidate_items)
+
+
+def cached_cart_view_reader(inner: CartViewReaderInterface) -> CartViewReaderInterface:
+    """Wrap a reader with the process-wide cart view cache when it is enabled."""
+    if not settings.cart_view_cache_enabled:
+        return inner
+    return CachingCartViewReader(inner, cart_view_cache)
+
+
+def async_cached_cart_view_reader(
+    inner: AsyncCartViewReaderInterface,
+) -> AsyncCartViewReaderInterface:
+    if not settings.cart_view_cache_enabled:
+        return inner
+    return AsyncCachingCartViewReader(inner, cart_view_cache)
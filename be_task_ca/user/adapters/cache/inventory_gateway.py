@@ -0,0 +1,253 @@
+"""Read-through caching decorators for the inventory gateway."""
+
+import threading
+from collections import defaultdict
+from dataclasses import replace
+from typing import Iterable
+from uuid import UUID
+
+from be_task_ca.cache import TieredCache, TTLCache
+from be_task_ca.item.adapters.db.events import item_changes
+from be_task_ca.settings import settings
+from be_task_ca.user.application.interfaces.inventory_gateway_interface import (
+    AsyncInventoryGatewayInterface,
+    InventoryGatewayInterface,
+    InventoryItemSnapshot,
+    InventoryReservation,
+)
+
+
+def inventory_cache_key(item_id: UUID) -> str:
+    return f"inventory:{item_id}"
+
+
+class InventoryCache:
+    """Item snapshots by id, dropped when the item is written.
+
+    A read that started before a write can finish after the write's
+    invalidation. Each read is registered with `begin_fill`; invalidating an
+    item cancels the reads of it in flight, and `set` skips storing the
+    snapshot of a cancelled one, which may predate the write.
+    """
+
+    def __init__(self, cache: TieredCache) -> None:
+        self._cache = cache
+        self._fills: defaultdict[UUID, set[int]] = defaultdict(set)
+        self._last_fill = 0
+        self._lock = threading.Lock()
+
+    def get(self, item_id: UUID) -> InventoryItemSnapshot | None:
+        return self._cache.get(inventory_cache_key(item_id))
+
+    def begin_fill(self, item_ids: Iterable[UUID]) -> int:
+        """Register a read of `item_ids`; pass the returned token to `set`."""
+        with self._lock:
+            self._last_fill += 1
+            for item_id in item_ids:
+                self._fills[item_id].add(self._last_fill)
+            return self._last_fill
+
+    def end_fill(self, item_ids: Iterable[UUID], fill: int) -> None:
+        with self._lock:
+            for item_id in item_ids:
+                fills = self._fills.get(item_id)
+                if fills is not None:
+                    fills.discard(fill)
+                    if not fills:
+                        del self._fills[item_id]
+
+    def set(self, item_id: UUID, item: InventoryItemSnapshot, fill: int) -> None:
+        with self._lock:
+            if fill in self._fills.get(item_id, ()):
+                self._cache.set(inventory_cache_key(item_id), item)
+
+    def invalidate(self, item_ids: Iterable[UUID]) -> None:
+        with self._lock:
+            for item_id in item_ids:
+                self._fills.pop(item_id, None)
+                self._cache.delete(inventory_cache_key(item_id))
+
+
+class CachingInventoryGateway(InventoryGatewayInterface):
+    """Serve item snapshots from cache, falling back to the wrapped gateway.
+
+    With `bypass_quantity` the descriptive fields still come from cache but
+    the stock level is always read from the wrapped gateway.
+    """
+
+    def __init__(
+        self,
+        inner: InventoryGatewayInterface,
+        cache: InventoryCache,
+        bypass_quantity: bool = False,
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._bypass_quantity = bypass_quantity
+
+    def find_item_by_id(self, item_id: UUID) -> InventoryItemSnapshot | None:
+        item = self._cache.get(item_id)
+        if item is None:
+            fill = self._cache.begin_fill([item_id])
+            try:
+                item = self._inner.find_item_by_id(item_id)
+                if item is not None:
+                    self._cache.set(item_id, item, fill)
+            finally:
+                self._cache.end_fill([item_id], fill)
+            return item
+
+        if self._bypass_quantity:
+            quantity = self._inner.find_item_quantity(item_id)
+            if quantity is None:
+                self._cache.invalidate([item_id])
+                return None
+            return replace(item, quantity=quantity)
+        return item
+
+    def find_items_by_ids(
+        self, item_ids: Iterable[UUID]
+    ) -> dict[UUID, InventoryItemSnapshot]:
+        item_ids = list(dict.fromkeys(item_ids))
+        if self._bypass_quantity:
+            # The stock has to be read anyway, so the query fetches whole rows.
+            missing, items = item_ids, {}
+        else:
+            missing, items = _split_cached(self._cache, item_ids)
+        if missing:
+            fill = self._cache.begin_fill(missing)
+            try:
+                loaded = self._inner.find_items_by_ids(missing)
+                for item_id, item in loaded.items():
+                    self._cache.set(item_id, item, fill)
+            finally:
+                self._cache.end_fill(missing, fill)
+            items.update(loaded)
+        return items
+
+    def find_item_quantity(self, item_id: UUID) -> int | None:
+        return self._inner.find_item_quantity(item_id)
+
+    def reserve_stock(
+        self, item_id: UUID, holder_id: UUID, quantity: int
+    ) -> InventoryReservation | None:
+        return self._inner.reserve_stock(item_id, holder_id, quantity)
+
+    def reserve_stocks(
+        self, holder_id: UUID, quantities: dict[UUID, int]
+    ) -> list[InventoryReservation] | None:
+        return self._inner.reserve_stocks(holder_id, quantities)
+
+
+class AsyncCachingInventoryGateway(AsyncInventoryGatewayInterface):
+    """Async variant of CachingInventoryGateway."""
+
+    def __init__(
+        self,
+        inner: AsyncInventoryGatewayInterface,
+        cache: InventoryCache,
+        bypass_quantity: bool = False,
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._bypass_quantity = bypass_quantity
+
+    async def find_item_by_id(self, item_id: UUID) -> InventoryItemSnapshot | None:
+        item = self._cache.get(item_id)
+        if item is None:
+            fill = self._cache.begin_fill([item_id])
+            try:
+                item = await self._inner.find_item_by_id(item_id)
+                if item is not None:
+                    self._cache.set(item_id, item, fill)
+            finally:
+                self._cache.end_fill([item_id], fill)
+            return item
+
+        if self._bypass_quantity:
+            quantity = await self._inner.find_item_quantity(item_id)
+            if quantity is None:
+                self._cache.invalidate([item_id])
+                return None
+            return replace(item, quantity=quantity)
+        return item
+
+    async def find_items_by_ids(
+        self, item_ids: Iterable[UUID]
+    ) -> dict[UUID, InventoryItemSnapshot]:
+        item_ids = list(dict.fromkeys(item_ids))
+        if self._bypass_quantity:
+            # The stock has to be read anyway, so the query fetches whole rows.
+            missing, items = item_ids, {}
+        else:
+            missing, items = _split_cached(self._cache, item_ids)
+        if missing:
+            fill = self._cache.begin_fill(missing)
+            try:
+                loaded = await self._inner.find_items_by_ids(missing)
+                for item_id, item in loaded.items():
+                    self._cache.set(item_id, item, fill)
+            finally:
+                self._cache.end_fill(missing, fill)
+            items.update(loaded)
+        return items
+
+    async def find_item_quantity(self, item_id: UUID) -> int | None:
+        return await self._inner.find_item_quantity(item_id)
+
+    async def reserve_stock(
+        self, item_id: UUID, holder_id: UUID, quantity: int
+    ) -> InventoryReservation | None:
+        return await self._inner.reserve_stock(item_id, holder_id, quantity)
+
+    async def reserve_stocks(
+        self, holder_id: UUID, quantities: dict[UUID, int]
+    ) -> list[InventoryReservation] | None:
+        return await self._inner.reserve_stocks(holder_id, quantities)
+
+
+def _split_cached(
+    cache: InventoryCache, item_ids: list[UUID]
+) -> tuple[list[UUID], dict[UUID, InventoryItemSnapshot]]:
+    """Split `item_ids` into those missing from `cache` and the cached items."""
+    missing, items = [], {}
+    for item_id in item_ids:
+        item = cache.get(item_id)
+        if item is None:
+            missing.append(item_id)
+        else:
+            items[item_id] = item
+    return missing, items
+
+
+inventory_cache = InventoryCache(
+    TieredCache(
+        TTLCache(
+            "inventory",
+            maxsize=settings.inventory_cache_size,
+            ttl=settings.inventory_cache_ttl_seconds,
+        )
+    )
+)
+item_changes.subscribe(inventory_cache.invalidate)
+
+
+def cached_inventory_gateway(
+    inner: InventoryGatewayInterface,
+) -> InventoryGatewayInterface:
+    """Wrap a gateway with the process-wide inventory cache when it is enabled."""
+    if not settings.inventory_cache_enabled:
+        return inner
+    return CachingInventoryGateway(
+        inner, inventory_cache, bypass_quantity=settings.inventory_cache_bypass_quantity
+    )
+
+
+def async_cached_inventory_gateway(
+    inner: AsyncInventoryGatewayInterface,
+) -> AsyncInventoryGatewayInterface:
+    if not settings.inventory_cache_enabled:
+        return inner
+    return AsyncCachingInventoryGateway(
+        inner, inventory_cache, bypass_quantity=settings.inventory_cache_bypass_quantity
+    )
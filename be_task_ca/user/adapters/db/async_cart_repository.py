@@ -0,0 +1,116 @@
+"""Async SQLAlchemy-backed cart repository adapter."""
+
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from be_task_ca.events import ChangeNotifier
+from be_task_ca.observability.instrument import counted_repository
+from be_task_ca.transactions import notify_after_commit
+from be_task_ca.user.application.interfaces.cart_repository_interface import (
+    AddItemsToCartAttempt,
+    AddToCartAttempt,
+    AddToCartOutcome,
+    AsyncCartRepositoryInterface,
+)
+from be_task_ca.user.domain.entities import CartItemEntity
+from be_task_ca.user.adapters.db.model import CartItem
+
+from .cart_queries import (
+    add_items_attempt,
+    add_to_cart_checks_statement,
+    add_to_cart_outcome,
+    add_to_cart_statement,
+    insert_cart_items_skipping_conflicts,
+    rows_to_attempt,
+    user_cart_statement,
+)
+from .events import cart_changes
+from .mappers import (
+    CART_ITEM_COLUMNS,
+    cart_item_entity_to_model,
+    cart_item_entity_to_row,
+    cart_item_model_to_entity,
+)
+
+
+@counted_repository
+class AsyncSqlAlchemyCartRepository(AsyncCartRepositoryInterface):
+    """AsyncSession implementation of async cart repository interface."""
+
+    def __init__(
+        self, db: AsyncSession, notifier: ChangeNotifier = cart_changes
+    ) -> None:
+        self._db = db
+        self._notifier = notifier
+
+    async def find_cart_items_for_user_id(self, user_id: UUID) -> list[CartItemEntity]:
+        rows = await self._db.execute(
+            select(*CART_ITEM_COLUMNS).where(CartItem.user_id == user_id)
+        )
+        return [CartItemEntity(*row) for row in rows]
+
+    async def save_cart_item(self, cart_item: CartItemEntity) -> CartItemEntity:
+        model = cart_item_entity_to_model(cart_item)
+        self._db.add(model)
+        await self._db.flush()
+        notify_after_commit(self._db, self._notifier, [cart_item.user_id])
+        return cart_item_model_to_entity(model)
+
+    async def add_item_to_cart(self, cart_item: CartItemEntity) -> AddToCartAttempt:
+        dialect_name = self._db.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            result = await self._db.execute(add_to_cart_statement(cart_item))
+            attempt = rows_to_attempt(cart_item, result.all())
+            if attempt.outcome is AddToCartOutcome.ADDED:
+                notify_after_commit(self._db, self._notifier, [cart_item.user_id])
+            return attempt
+
+        result = await self._db.execute(add_to_cart_checks_statement(cart_item))
+        checks = result.one()
+        outcome = add_to_cart_outcome(
+            checks.user_found, checks.stock, cart_item.quantity, not checks.in_cart
+        )
+        if outcome is AddToCartOutcome.ADDED:
+            inserted = await self._db.scalar(
+                insert_cart_items_skipping_conflicts(dialect_name),
+                cart_item_entity_to_row(cart_item),
+            )
+            if inserted is None:
+                outcome = AddToCartOutcome.ALREADY_IN_CART
+            else:
+                notify_after_commit(self._db, self._notifier, [cart_item.user_id])
+        return AddToCartAttempt(
+            outcome=outcome,
+            cart_items=await self.find_cart_items_for_user_id(cart_item.user_id),
+        )
+
+    async def add_items_to_cart(
+        self, user_id: UUID, cart_items: list[CartItemEntity]
+    ) -> AddItemsToCartAttempt:
+        rows = (await self._db.execute(user_cart_statement(user_id))).all()
+        attempt = add_items_attempt(user_id, cart_items, rows)
+        if attempt.outcome is not AddToCartOutcome.ADDED:
+            return attempt
+
+        statement = insert_cart_items_skipping_conflicts(
+            self._db.get_bind().dialect.name
+        )
+        inserted = set(
+            await self._db.scalars(
+                statement, [cart_item_entity_to_row(item) for item in cart_items]
+            )
+        )
+        if len(inserted) < len(cart_items):
+            # A concurrent request added some of the items first.
+            return AddItemsToCartAttempt(
+                outcome=AddToCartOutcome.ALREADY_IN_CART,
+                cart_items=[
+                    item
+                    for item in await self.find_cart_items_for_user_id(user_id)
+                    if item.item_id not in inserted
+                ],
+            )
+        notify_after_commit(self._db, self._notifier, [user_id])
+        return attempt
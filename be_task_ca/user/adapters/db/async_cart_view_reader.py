@@ -0,0 +1,25 @@
+"""Async SQLAlchemy-backed cart read model adapter."""
+
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from be_task_ca.observability.instrument import counted_repository
+from be_task_ca.user.application.dto import CartLineView
+from be_task_ca.user.application.interfaces.cart_view_reader_interface import (
+    AsyncCartViewReaderInterface,
+)
+
+from .cart_queries import cart_lines_statement, row_to_cart_line
+
+
+@counted_repository
+class AsyncSqlAlchemyCartViewReader(AsyncCartViewReaderInterface):
+    """AsyncSession implementation of the cart read model."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    async def get_cart_lines(self, user_id: UUID) -> list[CartLineView]:
+        rows = await self._db.execute(cart_lines_statement(user_id))
+        return [row_to_cart_line(row) for row in rows]
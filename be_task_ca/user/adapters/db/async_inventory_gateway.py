@@ -0,0 +1,111 @@
+"""Async SQLAlchemy-backed inventory gateway adapter for user/cart context."""
+
+from datetime import timedelta
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from be_task_ca.events import ChangeNotifier
+from be_task_ca.item.adapters.db.events import item_changes
+from be_task_ca.item.adapters.db.model import Item
+from be_task_ca.observability.instrument import counted_repository
+from be_task_ca.transactions import notify_after_commit
+from be_task_ca.user.application.interfaces.inventory_gateway_interface import (
+    AsyncInventoryGatewayInterface,
+    InventoryItemSnapshot,
+    InventoryReservation,
+)
+
+from .inventory_queries import items_by_ids_statement, rows_to_snapshots
+from .reservations import (
+    DEFAULT_RESERVATION_TTL,
+    new_reservation,
+    reservation_model_to_dto,
+    reserve_stock_statement,
+    reserve_stocks_statement,
+)
+
+
+@counted_repository
+class AsyncSqlAlchemyInventoryGateway(AsyncInventoryGatewayInterface):
+    """Inventory gateway implementation using local AsyncSession."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        reservation_ttl: timedelta = DEFAULT_RESERVATION_TTL,
+        notifier: ChangeNotifier = item_changes,
+    ) -> None:
+        self._db = db
+        self._reservation_ttl = reservation_ttl
+        self._notifier = notifier
+
+    async def find_item_by_id(self, item_id: UUID) -> InventoryItemSnapshot | None:
+        model = await self._db.scalar(select(Item).where(Item.id == item_id))
+        if model is None:
+            return None
+
+        return InventoryItemSnapshot(
+            id=model.id,
+            name=model.name,
+            description=model.description,
+            price=model.price,
+            quantity=model.quantity,
+        )
+
+    async def find_items_by_ids(
+        self, item_ids: Iterable[UUID]
+    ) -> dict[UUID, InventoryItemSnapshot]:
+        item_ids = list(dict.fromkeys(item_ids))
+        if not item_ids:
+            return {}
+        dialect_name = self._db.get_bind().dialect.name
+        rows = await self._db.execute(items_by_ids_statement(dialect_name, item_ids))
+        return rows_to_snapshots(rows)
+
+    async def find_item_quantity(self, item_id: UUID) -> int | None:
+        return await self._db.scalar(select(Item.quantity).where(Item.id == item_id))
+
+    async def reserve_stock(
+        self, item_id: UUID, holder_id: UUID, quantity: int
+    ) -> InventoryReservation | None:
+        result = await self._db.execute(reserve_stock_statement(item_id, quantity))
+        if result.rowcount != 1:
+            return None
+
+        model = new_reservation(item_id, holder_id, quantity, self._reservation_ttl)
+        self._db.add(model)
+        reservation = reservation_model_to_dto(model)
+        await self._db.flush()
+        notify_after_commit(self._db, self._notifier, [item_id])
+        return reservation
+
+    async def reserve_stocks(
+        self, holder_id: UUID, quantities: dict[UUID, int]
+    ) -> list[InventoryReservation] | None:
+        if not quantities:
+            return []
+        if self._db.get_bind().dialect.name == "postgresql":
+            result = await self._db.execute(reserve_stocks_statement(quantities))
+            reserved = result.rowcount
+        else:
+            reserved = 0
+            for item_id, quantity in quantities.items():
+                result = await self._db.execute(
+                    reserve_stock_statement(item_id, quantity)
+                )
+                reserved += result.rowcount
+        if reserved != len(quantities):
+            return None
+
+        models = [
+            new_reservation(item_id, holder_id, quantity, self._reservation_ttl)
+            for item_id, quantity in quantities.items()
+        ]
+        self._db.add_all(models)
+        reservations = [reservation_model_to_dto(model) for model in models]
+        await self._db.flush()
+        notify_after_commit(self._db, self._notifier, list(quantities))
+        return reservations
@@ -0,0 +1,67 @@
+"""Async SQLAlchemy-backed user repository adapter."""
+
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from be_task_ca.observability.instrument import counted_repository
+from be_task_ca.user.application.interfaces.user_repository_interface import (
+    AsyncUserRepositoryInterface,
+)
+from be_task_ca.user.domain.entities import UserEntity
+from be_task_ca.user.adapters.db.model import User
+
+from .mappers import user_item_entity_to_model, user_item_model_to_entity
+from .user_queries import (
+    entity_to_row,
+    existing_emails_statement,
+    insert_users_skipping_conflicts,
+    row_to_entity,
+)
+
+
+@counted_repository
+class AsyncSqlAlchemyUserRepository(AsyncUserRepositoryInterface):
+    """AsyncSession implementation of async user repository interface."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    async def save_user(self, user: UserEntity) -> UserEntity:
+        model = user_item_entity_to_model(user)
+        self._db.add(model)
+        await self._db.flush()
+        return user_item_model_to_entity(model)
+
+    async def save_user_if_absent(self, user: UserEntity) -> UserEntity | None:
+        statement = insert_users_skipping_conflicts(self._db.get_bind().dialect.name)
+        row = (await self._db.execute(statement, entity_to_row(user))).first()
+        return None if row is None else row_to_entity(row)
+
+    async def save_users(self, users: list[UserEntity]) -> list[UserEntity]:
+        if not users:
+            return []
+        statement = insert_users_skipping_conflicts(self._db.get_bind().dialect.name)
+        rows = await self._db.execute(
+            statement, [entity_to_row(user) for user in users]
+        )
+        return [row_to_entity(row) for row in rows]
+
+    async def find_existing_emails(self, emails: list[str]) -> set[str]:
+        if not emails:
+            return set()
+        statement = existing_emails_statement(self._db.get_bind().dialect.name, emails)
+        return set(await self._db.scalars(statement))
+
+    async def find_user_by_email(self, email: str) -> UserEntity | None:
+        model = await self._db.scalar(select(User).where(User.email == email))
+        if model is None:
+            return None
+        return user_item_model_to_entity(model)
+
+    async def find_user_by_id(self, user_id: UUID) -> UserEntity | None:
+        model = await self._db.scalar(select(User).where(User.id == user_id))
+        if model is None:
+            return None
+        return user_item_model_to_entity(model)
@@ -0,0 +1,203 @@
+"""SQL statements shared by the sync and async cart repositories."""
+
+from datetime import timezone
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import (
+    Insert,
+    Select,
+    exists,
+    func,
+    literal,
+    select,
+    true,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from be_task_ca.inserts import insert_skipping_conflicts
+from be_task_ca.item.adapters.db.model import Item, StockReservation
+from be_task_ca.user.adapters.db.model import CartItem, User
+from be_task_ca.user.application.interfaces.cart_repository_interface import (
+    AddItemsToCartAttempt,
+    AddToCartAttempt,
+    AddToCartOutcome,
+)
+from be_task_ca.user.application.dto import CartLineView
+from be_task_ca.user.domain.entities import CartItemEntity
+
+_cart_items = CartItem.__table__
+
+
+def add_to_cart_statement(cart_item: CartItemEntity) -> Select:
+    """Build the single Postgres statement behind add-to-cart.
+
+    Looks up the user and item, inserts the cart row when the stock suffices
+    (a duplicate is swallowed by ON CONFLICT) and returns one row per cart item,
+    each carrying the check results. The existing-cart branch is read from the
+    statement snapshot, so the freshly inserted row is appended from RETURNING.
+    """
+    target_user = select(User.id).where(User.id == cart_item.user_id).cte("target_user")
+    target_item = (
+        select(Item.id, Item.quantity).where(Item.id == cart_item.item_id)
+    ).cte("target_item")
+    inserted = (
+        pg_insert(CartItem)
+        .from_select(
+            ["user_id", "item_id", "quantity"],
+            select(target_user.c.id, target_item.c.id, literal(cart_item.quantity))
+            .select_from(target_user.join(target_item, true()))
+            .where(target_item.c.quantity >= cart_item.quantity),
+        )
+        .on_conflict_do_nothing()
+        .returning(CartItem.item_id, CartItem.quantity)
+        .cte("inserted")
+    )
+    cart = union_all(
+        select(CartItem.item_id, CartItem.quantity).where(
+            CartItem.user_id == cart_item.user_id
+        ),
+        select(inserted.c.item_id, inserted.c.quantity),
+    ).cte("cart")
+    status = select(
+        exists(select(target_user.c.id)).label("user_found"),
+        select(target_item.c.quantity).scalar_subquery().label("stock"),
+        exists(select(inserted.c.item_id)).label("inserted"),
+    ).cte("status")
+    return select(
+        status.c.user_found,
+        status.c.stock,
+        status.c.inserted,
+        cart.c.item_id,
+        cart.c.quantity,
+    ).select_from(status.outerjoin(cart, true()))
+
+
+def insert_cart_items_skipping_conflicts(dialect_name: str) -> Insert:
+    """`INSERT ... ON CONFLICT DO NOTHING RETURNING item_id` for the given dialect.
+
+    A cart item that is already in the cart is skipped instead of failing,
+    which would abort the surrounding transaction on Postgres.
+    """
+    return insert_skipping_conflicts(
+        _cart_items, dialect_name, [_cart_items.c.user_id, _cart_items.c.item_id]
+    ).returning(_cart_items.c.item_id)
+
+
+def cart_lines_statement(user_id: UUID) -> Select:
+    """Select a user's cart items joined with their items, in item name order.
+
+    Each line carries the expiry of the stock reservation behind it, after
+    which the sweeper drops the line; NULL when nothing is reserved for it.
+    """
+    reservation_expiry = (
+        select(func.min(StockReservation.expires_at))
+        .where(
+            StockReservation.holder_id == CartItem.user_id,
+            StockReservation.item_id == CartItem.item_id,
+        )
+        .correlate(CartItem)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            CartItem.item_id,
+            Item.name,
+            Item.price,
+            CartItem.quantity,
+            reservation_expiry.label("expires_at"),
+        )
+        .join(Item, Item.id == CartItem.item_id)
+        .where(CartItem.user_id == user_id)
+        .order_by(Item.name, CartItem.item_id)
+    )
+
+
+def row_to_cart_line(row) -> CartLineView:
+    expires_at = row.expires_at
+    if expires_at is not None and expires_at.tzinfo is None:
+        # SQLite drops the offset; reservations are written in UTC.
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return CartLineView(row.item_id, row.name, row.price, row.quantity, expires_at)
+
+
+def user_cart_statement(user_id: UUID) -> Select:
+    """Select a user's cart items; no row means no user, a NULL item an empty cart."""
+    return (
+        select(CartItem.item_id, CartItem.quantity)
+        .select_from(User)
+        .outerjoin(CartItem, CartItem.user_id == User.id)
+        .where(User.id == user_id)
+    )
+
+
+def add_items_attempt(
+    user_id: UUID, cart_items: list[CartItemEntity], rows: Iterable
+) -> AddItemsToCartAttempt:
+    """Check `cart_items` against the rows of `user_cart_statement`.
+
+    On ADDED the returned cart already includes `cart_items`, which the caller
+    still has to insert.
+    """
+    rows = list(rows)
+    if not rows:
+        return AddItemsToCartAttempt(AddToCartOutcome.USER_NOT_FOUND, [])
+    cart = [
+        CartItemEntity(user_id=user_id, item_id=row.item_id, quantity=row.quantity)
+        for row in rows
+        if row.item_id is not None
+    ]
+    in_cart = {item.item_id for item in cart}
+    if any(cart_item.item_id in in_cart for cart_item in cart_items):
+        return AddItemsToCartAttempt(AddToCartOutcome.ALREADY_IN_CART, cart)
+    return AddItemsToCartAttempt(AddToCartOutcome.ADDED, cart + list(cart_items))
+
+
+def add_to_cart_checks_statement(cart_item: CartItemEntity) -> Select:
+    """Build the portable single-row pre-check used where writable CTEs are missing."""
+    return select(
+        exists().where(User.id == cart_item.user_id).label("user_found"),
+        select(Item.quantity)
+        .where(Item.id == cart_item.item_id)
+        .scalar_subquery()
+        .label("stock"),
+        exists()
+        .where(
+            CartItem.user_id == cart_item.user_id,
+            CartItem.item_id == cart_item.item_id,
+        )
+        .label("in_cart"),
+    )
+
+
+def add_to_cart_outcome(
+    user_found: bool, stock: int | None, requested: int, added: bool
+) -> AddToCartOutcome:
+    if not user_found:
+        return AddToCartOutcome.USER_NOT_FOUND
+    if stock is None:
+        return AddToCartOutcome.ITEM_NOT_FOUND
+    if stock < requested:
+        return AddToCartOutcome.NOT_ENOUGH_STOCK
+    if not added:
+        return AddToCartOutcome.ALREADY_IN_CART
+    return AddToCartOutcome.ADDED
+
+
+def rows_to_attempt(cart_item: CartItemEntity, rows: Iterable) -> AddToCartAttempt:
+    """Fold the rows of `add_to_cart_statement` into an AddToCartAttempt."""
+    rows = list(rows)
+    status = rows[0]
+    return AddToCartAttempt(
+        outcome=add_to_cart_outcome(
+            status.user_found, status.stock, cart_item.quantity, status.inserted
+        ),
+        cart_items=[
+            CartItemEntity(
+                user_id=cart_item.user_id, item_id=row.item_id, quantity=row.quantity
+            )
+            for row in rows
+            if row.item_id is not None
+        ],
+    )
@@ -0,0 +1,25 @@
+"""SQLAlchemy-backed cart read model adapter."""
+
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from be_task_ca.observability.instrument import counted_repository
+from be_task_ca.user.application.dto import CartLineView
+from be_task_ca.user.application.interfaces.cart_view_reader_interface import (
+    CartViewReaderInterface,
+)
+
+from .cart_queries import cart_lines_statement, row_to_cart_line
+
+
+@counted_repository
+class SqlAlchemyCartViewReader(CartViewReaderInterface):
+    """Read a user's cart lines with one join of `cart_items` and `items`."""
+
+    def __init__(self, db: Session) -> None:
+        self._db = db
+
+    def get_cart_lines(self, user_id: UUID) -> list[CartLineView]:
+        rows = self._db.execute(cart_lines_statement(user_id))
+        return [row_to_cart_line(row) for row in rows]
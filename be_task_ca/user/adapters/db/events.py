@@ -0,0 +1,6 @@
+"""In-process notifications fired after cart rows are written."""
+
+from be_task_ca.events import ChangeNotifier
+
+# Listeners receive the ids of the users whose carts were committed.
+cart_changes = ChangeNotifier()
@@ -1,21 +1,45 @@
 """SQLAlchemy-backed inventory gateway adapter for user/cart context."""
 
+from datetime import timedelta
+from typing import Iterable
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from be_task_ca.events import ChangeNotifier
+from be_task_ca.item.adapters.db.events import item_changes
 from be_task_ca.item.adapters.db.model import Item
+from be_task_ca.observability.instrument import counted_repository
+from be_task_ca.transactions import notify_after_commit
 from be_task_ca.user.application.interfaces.inventory_gateway_interface import (
     InventoryItemSnapshot,
     InventoryGatewayInterface,
+    InventoryReservation,
+)
+
+from .inventory_queries import items_by_ids_statement, rows_to_snapshots
+from .reservations import (
+    DEFAULT_RESERVATION_TTL,
+    new_reservation,
+    reservation_model_to_dto,
+    reserve_stock_statement,
+    reserve_stocks_statement,
 )
 
 
+@counted_repository
 class SqlAlchemyInventoryGateway(InventoryGatewayInterface):
     """Inventory gateway implementation using local SQLAlchemy session."""
 
-    def __init__(self, db: Session) -> None:
+    def __init__(
+        self,
+        db: Session,
+        reservation_ttl: timedelta = DEFAULT_RESERVATION_TTL,
+        notifier: ChangeNotifier = item_changes,
+    ) -> None:
         self._db = db
+        self._reservation_ttl = reservation_ttl
+        self._notifier = notifier
 
     def find_item_by_id(self, item_id: UUID) -> InventoryItemSnapshot | None:
         model = self._db.query(Item).filter(Item.id == item_id).first()
@@ -29,3 +53,55 @@ class SqlAlchemyInventoryGateway(InventoryGatewayInterface):
             price=model.price,
             quantity=model.quantity,
         )
+
+    def find_items_by_ids(
+        self, item_ids: Iterable[UUID]
+    ) -> dict[UUID, InventoryItemSnapshot]:
+        item_ids = list(dict.fromkeys(item_ids))
+        if not item_ids:
+            return {}
+        dialect_name = self._db.get_bind().dialect.name
+        rows = self._db.execute(items_by_ids_statement(dialect_name, item_ids))
+        return rows_to_snapshots(rows)
+
+    def find_item_quantity(self, item_id: UUID) -> int | None:
+        return self._db.query(Item.quantity).filter(Item.id == item_id).scalar()
+
+    def reserve_stock(
+        self, item_id: UUID, holder_id: UUID, quantity: int
+    ) -> InventoryReservation | None:
+        result = self._db.execute(reserve_stock_statement(item_id, quantity))
+        if result.rowcount != 1:
+            return None
+
+        model = new_reservation(item_id, holder_id, quantity, self._reservation_ttl)
+        self._db.add(model)
+        reservation = reservation_model_to_dto(model)
+        self._db.flush()
+        notify_after_commit(self._db, self._notifier, [item_id])
+        return reservation
+
+    def reserve_stocks(
+        self, holder_id: UUID, quantities: dict[UUID, int]
+    ) -> list[InventoryReservation] | None:
+        if not quantities:
+            return []
+        if self._db.get_bind().dialect.name == "postgresql":
+            reserved = self._db.execute(reserve_stocks_statement(quantities)).rowcount
+        else:
+            reserved = sum(
+                self._db.execute(reserve_stock_statement(item_id, quantity)).rowcount
+                for item_id, quantity in quantities.items()
+            )
+        if reserved != len(quantities):
+            return None
+
+        models = [
+            new_reservation(item_id, holder_id, quantity, self._reservation_ttl)
+            for item_id, quantity in quantities.items()
+        ]
+        self._db.add_all(models)
+        reservations = [reservation_model_to_dto(model) for model in models]
+        self._db.flush()
+        notify_after_commit(self._db, self._notifier, list(quantities))
+        return reservations
@@ -0,0 +1,36 @@
+"""Inventory lookups shared by the sync and async inventory gateways."""
+
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import ARRAY, Select, Uuid, any_, bindparam, select
+
+from be_task_ca.item.adapters.db.model import Item
+from be_task_ca.user.application.interfaces.inventory_gateway_interface import (
+    InventoryItemSnapshot,
+)
+
+INVENTORY_ITEM_COLUMNS = (
+    Item.id,
+    Item.name,
+    Item.description,
+    Item.price,
+    Item.quantity,
+)
+
+
+def items_by_ids_statement(dialect_name: str, item_ids: list[UUID]) -> Select:
+    """Look up a batch of items in one query.
+
+    Postgres gets `id = ANY(:item_ids)` with a single array parameter, so the
+    statement text does not change with the batch size.
+    """
+    query = select(*INVENTORY_ITEM_COLUMNS)
+    if dialect_name == "postgresql":
+        ids_param = bindparam("item_ids", item_ids, type_=ARRAY(Uuid))
+        return query.where(Item.id == any_(ids_param))
+    return query.where(Item.id.in_(item_ids))
+
+
+def rows_to_snapshots(rows: Iterable) -> dict[UUID, InventoryItemSnapshot]:
+    return {row.id: InventoryItemSnapshot(*row) for row in rows}
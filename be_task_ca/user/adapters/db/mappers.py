@@ -3,6 +3,10 @@
 from be_task_ca.user.domain.entities import CartItemEntity, UserEntity
 from be_task_ca.user.adapters.db.model import CartItem, User
 
+# Selected instead of CartItem models when only the entity is needed, in
+# CartItemEntity field order.
+CART_ITEM_COLUMNS = (CartItem.user_id, CartItem.item_id, CartItem.quantity)
+
 
 def user_item_model_to_entity(model: User) -> UserEntity:
     """Map SQLAlchemy user model to domain entity."""
@@ -43,3 +47,12 @@ def cart_item_entity_to_model(entity: CartItemEntity) -> CartItem:
         item_id=entity.item_id,
         quantity=entity.quantity,
     )
+
+
+def cart_item_entity_to_row(entity: CartItemEntity) -> dict:
+    """Map domain cart item entity to insert parameters."""
+    return {
+        "user_id": entity.user_id,
+        "item_id": entity.item_id,
+        "quantity": entity.quantity,
+    }
@@ -25,7 +25,7 @@ class User(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
-        default=uuid.uuid4(),
+        default=uuid.uuid4,
         index=True,
     )
     email: Mapped[str] = mapped_column(unique=True, index=True)
@@ -0,0 +1,197 @@
+"""Stock reservation statements and the expired-reservation release routine.
+
+Reserving is a conditional decrement, so concurrent add-to-cart requests only
+contend on the item row for the length of one short UPDATE instead of holding
+a `SELECT ... FOR UPDATE` lock across the whole request.
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    Delete,
+    Integer,
+    Select,
+    Update,
+    Uuid,
+    bindparam,
+    column,
+    delete,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from be_task_ca.events import ChangeNotifier
+from be_task_ca.item.adapters.db.events import item_changes
+from be_task_ca.item.adapters.db.model import Item, StockReservation
+from be_task_ca.user.adapters.db.events import cart_changes
+from be_task_ca.user.adapters.db.model import CartItem
+from be_task_ca.user.application.interfaces.inventory_gateway_interface import (
+    InventoryReservation,
+)
+
+DEFAULT_RESERVATION_TTL = timedelta(minutes=15)
+
+_items = Item.__table__
+_cart_items = CartItem.__table__
+_reservations = StockReservation.__table__
+
+
+def reserve_stock_statement(item_id: UUID, quantity: int) -> Update:
+    """Decrement stock only if it still covers `quantity`; rowcount 0 means no."""
+    _require_positive(quantity)
+    return (
+        update(_items)
+        .where(_items.c.id == item_id, _items.c.quantity >= quantity)
+        .values(quantity=_items.c.quantity - quantity)
+    )
+
+
+def reserve_stocks_statement(quantities: dict[UUID, int]) -> Update:
+    """Decrement several stocks in one Postgres `UPDATE ... FROM (VALUES ...)`.
+
+    Each stock is only decremented if it still covers its quantity, so a
+    rowcount below `len(quantities)` means one of them does not.
+    """
+    for quantity in quantities.values():
+        _require_positive(quantity)
+    requested = values(
+        column("item_id", Uuid), column("quantity", Integer), name="requested"
+    ).data(list(quantities.items()))
+    return (
+        update(_items)
+        .where(
+            _items.c.id == requested.c.item_id,
+            _items.c.quantity >= requested.c.quantity,
+        )
+        .values(quantity=_items.c.quantity - requested.c.quantity)
+    )
+
+
+def _require_positive(quantity: int) -> None:
+    # A non-positive quantity always passes the stock guard and would add stock.
+    if quantity <= 0:
+        raise ValueError(f"Reserved quantity must be positive, got {quantity}")
+
+
+def new_reservation(
+    item_id: UUID, holder_id: UUID, quantity: int, ttl: timedelta
+) -> StockReservation:
+    return StockReservation(
+        id=uuid4(),
+        item_id=item_id,
+        holder_id=holder_id,
+        quantity=quantity,
+        expires_at=datetime.now(timezone.utc) + ttl,
+    )
+
+
+def reservation_model_to_dto(model: StockReservation) -> InventoryReservation:
+    return InventoryReservation(
+        id=model.id,
+        item_id=model.item_id,
+        holder_id=model.holder_id,
+        quantity=model.quantity,
+        expires_at=model.expires_at,
+    )
+
+
+def expired_reservations_statement(now: datetime, batch_size: int) -> Select:
+    """Pick a batch of expired reservations, skipping rows another sweeper holds."""
+    return (
+        select(
+            _reservations.c.id,
+            _reservations.c.item_id,
+            _reservations.c.holder_id,
+            _reservations.c.quantity,
+        )
+        .where(_reservations.c.expires_at <= now)
+        .order_by(_reservations.c.expires_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+
+
+_restock_statement = (
+    update(_items)
+    .where(_items.c.id == bindparam("restock_item_id"))
+    .values(quantity=_items.c.quantity + bindparam("restock_quantity"))
+)
+_drop_cart_item_statement = delete(_cart_items).where(
+    _cart_items.c.user_id == bindparam("holder_id"),
+    _cart_items.c.item_id == bindparam("reserved_item_id"),
+)
+
+
+def _drop_reservations_statement(reservation_ids: list[UUID]) -> Delete:
+    return delete(_reservations).where(_reservations.c.id.in_(reservation_ids))
+
+
+def _release_params(rows) -> tuple[list[dict], list[dict]]:
+    restocked = Counter()
+    for row in rows:
+        restocked[row.item_id] += row.quantity
+    restock_params = [
+        {"restock_item_id": item_id, "restock_quantity": quantity}
+        for item_id, quantity in restocked.items()
+    ]
+    cart_params = [
+        {"holder_id": row.holder_id, "reserved_item_id": row.item_id} for row in rows
+    ]
+    return restock_params, cart_params
+
+
+def release_expired_reservations(
+    db: Session,
+    batch_size: int,
+    now: datetime | None = None,
+    notifier: ChangeNotifier = item_changes,
+    cart_notifier: ChangeNotifier = cart_changes,
+) -> int:
+    """Return one batch of expired reservations to stock and drop their cart items.
+
+    Returns the number of released reservations; call again until it is smaller
+    than `batch_size` to drain the backlog.
+    """
+    now = now or datetime.now(timezone.utc)
+    rows = db.execute(expired_reservations_statement(now, batch_size)).all()
+    if not rows:
+        db.rollback()
+        return 0
+
+    restock_params, cart_params = _release_params(rows)
+    db.execute(_restock_statement, restock_params)
+    db.execute(_drop_cart_item_statement, cart_params)
+    db.execute(_drop_reservations_statement([row.id for row in rows]))
+    db.commit()
+    notifier.notify(param["restock_item_id"] for param in restock_params)
+    cart_notifier.notify({row.holder_id for row in rows})
+    return len(rows)
+
+
+async def release_expired_reservations_async(
+    db: AsyncSession,
+    batch_size: int,
+    now: datetime | None = None,
+    notifier: ChangeNotifier = item_changes,
+    cart_notifier: ChangeNotifier = cart_changes,
+) -> int:
+    """Async variant of release_expired_reservations."""
+    now = now or datetime.now(timezone.utc)
+    rows = (await db.execute(expired_reservations_statement(now, batch_size))).all()
+    if not rows:
+        await db.rollback()
+        return 0
+
+    restock_params, cart_params = _release_params(rows)
+    await db.execute(_restock_statement, restock_params)
+    await db.execute(_drop_cart_item_statement, cart_params)
+    await db.execute(_drop_reservations_statement([row.id for row in rows]))
+    await db.commit()
+    notifier.notify(param["restock_item_id"] for param in restock_params)
+    cart_notifier.notify({row.holder_id for row in rows})
+    return len(rows)
@@ -0,0 +1,52 @@
+"""Bulk user statements shared by the sync and async user repositories."""
+
+from uuid import uuid4
+
+from sqlalchemy import ARRAY, Insert, Select, String, any_, bindparam, select
+
+from be_task_ca.inserts import insert_skipping_conflicts
+from be_task_ca.user.adapters.db.model import User
+from be_task_ca.user.domain.entities import UserEntity
+
+_users = User.__table__
+
+
+def existing_emails_statement(dialect_name: str, emails: list[str]) -> Select:
+    """Look up which emails are taken in one query.
+
+    Postgres gets `email = ANY(:emails)` with a single array parameter, so the
+    statement text does not change with the batch size.
+    """
+    if dialect_name == "postgresql":
+        emails_param = bindparam("emails", emails, type_=ARRAY(String))
+        return select(_users.c.email).where(_users.c.email == any_(emails_param))
+    return select(_users.c.email).where(_users.c.email.in_(emails))
+
+
+def insert_users_skipping_conflicts(dialect_name: str) -> Insert:
+    """`INSERT ... ON CONFLICT (email) DO NOTHING RETURNING` for the given dialect."""
+    return insert_skipping_conflicts(
+        _users, dialect_name, [_users.c.email]
+    ).returning(*_users.c)
+
+
+def entity_to_row(entity: UserEntity) -> dict:
+    return {
+        "id": entity.id or uuid4(),
+        "email": entity.email,
+        "first_name": entity.first_name,
+        "last_name": entity.last_name,
+        "hashed_password": entity.hashed_password,
+        "shipping_address": entity.shipping_address,
+    }
+
+
+def row_to_entity(row) -> UserEntity:
+    return UserEntity(
+        id=row.id,
+        email=row.email,
+        first_name=row.first_name,
+        last_name=row.last_name,
+        hashed_password=row.hashed_password,
+        shipping_address=row.shipping_address,
+    )
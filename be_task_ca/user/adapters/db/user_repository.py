@@ -4,6 +4,7 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from be_task_ca.observability.instrument import counted_repository
 from be_task_ca.user.application.interfaces.user_repository_interface import (
     UserRepositoryInterface,
 )
@@ -11,8 +12,15 @@ from be_task_ca.user.domain.entities import UserEntity
 from be_task_ca.user.adapters.db.model import User
 
 from .mappers import user_item_entity_to_model, user_item_model_to_entity
+from .user_queries import (
+    entity_to_row,
+    existing_emails_statement,
+    insert_users_skipping_conflicts,
+    row_to_entity,
+)
 
 
+@counted_repository
 class SqlAlchemyUserRepository(UserRepositoryInterface):
     """SQLAlchemy implementation of user repository interface."""
 
@@ -22,9 +30,27 @@ class SqlAlchemyUserRepository(UserRepositoryInterface):
     def save_user(self, user: UserEntity) -> UserEntity:
         model = user_item_entity_to_model(user)
         self._db.add(model)
-        self._db.commit()
+        self._db.flush()
         return user_item_model_to_entity(model)
 
+    def save_user_if_absent(self, user: UserEntity) -> UserEntity | None:
+        statement = insert_users_skipping_conflicts(self._db.get_bind().dialect.name)
+        row = self._db.execute(statement, entity_to_row(user)).first()
+        return None if row is None else row_to_entity(row)
+
+    def save_users(self, users: list[UserEntity]) -> list[UserEntity]:
+        if not users:
+            return []
+        statement = insert_users_skipping_conflicts(self._db.get_bind().dialect.name)
+        rows = self._db.execute(statement, [entity_to_row(user) for user in users])
+        return [row_to_entity(row) for row in rows]
+
+    def find_existing_emails(self, emails: list[str]) -> set[str]:
+        if not emails:
+            return set()
+        statement = existing_emails_statement(self._db.get_bind().dialect.name, emails)
+        return set(self._db.scalars(statement))
+
     def find_user_by_email(self, email: str) -> UserEntity | None:
         model = self._db.query(User).filter(User.email == email).first()
         if model is None:
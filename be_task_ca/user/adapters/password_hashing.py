@@ -0,0 +1,167 @@
+"""Password hashing on a bounded worker pool, off the request worker."""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Callable
+
+from be_task_ca.batching import batches
+from be_task_ca.observability.metrics import Counter, Gauge, Histogram
+from be_task_ca.settings import settings
+from be_task_ca.user.application.exceptions import PasswordHasherBusyError
+from be_task_ca.user.application.interfaces.password_hasher_interface import (
+    AsyncPasswordHasherInterface,
+    PasswordHasherInterface,
+)
+from be_task_ca.user.application.passwords import hash_passwords
+
+HASH_CHUNK_SIZE = 250
+
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "Time from submitting a hashing task to its result, including queueing.",
+)
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    "password_hash_queue_depth", "Hashing tasks submitted and not yet finished."
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Hashing requests refused because the queue was full.",
+)
+
+
+class HashQueue:
+    """Bounded admission in front of a hashing executor.
+
+    A request takes one slot per task it submits, all or nothing, and each slot
+    is freed when its task finishes; past `max_pending` new requests fail fast
+    instead of queueing behind work they would time out waiting for.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        max_pending: int,
+        hash_function: Callable[[list[str]], list[str]] = hash_passwords,
+    ) -> None:
+        self._executor = executor
+        self._max_pending = max_pending
+        self._hash_function = hash_function
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def submit(self, passwords: list[str]) -> list[Future]:
+        chunks = list(batches(passwords, HASH_CHUNK_SIZE))
+        with self._lock:
+            if self._pending + len(chunks) > self._max_pending:
+                PASSWORD_HASH_REJECTED.inc()
+                raise PasswordHasherBusyError(
+                    "Password hashing is saturated, retry later"
+                )
+            self._pending += len(chunks)
+        return [self._submit_chunk(chunk) for chunk in chunks]
+
+    def _submit_chunk(self, chunk: list[str]) -> Future:
+        started = time.perf_counter()
+        try:
+            future = self._executor.submit(self._hash_function, chunk)
+        except BaseException:
+            self._release(started)
+            raise
+        future.add_done_callback(lambda _: self._release(started))
+        return future
+
+    def _release(self, started: float) -> None:
+        PASSWORD_HASH_SECONDS.observe(time.perf_counter() - started)
+        with self._lock:
+            self._pending -= 1
+
+
+class PooledPasswordHasher(PasswordHasherInterface):
+    """Hash passwords on a HashQueue, blocking the caller until they are done."""
+
+    def __init__(self, queue: HashQueue) -> None:
+        self._queue = queue
+
+    def hash(self, password: str) -> str:
+        return self.hash_many([password])[0]
+
+    def hash_many(self, passwords: list[str]) -> list[str]:
+        futures = self._queue.submit(passwords)
+        return [hashed for future in futures for hashed in future.result()]
+
+
+class AsyncPooledPasswordHasher(AsyncPasswordHasherInterface):
+    """Async variant of PooledPasswordHasher; awaits without blocking the loop."""
+
+    def __init__(self, queue: HashQueue) -> None:
+        self._queue = queue
+
+    async def hash(self, password: str) -> str:
+        return (await self.hash_many([password]))[0]
+
+    async def hash_many(self, passwords: list[str]) -> list[str]:
+        futures = self._queue.submit(passwords)
+        chunks = await asyncio.gather(*map(asyncio.wrap_future, futures))
+        return [hashed for chunk in chunks for hashed in chunk]
+
+
+_queue: HashQueue | None = None
+_executor: Executor | None = None
+_lock = threading.Lock()
+
+
+def _new_executor() -> Executor:
+    if settings.password_hash_pool == "thread":
+        return ThreadPoolExecutor(
+            max_workers=settings.password_hash_workers,
+            thread_name_prefix="password-hash",
+        )
+    # Spawned rather than forked: the worker already runs threads (the DB pool,
+    # the event loop) that a fork would copy mid-state.
+    return ProcessPoolExecutor(
+        max_workers=settings.password_hash_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def password_hash_queue() -> HashQueue:
+    """Return the worker's hashing queue, starting its pool on first use."""
+    global _queue, _executor
+    with _lock:
+        if _queue is None:
+            _executor = _new_executor()
+            _queue = HashQueue(_executor, settings.password_hash_max_pending)
+        return _queue
+
+
+def password_hasher() -> PasswordHasherInterface:
+    return PooledPasswordHasher(password_hash_queue())
+
+
+def async_password_hasher() -> AsyncPasswordHasherInterface:
+    return AsyncPooledPasswordHasher(password_hash_queue())
+
+
+def shutdown_password_hash_executor() -> None:
+    global _queue, _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(cancel_futures=True)
+        _queue = _executor = None
+
+
+PASSWORD_HASH_QUEUE_DEPTH.labels().set_function(
+    lambda: _queue.pending if _queue is not None else 0
+)
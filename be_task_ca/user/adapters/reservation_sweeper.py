@@ -0,0 +1,91 @@
+"""Background task returning expired stock reservations to the inventory."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
+
+from be_task_ca.database import AsyncSessionLocal, SessionLocal
+from be_task_ca.settings import Settings
+from be_task_ca.user.adapters.db.reservations import (
+    release_expired_reservations,
+    release_expired_reservations_async,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def sweep_expired_reservations(batch_size: int) -> int:
+    """Release expired reservations batch by batch until none are left."""
+    released = 0
+    with SessionLocal() as db:
+        while True:
+            batch = release_expired_reservations(db, batch_size)
+            released += batch
+            if batch < batch_size:
+                return released
+
+
+async def sweep_expired_reservations_async(batch_size: int) -> int:
+    """Async variant of sweep_expired_reservations."""
+    released = 0
+    async with AsyncSessionLocal() as db:
+        while True:
+            batch = await release_expired_reservations_async(db, batch_size)
+            released += batch
+            if batch < batch_size:
+                return released
+
+
+class ReservationSweeper:
+    """Run `sweep` every `interval` seconds until stopped."""
+
+    def __init__(self, sweep: Callable[[], Awaitable[int]], interval: float) -> None:
+        self._sweep = sweep
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+
+    async def run(self) -> None:
+        while True:
+            try:
+                released = await self._sweep()
+                if released:
+                    logger.info("Released %d expired stock reservations", released)
+            except Exception:
+                logger.exception("Stock reservation sweep failed")
+            await asyncio.sleep(self._interval)
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+def install_reservation_sweeper(
+    application: FastAPI, settings: Settings, use_async: bool
+) -> None:
+    """Start the sweeper with the application and stop it on shutdown."""
+    batch_size = settings.reservation_sweep_batch_size
+    if use_async:
+
+        async def sweep() -> int:
+            return await sweep_expired_reservations_async(batch_size)
+
+    else:
+
+        async def sweep() -> int:
+            return await run_in_threadpool(sweep_expired_reservations, batch_size)
+
+    sweeper = ReservationSweeper(sweep, settings.reservation_sweep_interval_seconds)
+    application.add_event_handler("startup", sweeper.start)
+    application.add_event_handler("shutdown", sweeper.stop)
@@ -1,6 +1,9 @@
 """Application DTOs for user use cases."""
 
 from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import NamedTuple
 from uuid import UUID
 
 
@@ -22,6 +25,27 @@ class CreateUserResult:
     shipping_address: str | None
 
 
+class UserImportStatus(Enum):
+    CREATED = "created"
+    CONFLICT = "conflict"
+
+
+@dataclass(frozen=True)
+class UserImportRow:
+    """Outcome for one provisioned user; `user` is set only when it was created."""
+
+    email: str
+    status: UserImportStatus
+    user: CreateUserResult | None = None
+
+
+@dataclass(frozen=True)
+class CreateUsersResult:
+    rows: list[UserImportRow]
+    created: int
+    conflicts: int
+
+
 @dataclass(frozen=True)
 class AddToCartCommand:
     user_id: UUID
@@ -29,6 +53,18 @@ class AddToCartCommand:
     quantity: int
 
 
+@dataclass(frozen=True)
+class CartLineCommand:
+    item_id: UUID
+    quantity: int
+
+
+@dataclass(frozen=True)
+class AddItemsToCartCommand:
+    user_id: UUID
+    items: list[CartLineCommand]
+
+
 @dataclass(frozen=True)
 class CartItemResult:
     item_id: UUID
@@ -38,3 +74,33 @@ class CartItemResult:
 @dataclass(frozen=True)
 class ListCartItemsResult:
     items: list[CartItemResult]
+
+
+class CartLineView(NamedTuple):
+    """One cart item joined with its item, as read for the cart page.
+
+    `expires_at` is when the line's stock reservation runs out and the line is
+    removed from the cart.
+    """
+
+    item_id: UUID
+    name: str
+    price: float
+    quantity: int
+    expires_at: datetime | None = None
+
+
+@dataclass(frozen=True)
+class CartLineResult:
+    item_id: UUID
+    quantity: int
+    name: str
+    price: float
+    line_total: float
+    expires_at: datetime | None = None
+
+
+@dataclass(frozen=True)
+class CartResult:
+    items: list[CartLineResult]
+    total: float
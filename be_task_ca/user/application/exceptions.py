@@ -19,3 +19,18 @@ class NotEnoughStockError(Exception):
 
 class ItemAlreadyInCartError(Exception):
     """Raised when item is already present in user's cart."""
+
+
+class CartItemsRejectedError(Exception):
+    """Raised when lines of a bulk add-to-cart fail their checks; none is added.
+
+    `errors` maps the index of each failing line to the error it failed with.
+    """
+
+    def __init__(self, errors: dict[int, Exception]) -> None:
+        super().__init__("Cart items were rejected")
+        self.errors = errors
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when password hashing is saturated and refuses new work."""
@@ -1,14 +1,75 @@
 """Repository interface for cart item entities."""
 
+from dataclasses import dataclass
+from enum import Enum
 from typing import Protocol
 from uuid import UUID
 
 from be_task_ca.user.domain.entities import CartItemEntity
 
 
+class AddToCartOutcome(Enum):
+    """Result of an atomic add-to-cart attempt, in the order checks apply."""
+
+    ADDED = "added"
+    USER_NOT_FOUND = "user_not_found"
+    ITEM_NOT_FOUND = "item_not_found"
+    NOT_ENOUGH_STOCK = "not_enough_stock"
+    ALREADY_IN_CART = "already_in_cart"
+
+
+@dataclass(frozen=True)
+class AddToCartAttempt:
+    """Outcome of an add-to-cart attempt together with the user's cart."""
+
+    outcome: AddToCartOutcome
+    cart_items: list[CartItemEntity]
+
+
+@dataclass(frozen=True)
+class AddItemsToCartAttempt:
+    """Outcome of adding several items at once together with the user's cart.
+
+    Nothing is added unless the outcome is ADDED; on ALREADY_IN_CART the cart
+    holds the conflicting items and the unit of work has to be rolled back, as
+    the other items may have been inserted.
+    """
+
+    outcome: AddToCartOutcome
+    cart_items: list[CartItemEntity]
+
+
 class CartRepositoryInterface(Protocol):
     def find_cart_items_for_user_id(self, user_id: UUID) -> list[CartItemEntity]:
         """Return all cart items for a user."""
 
     def save_cart_item(self, cart_item: CartItemEntity) -> CartItemEntity:
-        """Persist a cart item and return it."""
+        """Add a cart item to the current unit of work and return it."""
+
+    def add_item_to_cart(self, cart_item: CartItemEntity) -> AddToCartAttempt:
+        """Check user, item, stock and duplicates, insert the cart item if they pass
+        and return the outcome with the user's resulting cart."""
+
+    def add_items_to_cart(
+        self, user_id: UUID, cart_items: list[CartItemEntity]
+    ) -> AddItemsToCartAttempt:
+        """Check the user and duplicates, insert all cart items if they pass
+        and return the outcome with the user's resulting cart."""
+
+
+class AsyncCartRepositoryInterface(Protocol):
+    async def find_cart_items_for_user_id(self, user_id: UUID) -> list[CartItemEntity]:
+        """Return all cart items for a user."""
+
+    async def save_cart_item(self, cart_item: CartItemEntity) -> CartItemEntity:
+        """Add a cart item to the current unit of work and return it."""
+
+    async def add_item_to_cart(self, cart_item: CartItemEntity) -> AddToCartAttempt:
+        """Check user, item, stock and duplicates, insert the cart item if they pass
+        and return the outcome with the user's resulting cart."""
+
+    async def add_items_to_cart(
+        self, user_id: UUID, cart_items: list[CartItemEntity]
+    ) -> AddItemsToCartAttempt:
+        """Check the user and duplicates, insert all cart items if they pass
+        and return the outcome with the user's resulting cart."""
@@ -0,0 +1,16 @@
+"""Read model interface for a user's cart joined with item details."""
+
+from typing import Protocol
+from uuid import UUID
+
+from be_task_ca.user.application.dto import CartLineView
+
+
+class CartViewReaderInterface(Protocol):
+    def get_cart_lines(self, user_id: UUID) -> list[CartLineView]:
+        """Return the user's cart items with their item's name and price."""
+
+
+class AsyncCartViewReaderInterface(Protocol):
+    async def get_cart_lines(self, user_id: UUID) -> list[CartLineView]:
+        """Return the user's cart items with their item's name and price."""
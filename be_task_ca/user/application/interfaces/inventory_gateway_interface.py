@@ -1,7 +1,8 @@
 """Interface for accessing inventory data from user/cart use cases."""
 
 from dataclasses import dataclass
-from typing import Protocol
+from datetime import datetime
+from typing import Iterable, Protocol
 from uuid import UUID
 
 
@@ -16,6 +17,72 @@ class InventoryItemSnapshot:
     quantity: int
 
 
+@dataclass(frozen=True)
+class InventoryReservation:
+    """Stock held for a user's cart until it expires."""
+
+    id: UUID
+    item_id: UUID
+    holder_id: UUID
+    quantity: int
+    expires_at: datetime
+
+
 class InventoryGatewayInterface(Protocol):
     def find_item_by_id(self, item_id: UUID) -> InventoryItemSnapshot | None:
         """Return inventory item by ID or None."""
+
+    def find_items_by_ids(
+        self, item_ids: Iterable[UUID]
+    ) -> dict[UUID, InventoryItemSnapshot]:
+        """Return the existing items among `item_ids` in one lookup, keyed by ID."""
+
+    def find_item_quantity(self, item_id: UUID) -> int | None:
+        """Return the current stock of an item, or None if it does not exist."""
+
+    def reserve_stock(
+        self, item_id: UUID, holder_id: UUID, quantity: int
+    ) -> InventoryReservation | None:
+        """Atomically take `quantity` units off the stock for `holder_id`.
+
+        Return None, leaving the stock untouched, when it does not cover them.
+        """
+
+    def reserve_stocks(
+        self, holder_id: UUID, quantities: dict[UUID, int]
+    ) -> list[InventoryReservation] | None:
+        """Atomically take the given units of several items off their stock.
+
+        Return None when any stock does not cover them; the units already taken
+        from the others return when the unit of work is rolled back.
+        """
+
+
+class AsyncInventoryGatewayInterface(Protocol):
+    async def find_item_by_id(self, item_id: UUID) -> InventoryItemSnapshot | None:
+        """Return inventory item by ID or None."""
+
+    async def find_items_by_ids(
+        self, item_ids: Iterable[UUID]
+    ) -> dict[UUID, InventoryItemSnapshot]:
+        """Return the existing items among `item_ids` in one lookup, keyed by ID."""
+
+    async def find_item_quantity(self, item_id: UUID) -> int | None:
+        """Return the current stock of an item, or None if it does not exist."""
+
+    async def reserve_stock(
+        self, item_id: UUID, holder_id: UUID, quantity: int
+    ) -> InventoryReservation | None:
+        """Atomically take `quantity` units off the stock for `holder_id`.
+
+        Return None, leaving the stock untouched, when it does not cover them.
+        """
+
+    async def reserve_stocks(
+        self, holder_id: UUID, quantities: dict[UUID, int]
+    ) -> list[InventoryReservation] | None:
+        """Atomically take the given units of several items off their stock.
+
+        Return None when any stock does not cover them; the units already taken
+        from the others return when the unit of work is rolled back.
+        """
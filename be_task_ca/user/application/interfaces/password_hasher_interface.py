@@ -0,0 +1,19 @@
+"""Interface for hashing user passwords."""
+
+from typing import Protocol
+
+
+class PasswordHasherInterface(Protocol):
+    def hash(self, password: str) -> str:
+        """Return the stored form of a password."""
+
+    def hash_many(self, passwords: list[str]) -> list[str]:
+        """Hash several passwords, returning the hashes in input order."""
+
+
+class AsyncPasswordHasherInterface(Protocol):
+    async def hash(self, password: str) -> str:
+        """Return the stored form of a password."""
+
+    async def hash_many(self, passwords: list[str]) -> list[str]:
+        """Hash several passwords, returning the hashes in input order."""
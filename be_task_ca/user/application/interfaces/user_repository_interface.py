@@ -8,10 +8,53 @@ from be_task_ca.user.domain.entities import UserEntity
 
 class UserRepositoryInterface(Protocol):
     def save_user(self, user: UserEntity) -> UserEntity:
-        """Persist a user and return it."""
+        """Add a user to the current unit of work and return it."""
+
+    def save_user_if_absent(self, user: UserEntity) -> UserEntity | None:
+        """Insert a user unless the email is taken and return it, or None if taken.
+
+        Relies on the unique index on the email, so concurrent registrations of
+        the same email insert at most one user.
+        """
+
+    def save_users(self, users: list[UserEntity]) -> list[UserEntity]:
+        """Insert users in one batch, skipping emails that already exist.
+
+        Return the inserted users.
+        """
+
+    def find_existing_emails(self, emails: list[str]) -> set[str]:
+        """Return the subset of `emails` that already belong to a user."""
 
     def find_user_by_email(self, email: str) -> UserEntity | None:
         """Return user by email or None."""
 
     def find_user_by_id(self, user_id: UUID) -> UserEntity | None:
         """Return user by ID or None."""
+
+
+class AsyncUserRepositoryInterface(Protocol):
+    async def save_user(self, user: UserEntity) -> UserEntity:
+        """Add a user to the current unit of work and return it."""
+
+    async def save_user_if_absent(self, user: UserEntity) -> UserEntity | None:
+        """Insert a user unless the email is taken and return it, or None if taken.
+
+        Relies on the unique index on the email, so concurrent registrations of
+        the same email insert at most one user.
+        """
+
+    async def save_users(self, users: list[UserEntity]) -> list[UserEntity]:
+        """Insert users in one batch, skipping emails that already exist.
+
+        Return the inserted users.
+        """
+
+    async def find_existing_emails(self, emails: list[str]) -> set[str]:
+        """Return the subset of `emails` that already belong to a user."""
+
+    async def find_user_by_email(self, email: str) -> UserEntity | None:
+        """Return user by email or None."""
+
+    async def find_user_by_id(self, user_id: UUID) -> UserEntity | None:
+        """Return user by ID or None."""
@@ -0,0 +1,12 @@
+"""Password hashing scheme shared by the single and bulk user creation paths."""
+
+import hashlib
+
+
+def hash_password(password: str) -> str:
+    return hashlib.sha512(password.encode("UTF-8")).hexdigest()
+
+
+def hash_passwords(passwords: list[str]) -> list[str]:
+    """Hash a chunk of passwords; the unit of work submitted to a hashing pool."""
+    return [hash_password(password) for password in passwords]
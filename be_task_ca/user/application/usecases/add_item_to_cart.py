@@ -1,5 +1,7 @@
 """Add item to cart use case implementation."""
 
+from be_task_ca.observability.instrument import timed_use_case
+from be_task_ca.unit_of_work import AsyncUnitOfWorkInterface, UnitOfWorkInterface
 from be_task_ca.user.application.dto import AddToCartCommand, ListCartItemsResult
 from be_task_ca.user.application.exceptions import (
     ItemAlreadyInCartError,
@@ -8,53 +10,112 @@ from be_task_ca.user.application.exceptions import (
     UserNotFoundError,
 )
 from be_task_ca.user.application.interfaces.cart_repository_interface import (
+    AddToCartAttempt,
+    AddToCartOutcome,
+    AsyncCartRepositoryInterface,
     CartRepositoryInterface,
 )
 from be_task_ca.user.application.interfaces.inventory_gateway_interface import (
+    AsyncInventoryGatewayInterface,
     InventoryGatewayInterface,
 )
-from be_task_ca.user.application.interfaces.user_repository_interface import (
-    UserRepositoryInterface,
-)
-from be_task_ca.user.application.usecases.list_cart_items import ListCartItemsUseCase
+from be_task_ca.user.application.usecases.list_cart_items import cart_items_to_result
 from be_task_ca.user.domain.entities import CartItemEntity
 
+_OUTCOME_ERRORS = {
+    AddToCartOutcome.USER_NOT_FOUND: (UserNotFoundError, "User does not exist"),
+    AddToCartOutcome.ITEM_NOT_FOUND: (ItemNotFoundError, "Item does not exist"),
+    AddToCartOutcome.NOT_ENOUGH_STOCK: (
+        NotEnoughStockError,
+        "Not enough items in stock",
+    ),
+    AddToCartOutcome.ALREADY_IN_CART: (ItemAlreadyInCartError, "Item already in cart"),
+}
+
 
+@timed_use_case
 class AddItemToCartUseCase:
-    """Add an inventory item to user's cart if all checks pass."""
+    """Add an inventory item to user's cart if all checks pass.
+
+    The existence, stock and duplicate checks and the insert are delegated to
+    the cart repository as one atomic operation. The stock is then reserved
+    through the inventory gateway in the same unit of work, committed once;
+    when a concurrent request took the last units in between, rolling it back
+    removes the cart item again.
+    """
 
     def __init__(
         self,
-        user_repository: UserRepositoryInterface,
         cart_repository: CartRepositoryInterface,
         inventory_gateway: InventoryGatewayInterface,
+        unit_of_work: UnitOfWorkInterface,
     ) -> None:
-        self._user_repository = user_repository
         self._cart_repository = cart_repository
         self._inventory_gateway = inventory_gateway
+        self._unit_of_work = unit_of_work
 
     def execute(self, command: AddToCartCommand) -> ListCartItemsResult:
-        user = self._user_repository.find_user_by_id(command.user_id)
-        if user is None:
-            raise UserNotFoundError("User does not exist")
-
-        item = self._inventory_gateway.find_item_by_id(command.item_id)
-        if item is None:
-            raise ItemNotFoundError("Item does not exist")
-        if item.quantity < command.quantity:
-            raise NotEnoughStockError("Not enough items in stock")
-
-        existing_cart_items = self._cart_repository.find_cart_items_for_user_id(command.user_id)
-        item_ids = [cart_item.item_id for cart_item in existing_cart_items]
-        if command.item_id in item_ids:
-            raise ItemAlreadyInCartError("Item already in cart")
-
-        self._cart_repository.save_cart_item(
-            CartItemEntity(
-                user_id=command.user_id,
-                item_id=command.item_id,
-                quantity=command.quantity,
+        with self._unit_of_work:
+            attempt = self._cart_repository.add_item_to_cart(
+                _command_to_entity(command)
+            )
+            _raise_for_outcome(attempt)
+
+            reservation = self._inventory_gateway.reserve_stock(
+                command.item_id, command.user_id, command.quantity
+            )
+            if reservation is None:
+                raise NotEnoughStockError("Not enough items in stock")
+            self._unit_of_work.commit()
+
+        return cart_items_to_result(attempt.cart_items)
+
+
+@timed_use_case
+class AsyncAddItemToCartUseCase:
+    """Async variant of AddItemToCartUseCase for the async persistence stack."""
+
+    def __init__(
+        self,
+        cart_repository: AsyncCartRepositoryInterface,
+        inventory_gateway: AsyncInventoryGatewayInterface,
+        unit_of_work: AsyncUnitOfWorkInterface,
+    ) -> None:
+        self._cart_repository = cart_repository
+        self._inventory_gateway = inventory_gateway
+        self._unit_of_work = unit_of_work
+
+    async def execute(self, command: AddToCartCommand) -> ListCartItemsResult:
+        async with self._unit_of_work:
+            attempt = await self._cart_repository.add_item_to_cart(
+                _command_to_entity(command)
+            )
+            _raise_for_outcome(attempt)
+
+            reservation = await self._inventory_gateway.reserve_stock(
+                command.item_id, command.user_id, command.quantity
             )
-        )
+            if reservation is None:
+                raise NotEnoughStockError("Not enough items in stock")
+            await self._unit_of_work.commit()
+
+        return cart_items_to_result(attempt.cart_items)
+
+
+def _command_to_entity(command: AddToCartCommand) -> CartItemEntity:
+    return CartItemEntity(
+        user_id=command.user_id,
+        item_id=command.item_id,
+        quantity=command.quantity,
+    )
+
+
+def outcome_error(outcome: AddToCartOutcome) -> Exception:
+    """Return the error an add-to-cart attempt with a failed `outcome` raises."""
+    error, message = _OUTCOME_ERRORS[outcome]
+    return error(message)
+
 
-        return ListCartItemsUseCase(self._cart_repository).execute(command.user_id)
+def _raise_for_outcome(attempt: AddToCartAttempt) -> None:
+    if attempt.outcome in _OUTCOME_ERRORS:
+        raise outcome_error(attempt.outcome)
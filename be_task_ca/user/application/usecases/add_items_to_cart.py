@@ -0,0 +1,171 @@
+"""Add several items to cart use case implementation."""
+
+from be_task_ca.observability.instrument import timed_use_case
+from be_task_ca.unit_of_work import AsyncUnitOfWorkInterface, UnitOfWorkInterface
+from be_task_ca.user.application.dto import (
+    AddItemsToCartCommand,
+    CartLineCommand,
+    ListCartItemsResult,
+)
+from be_task_ca.user.application.exceptions import CartItemsRejectedError
+from be_task_ca.user.application.interfaces.cart_repository_interface import (
+    AddItemsToCartAttempt,
+    AddToCartOutcome,
+    AsyncCartRepositoryInterface,
+    CartRepositoryInterface,
+)
+from be_task_ca.user.application.interfaces.inventory_gateway_interface import (
+    AsyncInventoryGatewayInterface,
+    InventoryGatewayInterface,
+    InventoryItemSnapshot,
+)
+from be_task_ca.user.application.usecases.add_item_to_cart import outcome_error
+from be_task_ca.user.application.usecases.list_cart_items import cart_items_to_result
+from be_task_ca.user.domain.entities import CartItemEntity
+
+
+@timed_use_case
+class AddItemsToCartUseCase:
+    """Add several inventory items to a user's cart, all of them or none.
+
+    Every line is checked against one batched inventory lookup, the cart items
+    are inserted together and their stock is then reserved together, all in
+    one unit of work. When a concurrent request took stock in between, it is
+    rolled back. Failing lines are reported together in CartItemsRejectedError.
+    """
+
+    def __init__(
+        self,
+        cart_repository: CartRepositoryInterface,
+        inventory_gateway: InventoryGatewayInterface,
+        unit_of_work: UnitOfWorkInterface,
+    ) -> None:
+        self._cart_repository = cart_repository
+        self._inventory_gateway = inventory_gateway
+        self._unit_of_work = unit_of_work
+
+    def execute(self, command: AddItemsToCartCommand) -> ListCartItemsResult:
+        item_ids = [line.item_id for line in command.items]
+        with self._unit_of_work:
+            items = self._inventory_gateway.find_items_by_ids(item_ids)
+            _raise_for_line_errors(_inventory_errors(command.items, items))
+
+            attempt = self._cart_repository.add_items_to_cart(
+                command.user_id, _command_to_entities(command)
+            )
+            _raise_for_attempt(command, attempt)
+
+            reservations = self._inventory_gateway.reserve_stocks(
+                command.user_id, _quantities(command)
+            )
+            if reservations is None:
+                self._unit_of_work.rollback()
+                items = self._inventory_gateway.find_items_by_ids(item_ids)
+                raise _stock_taken_error(command.items, items)
+            self._unit_of_work.commit()
+
+        return cart_items_to_result(attempt.cart_items)
+
+
+@timed_use_case
+class AsyncAddItemsToCartUseCase:
+    """Async variant of AddItemsToCartUseCase for the async persistence stack."""
+
+    def __init__(
+        self,
+        cart_repository: AsyncCartRepositoryInterface,
+        inventory_gateway: AsyncInventoryGatewayInterface,
+        unit_of_work: AsyncUnitOfWorkInterface,
+    ) -> None:
+        self._cart_repository = cart_repository
+        self._inventory_gateway = inventory_gateway
+        self._unit_of_work = unit_of_work
+
+    async def execute(self, command: AddItemsToCartCommand) -> ListCartItemsResult:
+        item_ids = [line.item_id for line in command.items]
+        async with self._unit_of_work:
+            items = await self._inventory_gateway.find_items_by_ids(item_ids)
+            _raise_for_line_errors(_inventory_errors(command.items, items))
+
+            attempt = await self._cart_repository.add_items_to_cart(
+                command.user_id, _command_to_entities(command)
+            )
+            _raise_for_attempt(command, attempt)
+
+            reservations = await self._inventory_gateway.reserve_stocks(
+                command.user_id, _quantities(command)
+            )
+            if reservations is None:
+                await self._unit_of_work.rollback()
+                items = await self._inventory_gateway.find_items_by_ids(item_ids)
+                raise _stock_taken_error(command.items, items)
+            await self._unit_of_work.commit()
+
+        return cart_items_to_result(attempt.cart_items)
+
+
+def _inventory_errors(
+    lines: list[CartLineCommand], items: dict
+) -> dict[int, Exception]:
+    """Check each line against `items`; an item listed twice counts as in cart."""
+    errors = {}
+    seen = set()
+    for index, line in enumerate(lines):
+        item: InventoryItemSnapshot | None = items.get(line.item_id)
+        if line.item_id in seen:
+            errors[index] = outcome_error(AddToCartOutcome.ALREADY_IN_CART)
+        elif item is None:
+            errors[index] = outcome_error(AddToCartOutcome.ITEM_NOT_FOUND)
+        elif item.quantity < line.quantity:
+            errors[index] = outcome_error(AddToCartOutcome.NOT_ENOUGH_STOCK)
+        seen.add(line.item_id)
+    return errors
+
+
+def _raise_for_line_errors(errors: dict[int, Exception]) -> None:
+    if errors:
+        raise CartItemsRejectedError(errors)
+
+
+def _raise_for_attempt(
+    command: AddItemsToCartCommand, attempt: AddItemsToCartAttempt
+) -> None:
+    if attempt.outcome is AddToCartOutcome.USER_NOT_FOUND:
+        raise outcome_error(attempt.outcome)
+    if attempt.outcome is AddToCartOutcome.ALREADY_IN_CART:
+        in_cart = {cart_item.item_id for cart_item in attempt.cart_items}
+        raise CartItemsRejectedError(
+            {
+                index: outcome_error(attempt.outcome)
+                for index, line in enumerate(command.items)
+                if line.item_id in in_cart
+            }
+        )
+
+
+def _stock_taken_error(
+    lines: list[CartLineCommand], items: dict
+) -> CartItemsRejectedError:
+    """Report the lines whose stock a concurrent request took.
+
+    Stock may have been returned since the reservation failed; then every line
+    is reported, as it is unknown which one fell short.
+    """
+    errors = _inventory_errors(lines, items) or {
+        index: outcome_error(AddToCartOutcome.NOT_ENOUGH_STOCK)
+        for index in range(len(lines))
+    }
+    return CartItemsRejectedError(errors)
+
+
+def _command_to_entities(command: AddItemsToCartCommand) -> list[CartItemEntity]:
+    return [
+        CartItemEntity(
+            user_id=command.user_id, item_id=line.item_id, quantity=line.quantity
+        )
+        for line in command.items
+    ]
+
+
+def _quantities(command: AddItemsToCartCommand) -> dict:
+    return {line.item_id: line.quantity for line in command.items}
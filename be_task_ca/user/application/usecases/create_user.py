@@ -1,40 +1,99 @@
 """Create user use case implementation."""
 
-import hashlib
-
+from be_task_ca.observability.instrument import timed_use_case
+from be_task_ca.unit_of_work import AsyncUnitOfWorkInterface, UnitOfWorkInterface
 from be_task_ca.user.application.dto import CreateUserCommand, CreateUserResult
 from be_task_ca.user.application.exceptions import UserAlreadyExistsError
+from be_task_ca.user.application.interfaces.password_hasher_interface import (
+    AsyncPasswordHasherInterface,
+    PasswordHasherInterface,
+)
 from be_task_ca.user.application.interfaces.user_repository_interface import (
+    AsyncUserRepositoryInterface,
     UserRepositoryInterface,
 )
 from be_task_ca.user.domain.entities import UserEntity
 
 
+@timed_use_case
 class CreateUserUseCase:
-    """Create a user if email is not already registered."""
+    """Create a user if email is not already registered.
 
-    def __init__(self, user_repository: UserRepositoryInterface) -> None:
+    The email is not looked up first: the insert itself skips a taken email, so
+    concurrent registrations of one email create a single user. The password is
+    therefore hashed before it is known whether the email is free.
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepositoryInterface,
+        password_hasher: PasswordHasherInterface,
+        unit_of_work: UnitOfWorkInterface,
+    ) -> None:
         self._user_repository = user_repository
+        self._password_hasher = password_hasher
+        self._unit_of_work = unit_of_work
 
     def execute(self, command: CreateUserCommand) -> CreateUserResult:
-        existing_user = self._user_repository.find_user_by_email(command.email)
-        if existing_user is not None:
-            raise UserAlreadyExistsError("An user with this email adress already exists")
-
-        new_user = UserEntity(
-            id=None,
-            first_name=command.first_name,
-            last_name=command.last_name,
-            email=command.email,
-            hashed_password=hashlib.sha512(command.password.encode("UTF-8")).hexdigest(),
-            shipping_address=command.shipping_address,
-        )
-        saved_user = self._user_repository.save_user(new_user)
-
-        return CreateUserResult(
-            id=saved_user.id,
-            first_name=saved_user.first_name,
-            last_name=saved_user.last_name,
-            email=saved_user.email,
-            shipping_address=saved_user.shipping_address,
-        )
+        hashed_password = self._password_hasher.hash(command.password)
+        with self._unit_of_work:
+            saved_user = self._user_repository.save_user_if_absent(
+                _command_to_entity(command, hashed_password)
+            )
+            if saved_user is None:
+                raise UserAlreadyExistsError(
+                    "An user with this email adress already exists"
+                )
+            self._unit_of_work.commit()
+
+        return _entity_to_result(saved_user)
+
+
+@timed_use_case
+class AsyncCreateUserUseCase:
+    """Async variant of CreateUserUseCase for the async persistence stack."""
+
+    def __init__(
+        self,
+        user_repository: AsyncUserRepositoryInterface,
+        password_hasher: AsyncPasswordHasherInterface,
+        unit_of_work: AsyncUnitOfWorkInterface,
+    ) -> None:
+        self._user_repository = user_repository
+        self._password_hasher = password_hasher
+        self._unit_of_work = unit_of_work
+
+    async def execute(self, command: CreateUserCommand) -> CreateUserResult:
+        hashed_password = await self._password_hasher.hash(command.password)
+        async with self._unit_of_work:
+            saved_user = await self._user_repository.save_user_if_absent(
+                _command_to_entity(command, hashed_password)
+            )
+            if saved_user is None:
+                raise UserAlreadyExistsError(
+                    "An user with this email adress already exists"
+                )
+            await self._unit_of_work.commit()
+
+        return _entity_to_result(saved_user)
+
+
+def _command_to_entity(command: CreateUserCommand, hashed_password: str) -> UserEntity:
+    return UserEntity(
+        id=None,
+        first_name=command.first_name,
+        last_name=command.last_name,
+        email=command.email,
+        hashed_password=hashed_password,
+        shipping_address=command.shipping_address,
+    )
+
+
+def _entity_to_result(user: UserEntity) -> CreateUserResult:
+    return CreateUserResult(
+        id=user.id,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        email=user.email,
+        shipping_address=user.shipping_address,
+    )
@@ -0,0 +1,156 @@
+"""Bulk user provisioning use case implementation."""
+
+from typing import Iterable, Iterator
+
+from be_task_ca.batching import batches
+from be_task_ca.observability.instrument import timed_use_case
+from be_task_ca.unit_of_work import AsyncUnitOfWorkInterface, UnitOfWorkInterface
+from be_task_ca.user.application.dto import (
+    CreateUserCommand,
+    CreateUserResult,
+    CreateUsersResult,
+    UserImportRow,
+    UserImportStatus,
+)
+from be_task_ca.user.application.interfaces.password_hasher_interface import (
+    AsyncPasswordHasherInterface,
+    PasswordHasherInterface,
+)
+from be_task_ca.user.application.interfaces.user_repository_interface import (
+    AsyncUserRepositoryInterface,
+    UserRepositoryInterface,
+)
+from be_task_ca.user.domain.entities import UserEntity
+
+CREATE_USERS_BATCH_SIZE = 1000
+
+
+@timed_use_case
+class CreateUsersUseCase:
+    """Create many users, reporting per row whether it was created or its email
+    was already taken.
+
+    Each batch first looks up which emails exist so only new users' passwords
+    are hashed, then the batch is inserted with one statement and committed.
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepositoryInterface,
+        password_hasher: PasswordHasherInterface,
+        unit_of_work: UnitOfWorkInterface,
+        batch_size: int = CREATE_USERS_BATCH_SIZE,
+    ) -> None:
+        self._user_repository = user_repository
+        self._password_hasher = password_hasher
+        self._unit_of_work = unit_of_work
+        self._batch_size = batch_size
+
+    def execute(self, commands: Iterable[CreateUserCommand]) -> CreateUsersResult:
+        rows = []
+        with self._unit_of_work:
+            for batch in batches(commands, self._batch_size):
+                existing = self._user_repository.find_existing_emails(
+                    [command.email for command in batch]
+                )
+                new_users = _new_users(batch, existing)
+                hashed = self._password_hasher.hash_many(
+                    [command.password for command in new_users]
+                )
+                saved_users = self._user_repository.save_users(
+                    list(map(_command_to_entity, new_users, hashed))
+                )
+                self._unit_of_work.commit()
+                rows.extend(_batch_to_rows(batch, saved_users))
+        return _rows_to_result(rows)
+
+
+@timed_use_case
+class AsyncCreateUsersUseCase:
+    """Async variant of CreateUsersUseCase for the async persistence stack."""
+
+    def __init__(
+        self,
+        user_repository: AsyncUserRepositoryInterface,
+        password_hasher: AsyncPasswordHasherInterface,
+        unit_of_work: AsyncUnitOfWorkInterface,
+        batch_size: int = CREATE_USERS_BATCH_SIZE,
+    ) -> None:
+        self._user_repository = user_repository
+        self._password_hasher = password_hasher
+        self._unit_of_work = unit_of_work
+        self._batch_size = batch_size
+
+    async def execute(self, commands: Iterable[CreateUserCommand]) -> CreateUsersResult:
+        rows = []
+        async with self._unit_of_work:
+            for batch in batches(commands, self._batch_size):
+                existing = await self._user_repository.find_existing_emails(
+                    [command.email for command in batch]
+                )
+                new_users = _new_users(batch, existing)
+                hashed = await self._password_hasher.hash_many(
+                    [command.password for command in new_users]
+                )
+                saved_users = await self._user_repository.save_users(
+                    list(map(_command_to_entity, new_users, hashed))
+                )
+                await self._unit_of_work.commit()
+                rows.extend(_batch_to_rows(batch, saved_users))
+        return _rows_to_result(rows)
+
+
+def _new_users(
+    batch: list[CreateUserCommand], existing_emails: set[str]
+) -> list[CreateUserCommand]:
+    """First occurrence of every email in the batch that is not registered yet."""
+    seen = set(existing_emails)
+    new_users = []
+    for command in batch:
+        if command.email not in seen:
+            seen.add(command.email)
+            new_users.append(command)
+    return new_users
+
+
+def _batch_to_rows(
+    batch: list[CreateUserCommand], saved_users: list[UserEntity]
+) -> Iterator[UserImportRow]:
+    saved_by_email = {user.email: user for user in saved_users}
+    for command in batch:
+        # pop: only the first occurrence of an email repeated in the batch was inserted.
+        saved_user = saved_by_email.pop(command.email, None)
+        if saved_user is None:
+            yield UserImportRow(email=command.email, status=UserImportStatus.CONFLICT)
+        else:
+            yield UserImportRow(
+                email=command.email,
+                status=UserImportStatus.CREATED,
+                user=_entity_to_result(saved_user),
+            )
+
+
+def _rows_to_result(rows: list[UserImportRow]) -> CreateUsersResult:
+    created = sum(row.status is UserImportStatus.CREATED for row in rows)
+    return CreateUsersResult(rows=rows, created=created, conflicts=len(rows) - created)
+
+
+def _command_to_entity(command: CreateUserCommand, hashed_password: str) -> UserEntity:
+    return UserEntity(
+        id=None,
+        first_name=command.first_name,
+        last_name=command.last_name,
+        email=command.email,
+        hashed_password=hashed_password,
+        shipping_address=command.shipping_address,
+    )
+
+
+def _entity_to_result(user: UserEntity) -> CreateUserResult:
+    return CreateUserResult(
+        id=user.id,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        email=user.email,
+        shipping_address=user.shipping_address,
+    )
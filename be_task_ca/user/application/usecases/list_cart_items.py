@@ -2,23 +2,66 @@
 
 from uuid import UUID
 
-from be_task_ca.user.application.dto import CartItemResult, ListCartItemsResult
-from be_task_ca.user.application.interfaces.cart_repository_interface import (
-    CartRepositoryInterface,
+from be_task_ca.observability.instrument import timed_use_case
+from be_task_ca.user.application.dto import (
+    CartItemResult,
+    CartLineResult,
+    CartLineView,
+    CartResult,
+    ListCartItemsResult,
 )
+from be_task_ca.user.application.interfaces.cart_view_reader_interface import (
+    AsyncCartViewReaderInterface,
+    CartViewReaderInterface,
+)
+from be_task_ca.user.domain.entities import CartItemEntity
 
 
+@timed_use_case
 class ListCartItemsUseCase:
-    """Return all cart items for a user."""
-
-    def __init__(self, cart_repository: CartRepositoryInterface) -> None:
-        self._cart_repository = cart_repository
-
-    def execute(self, user_id: UUID) -> ListCartItemsResult:
-        cart_items = self._cart_repository.find_cart_items_for_user_id(user_id)
-        return ListCartItemsResult(
-            items=[
-                CartItemResult(item_id=item.item_id, quantity=item.quantity)
-                for item in cart_items
-            ]
+    """Return a user's cart items with item details, line totals and cart total."""
+
+    def __init__(self, cart_view_reader: CartViewReaderInterface) -> None:
+        self._cart_view_reader = cart_view_reader
+
+    def execute(self, user_id: UUID) -> CartResult:
+        return cart_lines_to_result(self._cart_view_reader.get_cart_lines(user_id))
+
+
+@timed_use_case
+class AsyncListCartItemsUseCase:
+    """Async variant of ListCartItemsUseCase for the async persistence stack."""
+
+    def __init__(self, cart_view_reader: AsyncCartViewReaderInterface) -> None:
+        self._cart_view_reader = cart_view_reader
+
+    async def execute(self, user_id: UUID) -> CartResult:
+        lines = await self._cart_view_reader.get_cart_lines(user_id)
+        return cart_lines_to_result(lines)
+
+
+def cart_items_to_result(cart_items: list[CartItemEntity]) -> ListCartItemsResult:
+    return ListCartItemsResult(
+        items=[
+            CartItemResult(item_id=item.item_id, quantity=item.quantity)
+            for item in cart_items
+        ]
+    )
+
+
+def cart_lines_to_result(lines: list[CartLineView]) -> CartResult:
+    """Price the cart; amounts are rounded to cents as prices are stored as floats."""
+    items = [
+        CartLineResult(
+            item_id=line.item_id,
+            quantity=line.quantity,
+            name=line.name,
+            price=line.price,
+            line_total=round(line.price * line.quantity, 2),
+            expires_at=line.expires_at,
         )
+        for line in lines
+    ]
+    return CartResult(
+        items=items, total=round(sum(item.line_total for item in items), 2)
+    )
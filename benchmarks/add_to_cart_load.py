@@ -0,0 +1,82 @@
+"""Load benchmark for `POST /users/{user_id}/cart`.
+
+Run it against a live server, once per persistence stack, to compare them:
+
+    poetry run start                                  # sync adapters
+    BE_TASK_CA_DB_MODE=async poetry run start         # async adapters
+    python -m benchmarks.add_to_cart_load --concurrency 200 --requests 4000
+
+Every request adds a distinct (user, item) pair, so all of them should succeed.
+"""
+
+import argparse
+import asyncio
+import json
+import uuid
+from dataclasses import asdict
+
+import httpx
+
+from benchmarks.harness import create_client, run_load
+
+
+async def _seed(
+    client: httpx.AsyncClient, users: int, items: int
+) -> tuple[list[str], list[str]]:
+    run_id = uuid.uuid4().hex[:8]
+    user_ids = []
+    for index in range(users):
+        response = await client.post(
+            "/users/",
+            json={
+                "first_name": "Load",
+                "last_name": "Test",
+                "email": f"load-{run_id}-{index}@example.com",
+                "password": "password",
+                "shipping_address": "Street 1",
+            },
+        )
+        response.raise_for_status()
+        user_ids.append(response.json()["id"])
+
+    item_ids = []
+    for index in range(items):
+        response = await client.post(
+            "/items/",
+            json={
+                "name": f"load-{run_id}-{index}",
+                "description": "Load test item",
+                "price": 1.0,
+                "quantity": 1_000_000,
+            },
+        )
+        response.raise_for_status()
+        item_ids.append(response.json()["id"])
+
+    return user_ids, item_ids
+
+
+async def main(base_url: str, concurrency: int, total_requests: int) -> None:
+    async with create_client(base_url, concurrency) as client:
+        users = concurrency
+        items = -(-total_requests // users)
+        user_ids, item_ids = await _seed(client, users, items)
+
+        async def send(client: httpx.AsyncClient, index: int) -> httpx.Response:
+            user_id = user_ids[index % users]
+            item_id = item_ids[index // users]
+            return await client.post(
+                f"/users/{user_id}/cart", json={"item_id": item_id, "quantity": 1}
+            )
+
+        result = await run_load(client, send, total_requests, concurrency)
+    print(json.dumps(asdict(result), indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=4000)
+    args = parser.parse_args()
+    asyncio.run(main(args.base_url, args.concurrency, args.requests))
@@ -0,0 +1,74 @@
+"""Compare two benchmark suite reports and flag regressions.
+
+    python -m benchmarks.compare base.json head.json --threshold 0.10
+
+Prints the relative change of every metric per scenario and exits with status
+1 when any of them got worse by more than `--threshold`, so it can gate CI.
+"""
+
+import argparse
+import json
+import sys
+
+# Run parameters that make two reports incomparable when they differ.
+SETUP_KEYS = ("database", "db_mode", "base_url", "cpus", "requests", "concurrency")
+
+# Metric -> whether a higher value is better.
+METRICS = {
+    "requests_per_second": True,
+    "p50_ms": False,
+    "p95_ms": False,
+    "p99_ms": False,
+    "alloc_peak_kib_p50": False,
+    "median_ms": False,
+}
+
+
+def compare(base: dict, head: dict, threshold: float) -> tuple[list[str], list[str]]:
+    """Return report lines and the subset of them that are regressions."""
+    lines = [
+        f"setup differs: {key} {base['meta'].get(key)} -> {head['meta'].get(key)}"
+        for key in SETUP_KEYS
+        if base["meta"].get(key) != head["meta"].get(key)
+    ]
+    regressions = []
+    for scenario, head_result in head["results"].items():
+        base_result = base["results"].get(scenario)
+        if base_result is None:
+            lines.append(f"{scenario}: not in base")
+            continue
+        if head_result.get("errors", 0) > base_result.get("errors", 0):
+            line = (
+                f"{scenario} errors: {base_result['errors']} -> {head_result['errors']}"
+            )
+            lines.append(line)
+            regressions.append(line)
+        for metric, higher_is_better in METRICS.items():
+            before = base_result.get(metric)
+            after = head_result.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            worse = -change if higher_is_better else change
+            line = f"{scenario} {metric}: {before} -> {after} ({change:+.1%})"
+            lines.append(line)
+            if worse > threshold:
+                regressions.append(line)
+    return lines, regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args()
+
+    with open(args.base) as base_file, open(args.head) as head_file:
+        base, head = json.load(base_file), json.load(head_file)
+    lines, regressions = compare(base, head, args.threshold)
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}:")
+        print("\n".join(regressions))
+        sys.exit(1)
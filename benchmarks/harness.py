@@ -0,0 +1,93 @@
+"""Minimal closed-loop load generator shared by the benchmark scripts."""
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import httpx
+
+RequestFactory = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+@dataclass(frozen=True)
+class LoadResult:
+    requests: int
+    errors: int
+    concurrency: int
+    elapsed_seconds: float
+    requests_per_second: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of already sorted samples."""
+    if not samples:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(samples)))
+    return samples[rank - 1]
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    send: RequestFactory,
+    total_requests: int,
+    concurrency: int,
+) -> LoadResult:
+    """Issue `total_requests` calls of `send` from `concurrency` concurrent workers.
+
+    Each worker runs requests back to back, so throughput reflects how many
+    requests the server can keep in flight rather than an open arrival rate.
+    """
+    latencies: list[float] = []
+    errors = 0
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal errors, next_index
+        while next_index < total_requests:
+            index = next_index
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                response = await send(client, index)
+                failed = response.is_error
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return LoadResult(
+        requests=total_requests,
+        errors=errors,
+        concurrency=concurrency,
+        elapsed_seconds=round(elapsed, 3),
+        requests_per_second=round(total_requests / elapsed, 1),
+        p50_ms=round(percentile(latencies, 0.50) * 1000, 2),
+        p95_ms=round(percentile(latencies, 0.95) * 1000, 2),
+        p99_ms=round(percentile(latencies, 0.99) * 1000, 2),
+    )
+
+
+def create_client(
+    base_url: str | None, concurrency: int, app=None
+) -> httpx.AsyncClient:
+    """Client for a live server at `base_url`, or in-process for an ASGI `app`."""
+    if base_url is None:
+        transport = httpx.ASGITransport(app=app)
+        return httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=60.0
+        )
+
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    return httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0)
@@ -0,0 +1,79 @@
+"""Catalog load benchmark: `POST /items/bulk` versus one `POST /items/` per item.
+
+Run it against a live server:
+
+    python -m benchmarks.item_import --items 200000 --per-request 10000
+
+`--single-items` items are also created one request at a time for comparison.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+from benchmarks.harness import create_client
+
+
+def _item(run_id: str, index: int) -> dict:
+    return {
+        "name": f"import-{run_id}-{index}",
+        "description": "Imported item",
+        "price": 1.0,
+        "quantity": 10,
+    }
+
+
+async def main(base_url: str, items: int, per_request: int, single_items: int) -> None:
+    run_id = uuid.uuid4().hex[:8]
+    async with create_client(base_url, 1) as client:
+        client.timeout = 600.0
+        started = time.perf_counter()
+        created = 0
+        for offset in range(0, items, per_request):
+            body = "\n".join(
+                json.dumps(_item(run_id, index))
+                for index in range(offset, min(offset + per_request, items))
+            )
+            response = await client.post(
+                "/items/bulk",
+                content=body,
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+            response.raise_for_status()
+            created += response.json()["created"]
+        bulk_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for index in range(single_items):
+            response = await client.post("/items/", json=_item(f"{run_id}-s", index))
+            response.raise_for_status()
+        single_seconds = time.perf_counter() - started
+
+    print(
+        json.dumps(
+            {
+                "bulk_items": items,
+                "bulk_created": created,
+                "bulk_seconds": round(bulk_seconds, 2),
+                "bulk_items_per_second": round(items / bulk_seconds),
+                "single_items": single_items,
+                "single_seconds": round(single_seconds, 2),
+                "single_items_per_second": round(single_items / single_seconds)
+                if single_items
+                else None,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--per-request", type=int, default=10_000)
+    parser.add_argument("--single-items", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.base_url, args.items, args.per_request, args.single_items))
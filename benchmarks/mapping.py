@@ -0,0 +1,252 @@
+"""Micro-benchmarks for the mapping layers behind the item and cart listings.
+
+Times each step of the model -> entity -> result -> pydantic -> JSON chain that
+`GET /items/` and `GET /users/{id}/cart` used to take, the whole chain, and
+the column projection path that replaced it, for 1, 1k and 100k rows of an
+in-memory SQLite database:
+
+    python -m benchmarks.mapping --output mapping.json
+    python -m benchmarks.mapping --rows 1000 --filter items.
+
+Reports are compatible with `python -m benchmarks.compare`.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import uuid
+from typing import Any, Callable
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from be_task_ca.database import Base
+from be_task_ca.item.adapters.api.handlers import (
+    list_result_to_response,
+    result_to_schema,
+)
+from be_task_ca.item.adapters.api.schema import AllItemsRepsonse
+from be_task_ca.item.adapters.db.mappers import ITEM_VIEW_COLUMNS, to_entity
+from be_task_ca.item.adapters.db.model import Item
+from be_task_ca.item.application.dto import (
+    CreateItemResult,
+    ItemView,
+    ListItemsResult,
+)
+from be_task_ca.user.adapters.api.handlers import (
+    cart_item_result_to_schema,
+    cart_result_to_response,
+)
+from be_task_ca.user.adapters.api.schema import AddToCartResponse
+from be_task_ca.user.adapters.db.mappers import (
+    CART_ITEM_COLUMNS,
+    cart_item_model_to_entity,
+)
+from be_task_ca.user.adapters.db.model import CartItem
+from be_task_ca.user.application.usecases.list_cart_items import (
+    cart_items_to_result,
+)
+from be_task_ca.user.domain.entities import CartItemEntity
+
+ROW_COUNTS = (1, 1_000, 100_000)
+MIN_SECONDS = 0.5
+MAX_ROUNDS = 1000
+
+
+def _seed(rows: int):
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    user_id = uuid.uuid4()
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Item),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "name": f"item-{index:06d}",
+                    "description": "Benchmark item",
+                    "price": 9.99,
+                    "quantity": index,
+                }
+                for index in range(rows)
+            ],
+        )
+        connection.execute(
+            insert(CartItem),
+            [
+                {"user_id": user_id, "item_id": uuid.uuid4(), "quantity": 1}
+                for _ in range(rows)
+            ],
+        )
+    return engine, user_id
+
+
+def _entity_to_result(item) -> CreateItemResult:
+    return CreateItemResult(
+        id=item.id,
+        name=item.name,
+        description=item.description,
+        price=item.price,
+        quantity=item.quantity,
+    )
+
+
+def _encode(content: Any) -> bytes:
+    """Encode a pydantic model the way FastAPI renders a returned model."""
+    return json.dumps(jsonable_encoder(content)).encode()
+
+
+def _item_cases(engine) -> dict[str, Callable[[], Any]]:
+    with Session(engine) as session:
+        models = session.query(Item).all()
+        session.expunge_all()
+    entities = [to_entity(model) for model in models]
+    results = [_entity_to_result(entity) for entity in entities]
+    schemas = [result_to_schema(result) for result in results]
+    views = [
+        ItemView(item.id, item.name, item.description, item.price, item.quantity)
+        for item in entities
+    ]
+
+    def orm_load():
+        with Session(engine) as session:
+            return session.query(Item).all()
+
+    def legacy_chain():
+        items = [_entity_to_result(to_entity(model)) for model in orm_load()]
+        return _encode(AllItemsRepsonse(items=list(map(result_to_schema, items))))
+
+    def projection_load():
+        with Session(engine) as session:
+            rows = session.execute(select(*ITEM_VIEW_COLUMNS))
+            return list(map(ItemView._make, rows))
+
+    def fast_path():
+        return list_result_to_response(ListItemsResult(items=projection_load())).body
+
+    return {
+        "orm_load": orm_load,
+        "to_entity": lambda: [to_entity(model) for model in models],
+        "entity_to_result": lambda: list(map(_entity_to_result, entities)),
+        "result_to_schema": lambda: list(map(result_to_schema, results)),
+        "encode_schema": lambda: _encode(AllItemsRepsonse(items=schemas)),
+        "legacy_chain": legacy_chain,
+        "projection_load": projection_load,
+        "encode_views": lambda: list_result_to_response(
+            ListItemsResult(items=views)
+        ).body,
+        "fast_path": fast_path,
+    }
+
+
+def _cart_cases(engine, user_id) -> dict[str, Callable[[], Any]]:
+    with Session(engine) as session:
+        models = session.query(CartItem).filter(CartItem.user_id == user_id).all()
+        session.expunge_all()
+    entities = [cart_item_model_to_entity(model) for model in models]
+    cart = cart_items_to_result(entities)
+    schemas = [cart_item_result_to_schema(item) for item in cart.items]
+
+    def orm_load():
+        with Session(engine) as session:
+            return session.query(CartItem).filter(CartItem.user_id == user_id).all()
+
+    def legacy_chain():
+        result = cart_items_to_result(map(cart_item_model_to_entity, orm_load()))
+        schemas = list(map(cart_item_result_to_schema, result.items))
+        return _encode(AddToCartResponse(items=schemas))
+
+    def projection_load():
+        with Session(engine) as session:
+            rows = session.execute(
+                select(*CART_ITEM_COLUMNS).where(CartItem.user_id == user_id)
+            )
+            return [CartItemEntity(*row) for row in rows]
+
+    def fast_path():
+        return cart_result_to_response(cart_items_to_result(projection_load())).body
+
+    return {
+        "orm_load": orm_load,
+        "to_entity": lambda: list(map(cart_item_model_to_entity, models)),
+        "entity_to_result": lambda: cart_items_to_result(entities),
+        "result_to_schema": lambda: [
+            cart_item_result_to_schema(item) for item in cart.items
+        ],
+        "encode_schema": lambda: _encode(AddToCartResponse(items=schemas)),
+        "legacy_chain": legacy_chain,
+        "projection_load": projection_load,
+        "encode_views": lambda: cart_result_to_response(cart).body,
+        "fast_path": fast_path,
+    }
+
+
+def _time(function: Callable[[], Any]) -> list[float]:
+    """Run `function` for at least MIN_SECONDS, and at least 3 times."""
+    samples = []
+    deadline = time.perf_counter() + MIN_SECONDS
+    while len(samples) < 3 or (
+        time.perf_counter() < deadline and len(samples) < MAX_ROUNDS
+    ):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main(row_counts: list[int], name_filter: str) -> dict:
+    results = {}
+    for rows in row_counts:
+        engine, user_id = _seed(rows)
+        cases = {
+            "items": _item_cases(engine),
+            "cart": _cart_cases(engine, user_id),
+        }
+        for name, case in (
+            (f"{group}.{case_name}", case)
+            for group, group_cases in cases.items()
+            for case_name, case in group_cases.items()
+        ):
+            if name_filter not in name:
+                continue
+            samples = _time(case)
+            median = statistics.median(samples)
+            results[f"{name}[{rows}]"] = {
+                "rounds": len(samples),
+                "min_ms": round(min(samples) * 1000, 4),
+                "median_ms": round(median * 1000, 4),
+                "ns_per_row": round(median * 1e9 / rows, 1),
+            }
+            print(f"{name}[{rows}]: {median * 1000:.3f} ms", file=sys.stderr)
+        engine.dispose()
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=list(ROW_COUNTS))
+    parser.add_argument("--filter", default="", help="only cases containing this")
+    parser.add_argument("--output", default=None, help="write JSON here, not stdout")
+    args = parser.parse_args()
+
+    report = json.dumps(main(args.rows, args.filter), indent=2)
+    if args.output is None:
+        print(report)
+    else:
+        with open(args.output, "w") as output:
+            output.write(report + "\n")
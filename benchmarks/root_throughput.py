@@ -0,0 +1,39 @@
+"""Throughput benchmark for `GET /`, an endpoint that never touches the database.
+
+Runs in-process through the ASGI app by default, which isolates framework and
+middleware overhead from the network; pass `--base-url` to hit a live server.
+
+    python -m benchmarks.root_throughput --requests 20000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import json
+from dataclasses import asdict
+
+import httpx
+
+from benchmarks.harness import create_client, run_load
+
+
+async def main(base_url: str | None, concurrency: int, total_requests: int) -> None:
+    app = None
+    if base_url is None:
+        from be_task_ca.app import app
+
+    async def send(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        return await client.get("/")
+
+    async with create_client(base_url, concurrency, app=app) as client:
+        await run_load(client, send, min(total_requests, 500), concurrency)
+        result = await run_load(client, send, total_requests, concurrency)
+    print(json.dumps(asdict(result), indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main(args.base_url, args.concurrency, args.requests))
@@ -0,0 +1,163 @@
+"""Serialization cost of the item and cart listing bodies, per 10k rows.
+
+Encodes the same in-memory rows the way each response path does, without a
+database or HTTP in between:
+
+- `pydantic`: build the response model, then jsonable_encoder and json.dumps,
+  which is what FastAPI does with a returned model and a response model.
+- `json`: plain dicts rendered by a stdlib JSONResponse.
+- `orjson`: the dicts, or the cart result dataclasses, rendered by
+  ORJSONResponse, which the routers now use.
+- `snapshot`: the pre-serialized, gzip-compressed catalog snapshot that
+  serves the unpaginated item listing.
+- `orjson_zstd`, `orjson_br`, `orjson_gzip`: compressing the `orjson` body at
+  the default level of each coding, as the compression middleware does.
+
+    python -m benchmarks.serialization --rows 10000 --output serialization.json
+
+Reports are compatible with `python -m benchmarks.compare`.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import uuid
+from typing import Any, Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from starlette.requests import Request
+
+from be_task_ca.compression import DEFAULT_LEVELS, compress
+from be_task_ca.item.adapters.api.handlers import result_to_schema
+from be_task_ca.item.adapters.api.http_cache import snapshot_response
+from be_task_ca.item.adapters.api.schema import AllItemsRepsonse
+from be_task_ca.item.adapters.cache.catalog_snapshot import CatalogSnapshotStore
+from be_task_ca.item.adapters.serialization import item_to_json
+from be_task_ca.item.application.dto import CreateItemResult, ItemView
+from be_task_ca.user.adapters.api.handlers import cart_item_result_to_schema
+from be_task_ca.user.adapters.api.schema import AddToCartResponse
+from be_task_ca.user.application.dto import CartItemResult, ListCartItemsResult
+
+ROWS = 10_000
+MIN_SECONDS = 1.0
+
+
+def _item_cases(rows: int) -> dict[str, Callable[[], Any]]:
+    views = [
+        ItemView(uuid.uuid4(), f"item-{index:06d}", "Benchmark item", 9.99, index)
+        for index in range(rows)
+    ]
+    results = [CreateItemResult(*view) for view in views]
+
+    def pydantic():
+        body = AllItemsRepsonse(items=list(map(result_to_schema, results)))
+        return json.dumps(jsonable_encoder(body)).encode()
+
+    def stdlib_json():
+        items = [{**item_to_json(view), "id": str(view.id)} for view in views]
+        return JSONResponse({"items": items, "next_cursor": None}).body
+
+    def orjson():
+        items = list(map(item_to_json, views))
+        return ORJSONResponse({"items": items, "next_cursor": None}).body
+
+    snapshot = CatalogSnapshotStore(max_staleness=0).rebuild(views)
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/items/",
+            "query_string": b"",
+            "headers": [(b"accept-encoding", b"gzip")],
+        }
+    )
+
+    def from_snapshot():
+        return snapshot_response(request, snapshot).body
+
+    body = orjson()
+
+    def compressed(coding: str) -> Callable[[], bytes]:
+        return lambda: compress(body, coding, DEFAULT_LEVELS[coding])
+
+    return {
+        "pydantic": pydantic,
+        "json": stdlib_json,
+        "orjson": orjson,
+        "snapshot": from_snapshot,
+        **{f"orjson_{coding}": compressed(coding) for coding in DEFAULT_LEVELS},
+    }
+
+
+def _cart_cases(rows: int) -> dict[str, Callable[[], Any]]:
+    cart = ListCartItemsResult(
+        items=[CartItemResult(item_id=uuid.uuid4(), quantity=1) for _ in range(rows)]
+    )
+
+    def pydantic():
+        items = list(map(cart_item_result_to_schema, cart.items))
+        body = AddToCartResponse(items=items)
+        return json.dumps(jsonable_encoder(body)).encode()
+
+    def stdlib_json():
+        items = [
+            {"item_id": str(item.item_id), "quantity": item.quantity}
+            for item in cart.items
+        ]
+        return JSONResponse({"items": items}).body
+
+    def orjson():
+        return ORJSONResponse(cart).body
+
+    return {"pydantic": pydantic, "json": stdlib_json, "orjson": orjson}
+
+
+def _time(function: Callable[[], Any]) -> list[float]:
+    """Run `function` for at least MIN_SECONDS, and at least 5 times."""
+    samples = []
+    deadline = time.perf_counter() + MIN_SECONDS
+    while len(samples) < 5 or time.perf_counter() < deadline:
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main(rows: int) -> dict:
+    results = {}
+    for group, cases in (("items", _item_cases(rows)), ("cart", _cart_cases(rows))):
+        for name, case in cases.items():
+            body_bytes = len(case())
+            median = statistics.median(_time(case))
+            results[f"{group}.{name}"] = {
+                "median_ms": round(median * 1000, 3),
+                "ms_per_10k_rows": round(median * 1000 * 10_000 / rows, 3),
+                "body_bytes": body_bytes,
+            }
+            print(f"{group}.{name}: {median * 1000:.2f} ms", file=sys.stderr)
+    return {
+        "meta": {
+            "rows": rows,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=ROWS)
+    parser.add_argument("--output", default=None, help="write JSON here, not stdout")
+    args = parser.parse_args()
+
+    report = json.dumps(main(args.rows), indent=2)
+    if args.output is None:
+        print(report)
+    else:
+        with open(args.output, "w") as output:
+            output.write(report + "\n")
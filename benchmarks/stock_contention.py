@@ -0,0 +1,101 @@
+"""Oversell check: many parallel `POST /users/{user_id}/cart` for one scarce item.
+
+Run it against a live server:
+
+    python -m benchmarks.stock_contention --requests 500 --stock 100
+
+Every request comes from a different user and asks for one unit, so exactly
+`--stock` of them may succeed and the item must end at zero.
+"""
+
+import argparse
+import asyncio
+import json
+import uuid
+from collections import Counter
+from dataclasses import asdict
+
+import httpx
+
+from benchmarks.harness import create_client, run_load
+
+SEED_CONCURRENCY = 10
+
+
+async def _create_user(
+    client: httpx.AsyncClient, seed_slots: asyncio.Semaphore, email: str
+) -> str:
+    async with seed_slots:
+        response = await client.post(
+            "/users/",
+            json={
+                "first_name": "Load",
+                "last_name": "Test",
+                "email": email,
+                "password": "password",
+                "shipping_address": "Street 1",
+            },
+        )
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+async def main(base_url: str, total_requests: int, stock: int) -> None:
+    run_id = uuid.uuid4().hex[:8]
+    seed_slots = asyncio.Semaphore(SEED_CONCURRENCY)
+    async with create_client(base_url, total_requests) as client:
+        user_ids = await asyncio.gather(
+            *(
+                _create_user(
+                    client, seed_slots, f"contention-{run_id}-{index}@example.com"
+                )
+                for index in range(total_requests)
+            )
+        )
+        item = await client.post(
+            "/items/",
+            json={
+                "name": f"contention-{run_id}",
+                "description": "Scarce item",
+                "price": 1.0,
+                "quantity": stock,
+            },
+        )
+        item.raise_for_status()
+        item_id = item.json()["id"]
+
+        statuses = Counter()
+
+        async def send(client: httpx.AsyncClient, index: int) -> httpx.Response:
+            response = await client.post(
+                f"/users/{user_ids[index]}/cart",
+                json={"item_id": item_id, "quantity": 1},
+            )
+            statuses[response.status_code] += 1
+            return response
+
+        result = await run_load(client, send, total_requests, total_requests)
+        items = (await client.get("/items/")).json()["items"]
+        remaining = next(item["quantity"] for item in items if item["id"] == item_id)
+
+    print(
+        json.dumps(
+            {
+                **asdict(result),
+                "statuses": dict(statuses),
+                "stock": stock,
+                "remaining_stock": remaining,
+                "oversold": statuses[200] > stock or remaining < 0,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--stock", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.base_url, args.requests, args.stock))
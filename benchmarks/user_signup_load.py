@@ -0,0 +1,47 @@
+"""Load benchmark for `POST /users/`, whose password hashing runs on a worker pool.
+
+    BE_TASK_CA_DB_MODE=async poetry run start
+    python -m benchmarks.user_signup_load --concurrency 100 --requests 3000
+
+Every request registers a new email. Errors include the 503s returned once
+`BE_TASK_CA_PASSWORD_HASH_MAX_PENDING` hashing tasks are queued.
+"""
+
+import argparse
+import asyncio
+import json
+import uuid
+from dataclasses import asdict
+
+import httpx
+
+from benchmarks.harness import create_client, run_load
+
+
+async def main(base_url: str, concurrency: int, total_requests: int) -> None:
+    run_id = uuid.uuid4().hex[:8]
+
+    async def send(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        return await client.post(
+            "/users/",
+            json={
+                "first_name": "Load",
+                "last_name": "Test",
+                "email": f"signup-{run_id}-{index}@example.com",
+                "password": "password",
+                "shipping_address": "Street 1",
+            },
+        )
+
+    async with create_client(base_url, concurrency) as client:
+        result = await run_load(client, send, total_requests, concurrency)
+    print(json.dumps(asdict(result), indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=3000)
+    args = parser.parse_args()
+    asyncio.run(main(args.base_url, args.concurrency, args.requests))
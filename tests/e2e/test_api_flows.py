@@ -1,14 +1,22 @@
 import asyncio
-from uuid import UUID
+import json
+import threading
+from uuid import UUID, uuid4
 
-import be_task_ca.app as app_module
+import be_task_ca.common as common_module
 import httpx
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 
+import be_task_ca.item.adapters.api.api as item_api_module
+import be_task_ca.user.adapters.api.api as user_api_module
 from be_task_ca.app import app
 from be_task_ca.database import Base
+from be_task_ca.item.adapters.api.handlers import import_items
+from be_task_ca.item.adapters.cache.catalog_snapshot import CatalogSnapshotStore
+from be_task_ca.item.application.dto import ItemView
+from be_task_ca.user.adapters.cache.inventory_gateway import inventory_cache
 
 
 def _prepare_test_db(monkeypatch) -> None:
@@ -23,7 +31,7 @@ def _prepare_test_db(monkeypatch) -> None:
         bind=engine,
     )
     Base.metadata.create_all(bind=engine)
-    monkeypatch.setattr(app_module, "SessionLocal", testing_session_local)
+    monkeypatch.setattr(common_module, "SessionLocal", testing_session_local)
 
 
 async def _post(path: str, payload: dict) -> httpx.Response:
@@ -32,10 +40,51 @@ async def _post(path: str, payload: dict) -> httpx.Response:
         return await client.post(path, json=payload)
 
 
-async def _get(path: str) -> httpx.Response:
+async def _get(path: str, headers: dict | None = None) -> httpx.Response:
     transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
-        return await client.get(path)
+        return await client.get(path, headers=headers)
+
+
+def _create_items(*names: str) -> None:
+    for name in names:
+        asyncio.run(
+            _post(
+                "/items/",
+                {"name": name, "description": "Desc", "price": 1.0, "quantity": 1},
+            )
+        )
+
+
+def test_e2e_sync_routes_outlast_a_saturated_pool(monkeypatch, tmp_path):
+    # One pooled connection and more requests in flight than that: a route
+    # waiting for a connection must not keep the loop from returning another.
+    engine = create_engine(
+        f"sqlite+pysqlite:///{tmp_path / 'pool.db'}",
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=2,
+    )
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(
+        common_module, "SessionLocal", sessionmaker(autoflush=False, bind=engine)
+    )
+
+    async def scenario() -> list[int]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            responses = await asyncio.gather(
+                *(client.get("/items/", params={"limit": 10}) for _ in range(4)),
+                *(client.get("/items/search", params={"q": "pen"}) for _ in range(4)),
+                *(client.get(f"/users/{uuid4()}/cart") for _ in range(4)),
+            )
+        return [response.status_code for response in responses]
+
+    assert asyncio.run(scenario()) == [200] * 12
 
 
 def test_e2e_create_user_flow(monkeypatch):
@@ -60,6 +109,67 @@ def test_e2e_create_user_flow(monkeypatch):
     assert UUID(body["id"])
 
 
+class _GatedPasswordHasher:
+    """Hashes only once released, so a request can be held mid-hash.
+
+    `released_in_time` records whether the release came while hashing waited.
+    """
+
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.released = threading.Event()
+        self.released_in_time = False
+
+    def hash(self, password: str) -> str:
+        return self.hash_many([password])[0]
+
+    def hash_many(self, passwords: list[str]) -> list[str]:
+        self.started.set()
+        self.released_in_time = self.released.wait(timeout=2)
+        return [f"hashed-{password}" for password in passwords]
+
+
+def test_e2e_create_user_keeps_event_loop_responsive_while_hashing(monkeypatch):
+    _prepare_test_db(monkeypatch)
+    hasher = _GatedPasswordHasher()
+    monkeypatch.setattr(user_api_module, "password_hasher", lambda: hasher)
+    user = {
+        "first_name": "Marko",
+        "last_name": "Crnic",
+        "password": "password",
+        "shipping_address": "Street 1",
+    }
+
+    async def create(send) -> tuple[bool, int]:
+        request = asyncio.create_task(send())
+        while not hasher.started.is_set():
+            await asyncio.sleep(0.01)
+        hasher.released.set()
+        response = await request
+        hasher.started.clear()
+        hasher.released.clear()
+        return hasher.released_in_time, response.status_code
+
+    async def scenario() -> list[tuple[bool, int]]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            single = await create(
+                lambda: client.post(
+                    "/users/", json={**user, "email": "marko@example.com"}
+                )
+            )
+            bulk = await create(
+                lambda: client.post(
+                    "/users/bulk", json=[{**user, "email": "ana@example.com"}]
+                )
+            )
+            return [single, bulk]
+
+    assert asyncio.run(scenario()) == [(True, 200), (True, 200)]
+
+
 def test_e2e_create_item_flow(monkeypatch):
     _prepare_test_db(monkeypatch)
 
@@ -81,6 +191,110 @@ def test_e2e_create_item_flow(monkeypatch):
     assert UUID(body["id"])
 
 
+def test_e2e_bulk_import_items_flow(monkeypatch):
+    _prepare_test_db(monkeypatch)
+    _create_items("Pen")
+    item = {"description": "Desc", "price": 1.0, "quantity": 1}
+
+    async def import_items():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            from_json = await client.post(
+                "/items/bulk",
+                json=[{**item, "name": "Book"}, {**item, "name": "Pen"}],
+            )
+            from_ndjson = await client.post(
+                "/items/bulk",
+                content="\n".join(
+                    json.dumps({**item, "name": name}) for name in ("Book", "Lamp")
+                ),
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+            return from_json, from_ndjson
+
+    from_json, from_ndjson = asyncio.run(import_items())
+
+    assert from_json.status_code == 200
+    assert [(row["name"], row["status"]) for row in from_json.json()["items"]] == [
+        ("Book", "created"),
+        ("Pen", "conflict"),
+    ]
+    assert from_ndjson.json()["created"] == 1
+    assert from_ndjson.json()["conflicts"] == 1
+    listed = asyncio.run(_get("/items/")).json()["items"]
+    assert sorted(row["name"] for row in listed) == ["Book", "Lamp", "Pen"]
+
+
+def test_e2e_bulk_import_items_keeps_event_loop_responsive(monkeypatch):
+    _prepare_test_db(monkeypatch)
+    started, released = threading.Event(), threading.Event()
+    released_in_time = []
+
+    def gated_import_items(commands, use_case):
+        started.set()
+        released_in_time.append(released.wait(timeout=2))
+        return import_items(commands, use_case)
+
+    monkeypatch.setattr(item_api_module, "import_items", gated_import_items)
+    item = {"name": "Pen", "description": "Desc", "price": 1.0, "quantity": 1}
+
+    async def scenario() -> int:
+        request = asyncio.create_task(_post("/items/bulk", [item]))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        released.set()
+        return (await request).status_code
+
+    assert asyncio.run(scenario()) == 200
+    assert released_in_time == [True]
+
+
+def test_e2e_bulk_create_users_flow(monkeypatch):
+    _prepare_test_db(monkeypatch)
+    user = {
+        "first_name": "Marko",
+        "last_name": "Crnic",
+        "password": "secret",
+        "shipping_address": "Street 1",
+    }
+    asyncio.run(_post("/users/", {**user, "email": "taken@example.com"}))
+
+    async def create_users():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            from_json = await client.post(
+                "/users/bulk",
+                json=[
+                    {**user, "email": "new@example.com"},
+                    {**user, "email": "taken@example.com"},
+                ],
+            )
+            from_ndjson = await client.post(
+                "/users/bulk",
+                content="\n".join(
+                    json.dumps({**user, "email": email})
+                    for email in ("new@example.com", "other@example.com")
+                ),
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+            return from_json, from_ndjson
+
+    from_json, from_ndjson = asyncio.run(create_users())
+
+    assert from_json.status_code == 200
+    assert [(row["email"], row["status"]) for row in from_json.json()["users"]] == [
+        ("new@example.com", "created"),
+        ("taken@example.com", "conflict"),
+    ]
+    assert UUID(from_json.json()["users"][0]["id"])
+    assert from_ndjson.json()["created"] == 1
+    assert from_ndjson.json()["conflicts"] == 1
+
+
 def test_e2e_add_item_to_cart_flow(monkeypatch):
     _prepare_test_db(monkeypatch)
 
@@ -122,6 +336,93 @@ def test_e2e_add_item_to_cart_flow(monkeypatch):
     assert body["items"][0]["quantity"] == 2
 
 
+def test_e2e_add_items_to_cart_batch_flow(monkeypatch):
+    _prepare_test_db(monkeypatch)
+    _create_items("Pen", "Book")
+    user = asyncio.run(
+        _post(
+            "/users/",
+            {
+                "first_name": "Marko",
+                "last_name": "Crnic",
+                "email": "marko@example.com",
+                "password": "password",
+                "shipping_address": "Street 1",
+            },
+        )
+    ).json()
+    listed = asyncio.run(_get("/items/")).json()["items"]
+    items = {item["name"]: item["id"] for item in listed}
+    path = f"/users/{user['id']}/cart/batch"
+
+    rejected = asyncio.run(
+        _post(
+            path,
+            {
+                "items": [
+                    {"item_id": items["Pen"], "quantity": 1},
+                    {"item_id": items["Book"], "quantity": 2},
+                    {"item_id": user["id"], "quantity": 1},
+                ]
+            },
+        )
+    )
+    unchanged = asyncio.run(_get(f"/users/{user['id']}/cart")).json()
+    cached_pen = inventory_cache.get(UUID(items["Pen"]))
+    added = asyncio.run(
+        _post(
+            path,
+            {
+                "items": [
+                    {"item_id": items["Pen"], "quantity": 1},
+                    {"item_id": items["Book"], "quantity": 1},
+                ]
+            },
+        )
+    )
+    listed = asyncio.run(_get("/items/")).json()["items"]
+    stock = {item["name"]: item["quantity"] for item in listed}
+
+    assert rejected.status_code == 409
+    errors = [(error["index"], error["status"]) for error in rejected.json()["detail"]]
+    assert errors == [(1, 409), (2, 404)]
+    assert unchanged == {"items": [], "total": 0}
+    assert cached_pen.quantity == 1
+    assert inventory_cache.get(UUID(items["Pen"])) is None
+    assert added.status_code == 200
+    assert len(added.json()["items"]) == 2
+    assert stock == {"Book": 0, "Pen": 0}
+
+
+def test_e2e_add_to_cart_rejects_non_positive_quantity_flow(monkeypatch):
+    _prepare_test_db(monkeypatch)
+    _create_items("Pen")
+    user = asyncio.run(
+        _post(
+            "/users/",
+            {
+                "first_name": "Marko",
+                "last_name": "Crnic",
+                "email": "marko@example.com",
+                "password": "password",
+                "shipping_address": "Street 1",
+            },
+        )
+    ).json()
+    item_id = asyncio.run(_get("/items/")).json()["items"][0]["id"]
+    path = f"/users/{user['id']}/cart"
+
+    single = asyncio.run(_post(path, {"item_id": item_id, "quantity": -1}))
+    batch = asyncio.run(
+        _post(f"{path}/batch", {"items": [{"item_id": item_id, "quantity": 0}]})
+    )
+    stock = asyncio.run(_get("/items/")).json()["items"][0]["quantity"]
+
+    assert single.status_code == 422
+    assert batch.status_code == 422
+    assert stock == 1
+
+
 def test_e2e_get_items_flow(monkeypatch):
     _prepare_test_db(monkeypatch)
 
@@ -143,3 +444,125 @@ def test_e2e_get_items_flow(monkeypatch):
     body = response.json()
     assert len(body["items"]) == 1
     assert body["items"][0]["name"] == "Book"
+
+
+def test_e2e_get_items_paginated_flow(monkeypatch):
+    _prepare_test_db(monkeypatch)
+    _create_items("Pen", "Book", "Lamp")
+
+    first_page = asyncio.run(_get("/items/?limit=2")).json()
+    second_page = asyncio.run(
+        _get(f"/items/?limit=2&after={first_page['next_cursor']}")
+    ).json()
+
+    assert [item["name"] for item in first_page["items"]] == ["Book", "Lamp"]
+    assert [item["name"] for item in second_page["items"]] == ["Pen"]
+    assert second_page["next_cursor"] is None
+
+
+def test_e2e_search_items_flow(monkeypatch):
+    _prepare_test_db(monkeypatch)
+    _create_items("Desk lamp", "Floor lamp", "Pen")
+
+    response = asyncio.run(_get("/items/search?q=LAMP&limit=1"))
+    unmatched = asyncio.run(_get("/items/search?q=lampshade"))
+    revalidated = asyncio.run(
+        _get(
+            "/items/search?q=LAMP&limit=1",
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+    )
+
+    assert [item["name"] for item in response.json()["items"]] == ["Desk lamp"]
+    assert response.json()["next_cursor"] is not None
+    assert unmatched.json() == {"items": [], "next_cursor": None}
+    assert revalidated.status_code == 304
+
+
+def test_e2e_stream_items_as_ndjson_flow(monkeypatch):
+    _prepare_test_db(monkeypatch)
+    _create_items("Pen", "Book")
+
+    response = asyncio.run(_get("/items/", headers={"Accept": "application/x-ndjson"}))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["name"] for line in lines] == ["Book", "Pen"]
+    assert UUID(lines[0]["id"])
+
+
+def test_e2e_get_items_from_catalog_snapshot_flow(monkeypatch):
+    _prepare_test_db(monkeypatch)
+    store = CatalogSnapshotStore(max_staleness=1.0)
+    monkeypatch.setattr(item_api_module, "catalog_snapshots", store)
+    _create_items("Pen")
+    from_database = asyncio.run(_get("/items/"))
+    store.rebuild(
+        ItemView(UUID(item["id"]), item["name"], item["description"], item["price"], 1)
+        for item in from_database.json()["items"]
+    )
+    unreachable = create_engine("sqlite://", creator=_refuse_connection)
+    monkeypatch.setattr(common_module, "SessionLocal", sessionmaker(bind=unreachable))
+
+    from_snapshot = asyncio.run(_get("/items/", headers={"Accept-Encoding": "gzip"}))
+
+    assert from_snapshot.status_code == 200
+    assert from_snapshot.headers["Content-Encoding"] == "gzip"
+    assert from_snapshot.json() == from_database.json()
+
+
+def _refuse_connection():
+    raise AssertionError("the database must not be queried")
+
+
+def test_e2e_get_items_conditional_flow(monkeypatch):
+    _prepare_test_db(monkeypatch)
+    _create_items("Pen")
+
+    listed = asyncio.run(_get("/items/"))
+    etag = listed.headers["ETag"]
+    unreachable = create_engine("sqlite://", creator=_refuse_connection)
+    monkeypatch.setattr(common_module, "SessionLocal", sessionmaker(bind=unreachable))
+    revalidated = asyncio.run(_get("/items/", headers={"If-None-Match": etag}))
+    _prepare_test_db(monkeypatch)
+    _create_items("Book")
+    changed = asyncio.run(_get("/items/", headers={"If-None-Match": etag}))
+
+    assert listed.headers["Cache-Control"] == "no-cache"
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["ETag"] == etag
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert [item["name"] for item in changed.json()["items"]] == ["Book"]
+
+
+def test_e2e_get_items_compressed_flow(monkeypatch):
+    _prepare_test_db(monkeypatch)
+    _create_items(*(f"Item {index:02d}" for index in range(20)))
+
+    listed = asyncio.run(
+        _get("/items/?limit=20", headers={"Accept-Encoding": "br"})
+    )
+    etag = listed.headers["ETag"]
+    revalidated = asyncio.run(
+        _get("/items/?limit=20", headers={"If-None-Match": etag})
+    )
+
+    assert listed.headers["Content-Encoding"] == "br"
+    assert etag.startswith("W/")
+    assert len(listed.json()["items"]) == 20
+    assert revalidated.status_code == 304
+
+
+def test_e2e_root_does_not_open_db_session(monkeypatch):
+    opened_sessions = []
+    monkeypatch.setattr(
+        common_module, "SessionLocal", lambda: opened_sessions.append(1)
+    )
+
+    response = asyncio.run(_get("/"))
+
+    assert response.status_code == 200
+    assert opened_sessions == []
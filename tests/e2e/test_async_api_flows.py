@@ -0,0 +1,269 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from uuid import UUID
+
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from be_task_ca.app import DB_MODE_ASYNC, create_app
+from be_task_ca.common import get_async_db
+from be_task_ca.database import Base
+
+
+def _create_async_app():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    testing_session_local = async_sessionmaker(
+        bind=engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+    async def create_schema():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    async def override_get_async_db():
+        async with testing_session_local() as db:
+            yield db
+
+    asyncio.run(create_schema())
+    app = create_app(DB_MODE_ASYNC)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return app
+
+
+async def _run_add_to_cart_flow(
+    app,
+) -> tuple[dict, dict, httpx.Response, httpx.Response]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        user = (
+            await client.post(
+                "/users/",
+                json={
+                    "first_name": "Marko",
+                    "last_name": "Crnic",
+                    "email": "marko@example.com",
+                    "password": "password",
+                    "shipping_address": "Street 1",
+                },
+            )
+        ).json()
+        item = (
+            await client.post(
+                "/items/",
+                json={
+                    "name": "Keyboard",
+                    "description": "Mechanical",
+                    "price": 99.0,
+                    "quantity": 5,
+                },
+            )
+        ).json()
+        # Caches the empty cart, which the add below must invalidate.
+        await client.get(f"/users/{user['id']}/cart")
+        added = await client.post(
+            f"/users/{user['id']}/cart",
+            json={"item_id": item["id"], "quantity": 2},
+        )
+        listed = await client.get(f"/users/{user['id']}/cart")
+        return user, item, added, listed
+
+
+def test_e2e_async_add_item_to_cart_flow():
+    user, item, added, listed = asyncio.run(_run_add_to_cart_flow(_create_async_app()))
+
+    assert UUID(user["id"])
+    assert added.status_code == 200
+    assert added.json()["items"] == [{"item_id": item["id"], "quantity": 2}]
+    cart = listed.json()
+    expires_at = datetime.fromisoformat(cart["items"][0].pop("expires_at"))
+    assert cart == {
+        "items": [
+            {
+                "item_id": item["id"],
+                "quantity": 2,
+                "name": "Keyboard",
+                "price": 99.0,
+                "line_total": 198.0,
+            }
+        ],
+        "total": 198.0,
+    }
+    assert expires_at > datetime.now(timezone.utc)
+
+
+def test_e2e_async_get_items_flow():
+    async def run(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            for name in ("Book", "Pen"):
+                await client.post(
+                    "/items/",
+                    json={
+                        "name": name,
+                        "description": "Desc",
+                        "price": 1.0,
+                        "quantity": 1,
+                    },
+                )
+            duplicate = await client.post(
+                "/items/",
+                json={
+                    "name": "Pen",
+                    "description": "Desc",
+                    "price": 1.0,
+                    "quantity": 1,
+                },
+            )
+            return duplicate, await client.get("/items/")
+
+    duplicate, response = asyncio.run(run(_create_async_app()))
+
+    assert duplicate.status_code == 409
+    assert sorted(item["name"] for item in response.json()["items"]) == ["Book", "Pen"]
+
+
+def test_e2e_async_paginate_and_stream_items_flow():
+    async def run(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            for name in ("Pen", "Book", "Lamp"):
+                await client.post(
+                    "/items/",
+                    json={
+                        "name": name,
+                        "description": "Desc",
+                        "price": 1.0,
+                        "quantity": 1,
+                    },
+                )
+            first_page = (await client.get("/items/", params={"limit": 2})).json()
+            second_page = (
+                await client.get(
+                    "/items/", params={"limit": 2, "after": first_page["next_cursor"]}
+                )
+            ).json()
+            streamed = await client.get(
+                "/items/", headers={"Accept": "application/x-ndjson"}
+            )
+            return first_page, second_page, streamed
+
+    first_page, second_page, streamed = asyncio.run(run(_create_async_app()))
+
+    assert [item["name"] for item in first_page["items"]] == ["Book", "Lamp"]
+    assert [item["name"] for item in second_page["items"]] == ["Pen"]
+    assert second_page["next_cursor"] is None
+    assert [json.loads(line)["name"] for line in streamed.text.splitlines()] == [
+        "Book",
+        "Lamp",
+        "Pen",
+    ]
+
+
+def test_e2e_async_search_items_flow():
+    async def run(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            for name, price, quantity in (
+                ("Desk lamp", 30.0, 2),
+                ("Floor lamp", 80.0, 0),
+                ("Pen", 2.0, 10),
+            ):
+                await client.post(
+                    "/items/",
+                    json={
+                        "name": name,
+                        "description": "Desc",
+                        "price": price,
+                        "quantity": quantity,
+                    },
+                )
+            params = {"q": "lam", "limit": 1}
+            first_page = await client.get("/items/search", params=params)
+            second_page = await client.get(
+                "/items/search",
+                params={**params, "after": first_page.json()["next_cursor"]},
+            )
+            filtered = await client.get(
+                "/items/search", params={"q": "lamp", "max_price": 50, "in_stock": True}
+            )
+            invalid = await client.get("/items/search", params={"min_price": -1})
+            return first_page, second_page, filtered, invalid
+
+    first_page, second_page, filtered, invalid = asyncio.run(run(_create_async_app()))
+
+    assert [item["name"] for item in first_page.json()["items"]] == ["Desk lamp"]
+    assert [item["name"] for item in second_page.json()["items"]] == ["Floor lamp"]
+    assert second_page.json()["next_cursor"] is None
+    assert [item["name"] for item in filtered.json()["items"]] == ["Desk lamp"]
+    assert first_page.headers["ETag"] != second_page.headers["ETag"]
+    assert invalid.status_code == 422
+
+
+def test_e2e_async_bulk_import_items_flow():
+    async def run(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            imported = await client.post(
+                "/items/bulk",
+                json=[
+                    {"name": name, "description": "Desc", "price": 1.0, "quantity": 1}
+                    for name in ("Book", "Pen", "Book")
+                ],
+            )
+            return imported, await client.get("/items/")
+
+    imported, listed = asyncio.run(run(_create_async_app()))
+
+    assert imported.status_code == 200
+    assert [row["status"] for row in imported.json()["items"]] == [
+        "created",
+        "created",
+        "conflict",
+    ]
+    assert sorted(item["name"] for item in listed.json()["items"]) == ["Book", "Pen"]
+
+
+def test_e2e_async_bulk_create_users_flow():
+    async def run(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await client.post(
+                "/users/bulk",
+                json=[
+                    {
+                        "first_name": "Marko",
+                        "last_name": "Crnic",
+                        "email": email,
+                        "password": "secret",
+                        "shipping_address": "Street 1",
+                    }
+                    for email in ("a@example.com", "b@example.com", "a@example.com")
+                ],
+            )
+
+    created = asyncio.run(run(_create_async_app()))
+
+    assert created.status_code == 200
+    assert [row["status"] for row in created.json()["users"]] == [
+        "created",
+        "created",
+        "conflict",
+    ]
@@ -0,0 +1,203 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import NotSupportedError, OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from be_task_ca.app import DB_MODE_ASYNC, create_app
+from be_task_ca.common import get_async_db
+from be_task_ca.database import Base
+from be_task_ca.item.adapters.db.model import Item, StockReservation
+from be_task_ca.settings import settings
+from be_task_ca.transactions import SqlAlchemyUnitOfWork
+from be_task_ca.user.adapters.db.cart_repository import SqlAlchemyCartRepository
+from be_task_ca.user.adapters.db.inventory_gateway import SqlAlchemyInventoryGateway
+from be_task_ca.user.adapters.db.model import CartItem, User
+from be_task_ca.user.application.dto import AddToCartCommand
+from be_task_ca.user.application.exceptions import NotEnoughStockError
+from be_task_ca.user.application.usecases.add_item_to_cart import AddItemToCartUseCase
+
+PARALLEL_REQUESTS = 500
+STOCK = 100
+
+
+@pytest.fixture
+def postgres_database():
+    """A throwaway database on the configured Postgres server, dropped afterwards.
+
+    Skips when the server is unreachable or lacks the pg_trgm extension the
+    schema needs.
+    """
+    server_url = make_url(settings.database_url)
+    server = create_engine(
+        server_url, isolation_level="AUTOCOMMIT", connect_args={"connect_timeout": 5}
+    )
+    name = f"stress_{uuid4().hex}"
+    try:
+        with server.connect() as connection:
+            connection.execute(text(f'CREATE DATABASE "{name}"'))
+    except OperationalError as exc:
+        server.dispose()
+        pytest.skip(f"Postgres is not reachable: {_first_line(exc.orig)}")
+    try:
+        engine = create_engine(server_url.set(database=name))
+        try:
+            Base.metadata.create_all(bind=engine)
+        except NotSupportedError as exc:
+            pytest.skip(f"Postgres cannot create the schema: {_first_line(exc.orig)}")
+        finally:
+            engine.dispose()
+        yield name
+    finally:
+        with server.connect() as connection:
+            connection.execute(text(f'DROP DATABASE "{name}" WITH (FORCE)'))
+        server.dispose()
+
+
+def _first_line(error) -> str:
+    return str(error).splitlines()[0]
+
+
+def _seed(engine):
+    Base.metadata.create_all(bind=engine)
+    users = [
+        User(
+            email=f"user-{index}@example.com",
+            first_name="Load",
+            last_name="Test",
+            hashed_password="hash",
+            shipping_address="Street 1",
+        )
+        for index in range(PARALLEL_REQUESTS)
+    ]
+    item = Item(name="Last units", description="Desc", price=1.0, quantity=STOCK)
+    with sessionmaker(bind=engine)() as db:
+        db.add_all([*users, item])
+        db.commit()
+        return [user.id for user in users], item.id
+
+
+def _assert_not_oversold(engine, item_id, succeeded):
+    with sessionmaker(bind=engine)() as db:
+        assert succeeded == STOCK
+        assert db.get(Item, item_id).quantity == 0
+        assert db.scalar(select(func.count()).select_from(CartItem)) == STOCK
+        assert db.scalar(select(func.sum(StockReservation.quantity))) == STOCK
+
+
+def test_parallel_add_to_cart_does_not_oversell(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'stress.db'}",
+        connect_args={"check_same_thread": False, "timeout": 60},
+        pool_size=20,
+    )
+
+    _assert_parallel_add_to_cart_does_not_oversell(engine)
+
+
+@pytest.mark.postgres
+def test_parallel_add_to_cart_does_not_oversell_on_postgres(postgres_database):
+    engine = create_engine(
+        make_url(settings.database_url).set(database=postgres_database),
+        pool_size=20,
+    )
+    try:
+        _assert_parallel_add_to_cart_does_not_oversell(engine)
+    finally:
+        engine.dispose()
+
+
+def test_parallel_async_add_to_cart_requests_do_not_oversell(tmp_path):
+    path = tmp_path / "stress-async.db"
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}", connect_args={"timeout": 60}, pool_size=20
+    )
+
+    _assert_parallel_async_requests_do_not_oversell(
+        create_engine(f"sqlite:///{path}"), async_engine
+    )
+
+
+@pytest.mark.postgres
+def test_parallel_async_add_to_cart_requests_do_not_oversell_on_postgres(
+    postgres_database,
+):
+    engine = create_engine(
+        make_url(settings.database_url).set(database=postgres_database)
+    )
+    async_engine = create_async_engine(
+        make_url(settings.async_database_url).set(database=postgres_database),
+        pool_size=20,
+    )
+    try:
+        _assert_parallel_async_requests_do_not_oversell(engine, async_engine)
+    finally:
+        engine.dispose()
+
+
+def _assert_parallel_add_to_cart_does_not_oversell(engine):
+    user_ids, item_id = _seed(engine)
+    session_local = sessionmaker(autoflush=False, bind=engine)
+
+    def add_to_cart(user_id) -> bool:
+        with session_local() as db:
+            use_case = AddItemToCartUseCase(
+                SqlAlchemyCartRepository(db),
+                SqlAlchemyInventoryGateway(db),
+                SqlAlchemyUnitOfWork(db),
+            )
+            try:
+                use_case.execute(
+                    AddToCartCommand(user_id=user_id, item_id=item_id, quantity=1)
+                )
+            except NotEnoughStockError:
+                return False
+            return True
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        results = list(executor.map(add_to_cart, user_ids))
+
+    _assert_not_oversold(engine, item_id, sum(results))
+
+
+def _assert_parallel_async_requests_do_not_oversell(engine, async_engine):
+    user_ids, item_id = _seed(engine)
+    session_local = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+
+    async def override_get_async_db():
+        async with session_local() as db:
+            yield db
+
+    app = create_app(DB_MODE_ASYNC)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    async def send_all() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test", timeout=120
+        ) as client:
+            return await asyncio.gather(
+                *(
+                    client.post(
+                        f"/users/{user_id}/cart",
+                        json={"item_id": str(item_id), "quantity": 1},
+                    )
+                    for user_id in user_ids
+                )
+            )
+
+    responses = asyncio.run(send_all())
+    asyncio.run(async_engine.dispose())
+
+    assert {response.status_code for response in responses} <= {200, 409}
+    _assert_not_oversold(
+        engine, item_id, sum(response.status_code == 200 for response in responses)
+    )
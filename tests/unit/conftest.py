@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -7,6 +9,7 @@ from be_task_ca.database import Base
 # Ensure model tables are registered on Base metadata
 from be_task_ca.item.adapters.db import model as _item_model  # noqa: F401
 from be_task_ca.user.adapters.db import model as _user_model  # noqa: F401
+from be_task_ca.user.adapters.password_hashing import HashQueue, PooledPasswordHasher
 
 
 def _create_test_session():
@@ -23,3 +26,9 @@ def db_session():
         yield db
     finally:
         db.close()
+
+
+@pytest.fixture
+def password_hasher():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield PooledPasswordHasher(HashQueue(executor, max_pending=8))
@@ -0,0 +1,120 @@
+import brotli
+import pytest
+from starlette.requests import Request
+
+from be_task_ca.item.adapters.api.http_cache import (
+    CacheValidators,
+    cache_headers,
+    is_not_modified,
+    listing_validators,
+    preferred_content_coding,
+    snapshot_response,
+)
+from be_task_ca.item.adapters.cache.catalog_snapshot import CatalogSnapshot
+from be_task_ca.item.adapters.cache.catalog_version import CatalogState
+
+VALIDATORS = CacheValidators(etag='"abc.1-0f"', last_modified=784111777)
+
+
+def _request(headers: dict | None = None, query: str = "") -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/items/",
+            "query_string": query.encode(),
+            "headers": [
+                (name.lower().encode(), value.encode())
+                for name, value in (headers or {}).items()
+            ],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        ('"abc.1-0f"', True),
+        ('"other", W/"abc.1-0f"', True),
+        ("*", True),
+        ('"abc.0-0f"', False),
+    ],
+)
+def test_should_match_if_none_match(if_none_match, expected):
+    request = _request({"If-None-Match": if_none_match})
+
+    assert is_not_modified(request, VALIDATORS) is expected
+
+
+@pytest.mark.parametrize(
+    "if_modified_since, expected",
+    [
+        ("Sun, 06 Nov 1994 08:49:37 GMT", True),
+        ("Sun, 06 Nov 1994 08:49:36 GMT", False),
+        ("not a date", False),
+    ],
+)
+def test_should_compare_if_modified_since(if_modified_since, expected):
+    request = _request({"If-Modified-Since": if_modified_since})
+
+    assert is_not_modified(request, VALIDATORS) is expected
+
+
+def test_should_prefer_if_none_match_over_if_modified_since():
+    request = _request(
+        {
+            "If-None-Match": '"stale"',
+            "If-Modified-Since": "Sun, 06 Nov 1994 08:49:37 GMT",
+        }
+    )
+
+    assert not is_not_modified(request, VALIDATORS)
+
+
+def test_should_tag_each_page_and_format_separately():
+    state = CatalogState("abc.1", 784111777.5)
+
+    first_page = listing_validators(_request(query="limit=10"), state, ndjson=False)
+    other_page = listing_validators(_request(query="limit=20"), state, ndjson=False)
+    ndjson = listing_validators(_request(query="limit=10"), state, ndjson=True)
+
+    assert len({first_page.etag, other_page.etag, ndjson.etag}) == 3
+    assert first_page.last_modified == 784111777
+    assert cache_headers(first_page)["Last-Modified"] == "Sun, 06 Nov 1994 08:49:37 GMT"
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0, gzip;q=0.5", "gzip"),
+        ("*", "br"),
+        ("identity", None),
+        (None, None),
+    ],
+)
+def test_should_prefer_brotli_then_gzip(accept_encoding, expected):
+    assert preferred_content_coding(accept_encoding) == expected
+
+
+def test_should_serve_the_snapshot_variant_with_its_own_etag():
+    snapshot = CatalogSnapshot(
+        state=CatalogState("digest", 784111777.0),
+        identity=b"plain",
+        items=0,
+    )
+
+    plain = snapshot_response(_request(), snapshot)
+    compressed = snapshot_response(_request({"Accept-Encoding": "br"}), snapshot)
+    etag = compressed.headers["ETag"]
+    revalidated = snapshot_response(
+        _request({"Accept-Encoding": "br", "If-None-Match": etag}), snapshot
+    )
+
+    assert plain.body == b"plain"
+    assert "content-encoding" not in plain.headers
+    assert brotli.decompress(compressed.body) == b"plain"
+    assert compressed.headers["Content-Encoding"] == "br"
+    assert compressed.headers["ETag"] != plain.headers["ETag"]
+    assert revalidated.status_code == 304
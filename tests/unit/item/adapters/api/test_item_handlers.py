@@ -1,11 +1,23 @@
+import json
 from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
 
-from be_task_ca.item.adapters.api.handlers import create_item, get_all
-from be_task_ca.item.adapters.api.schema import CreateItemRequest
-from be_task_ca.item.application.dto import CreateItemResult, ListItemsResult
+from be_task_ca.item.adapters.api.handlers import (
+    create_item,
+    decode_cursor,
+    encode_cursor,
+    get_all,
+    parse_import_body,
+)
+from be_task_ca.item.adapters.api.schema import AllItemsRepsonse, CreateItemRequest
+from be_task_ca.item.application.dto import (
+    CreateItemResult,
+    ItemCursor,
+    ItemView,
+    ListItemsResult,
+)
 from be_task_ca.item.application.exceptions import ItemAlreadyExistsError
 
 
@@ -67,21 +79,49 @@ def test_should_return_create_item_response_when_use_case_succeeds():
 
 
 def test_should_return_all_items_response_when_listing_items():
-    use_case = MockListItemsUseCase(
-        result=ListItemsResult(
-            items=[
-                CreateItemResult(
-                    id=uuid4(),
-                    name="Keyboard",
-                    description="Mechanical",
-                    price=99.0,
-                    quantity=5,
-                )
-            ]
-        )
+    item = ItemView(
+        id=uuid4(), name="Keyboard", description="Mechanical", price=99.0, quantity=5
     )
+    use_case = MockListItemsUseCase(result=ListItemsResult(items=[item]))
 
     response = get_all(use_case)
 
-    assert len(response.items) == 1
-    assert response.items[0].name == "Keyboard"
+    assert AllItemsRepsonse.parse_raw(response.body) == AllItemsRepsonse(
+        items=[item._asdict()], next_cursor=None
+    )
+
+
+def test_should_round_trip_item_cursor():
+    cursor = ItemCursor(name="Keyboard, mechanical", id=uuid4())
+
+    assert decode_cursor(encode_cursor(cursor)) == cursor
+
+
+def test_should_map_invalid_cursor_to_http_400():
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor("not-a-cursor")
+
+    assert exc_info.value.status_code == 400
+
+
+def test_should_parse_import_body_as_json_array_or_ndjson():
+    item = {"name": "Book", "description": "Desc", "price": 1.0, "quantity": 1}
+    rows = [item, {**item, "name": "Pen"}]
+    json_body = json.dumps(rows).encode()
+    ndjson_body = b"\n".join(json.dumps(row).encode() for row in rows)
+
+    from_json = parse_import_body(json_body, "application/json")
+    from_ndjson = parse_import_body(ndjson_body + b"\n", "application/x-ndjson")
+
+    assert [command.name for command in from_json] == ["Book", "Pen"]
+    assert from_ndjson == from_json
+
+
+def test_should_map_invalid_import_line_to_http_422():
+    body = b'{"name": "Book", "price": 1.0, "quantity": 1}\n{"name": "Pen"}'
+
+    with pytest.raises(HTTPException) as exc_info:
+        parse_import_body(body, "application/x-ndjson")
+
+    assert exc_info.value.status_code == 422
+    assert exc_info.value.detail.startswith("Line 2:")
@@ -0,0 +1,149 @@
+import asyncio
+import gzip
+import json
+from uuid import uuid4
+
+import brotli
+import pytest
+
+from be_task_ca.item.adapters.cache.catalog_snapshot import CatalogSnapshotStore
+from be_task_ca.item.adapters.catalog_snapshot_refresher import (
+    CatalogSnapshotRefresher,
+)
+from be_task_ca.item.application.dto import ItemView
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _item(name: str, quantity: int = 1) -> ItemView:
+    return ItemView(uuid4(), name, "Desc", 1.0, quantity)
+
+
+def _names(body: bytes) -> list[str]:
+    return [item["name"] for item in json.loads(body)["items"]]
+
+
+def test_should_encode_items_ordered_by_name_in_every_coding():
+    store = CatalogSnapshotStore(max_staleness=1.0)
+
+    snapshot = store.rebuild([_item("Pen"), _item("Book")])
+
+    assert _names(snapshot.identity) == ["Book", "Pen"]
+    assert json.loads(snapshot.identity)["next_cursor"] is None
+    assert gzip.decompress(snapshot.gzip) == snapshot.identity
+    assert brotli.decompress(snapshot.br) == snapshot.identity
+    assert store.get() is snapshot
+
+
+def test_should_compress_each_variant_only_when_first_requested():
+    store = CatalogSnapshotStore(max_staleness=1.0)
+
+    snapshot = store.rebuild([_item("Pen")])
+    encoded_before = {"gzip", "br"} & vars(snapshot).keys()
+    snapshot.body("br")
+
+    assert encoded_before == set()
+    assert {"gzip", "br"} & vars(snapshot).keys() == {"br"}
+
+
+def test_should_patch_changed_items_and_drop_missing_ones():
+    store = CatalogSnapshotStore(max_staleness=1.0)
+    pen, book = _item("Pen"), _item("Book")
+    first = store.rebuild([pen, book])
+
+    snapshot = store.apply_changes(
+        {pen.id, book.id, uuid4()}, [pen._replace(quantity=7), _item("Lamp")]
+    )
+
+    assert snapshot.state.tag != first.state.tag
+    items = json.loads(snapshot.identity)["items"]
+    assert [(item["name"], item["quantity"]) for item in items] == [
+        ("Lamp", 1),
+        ("Pen", 7),
+    ]
+
+
+def test_should_keep_the_snapshot_when_its_body_is_unchanged():
+    store = CatalogSnapshotStore(max_staleness=1.0)
+    pen = _item("Pen")
+    first = store.rebuild([pen])
+
+    assert store.apply_changes({pen.id}, [pen]) is first
+
+
+def test_should_bypass_a_snapshot_stale_for_longer_than_allowed():
+    clock = FakeClock()
+    store = CatalogSnapshotStore(max_staleness=1.0, clock=clock)
+    store.take_changes()
+    snapshot = store.rebuild([_item("Pen")])
+
+    store.mark_changed([uuid4()])
+    clock.now += 1.0
+    within_bound = store.get()
+    clock.now += 0.5
+
+    assert within_bound is snapshot
+    assert store.get() is None
+
+
+def test_should_only_track_writes_once_changes_are_taken():
+    store = CatalogSnapshotStore(max_staleness=1.0)
+    ignored, tracked = uuid4(), uuid4()
+
+    store.mark_changed([ignored])
+    store.take_changes()
+    store.mark_changed([tracked])
+
+    assert store.take_changes() == {tracked}
+
+
+def test_refresher_should_rebuild_first_then_load_only_changed_items():
+    store = CatalogSnapshotStore(max_staleness=1.0)
+    pen = _item("Pen")
+    loads = []
+
+    async def load(item_ids):
+        loads.append(item_ids)
+        return [pen] if item_ids is None else [pen._replace(quantity=3)]
+
+    refresher = CatalogSnapshotRefresher(
+        store, load, interval=1.0, rebuild_interval=60.0
+    )
+
+    async def run():
+        await refresher.refresh()
+        await refresher.refresh()
+        store.mark_changed([pen.id])
+        await refresher.refresh()
+
+    asyncio.run(run())
+
+    assert loads == [None, {pen.id}]
+    assert json.loads(store.get().identity)["items"][0]["quantity"] == 3
+
+
+def test_refresher_should_keep_changes_whose_load_failed():
+    store = CatalogSnapshotStore(max_staleness=1.0)
+    changed = uuid4()
+
+    async def load(item_ids):
+        if item_ids is not None:
+            raise ConnectionError("database unavailable")
+        return []
+
+    refresher = CatalogSnapshotRefresher(
+        store, load, interval=1.0, rebuild_interval=60.0
+    )
+    asyncio.run(refresher.refresh())
+    store.mark_changed([changed])
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(refresher.refresh())
+
+    assert store.take_changes() == {changed}
@@ -0,0 +1,41 @@
+from be_task_ca.item.adapters.cache.catalog_version import CatalogVersion
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_should_change_tag_and_last_modified_when_bumped():
+    clock = FakeClock()
+    version = CatalogVersion(ttl=None, clock=clock)
+    before = version.current()
+
+    clock.now = 1005.0
+    version.bump()
+
+    assert version.current().tag != before.tag
+    assert version.current().last_modified == 1005.0
+    assert before.last_modified == 1000.0
+
+
+def test_should_keep_tag_without_writes_until_the_ttl_rolls_over():
+    clock = FakeClock(1000.0)
+    version = CatalogVersion(ttl=60.0, clock=clock)
+    first = version.current()
+
+    clock.now = 1019.0
+    unchanged = version.current()
+    clock.now = 1021.0
+    rolled_over = version.current()
+
+    assert unchanged == first
+    assert rolled_over.tag != first.tag
+    assert rolled_over.last_modified == 1020.0
+
+
+def test_should_not_share_tags_between_instances():
+    assert CatalogVersion(ttl=None).current() != CatalogVersion(ttl=None).current()
@@ -0,0 +1,38 @@
+from be_task_ca.events import ChangeNotifier
+from be_task_ca.item.adapters.db.model import Item
+from be_task_ca.item.adapters.db.repository import SqlAlchemyItemRepository
+from be_task_ca.item.domain.entities import ItemEntity
+
+
+def _item(name: str, price: float = 1.0) -> ItemEntity:
+    return ItemEntity(id=None, name=name, description="Desc", price=price, quantity=1)
+
+
+def test_should_insert_item_only_when_name_is_free(db_session):
+    changed_ids = []
+    notifier = ChangeNotifier()
+    notifier.subscribe(changed_ids.extend)
+    repository = SqlAlchemyItemRepository(db_session, notifier=notifier)
+
+    saved = repository.save_item_if_absent(_item("Book"))
+    duplicate = repository.save_item_if_absent(_item("Book", price=2.0))
+    db_session.commit()
+
+    assert saved.id is not None
+    assert (saved.name, saved.price) == ("Book", 1.0)
+    assert duplicate is None
+    assert db_session.query(Item).count() == 1
+    assert changed_ids == [saved.id]
+
+
+def test_should_list_all_items_in_the_snapshot_order(db_session):
+    repository = SqlAlchemyItemRepository(db_session)
+    for name in ("Pen", "Book", "Lamp"):
+        repository.save_item(_item(name))
+    db_session.commit()
+
+    assert [item.name for item in repository.get_all_items()] == [
+        "Book",
+        "Lamp",
+        "Pen",
+    ]
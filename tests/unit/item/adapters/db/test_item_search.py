@@ -0,0 +1,80 @@
+from sqlalchemy.dialects import postgresql
+
+from be_task_ca.item.adapters.db.model import Item
+from be_task_ca.item.adapters.db.repository import SqlAlchemyItemRepository
+from be_task_ca.item.adapters.db.search import search_items_query
+from be_task_ca.item.application.dto import ItemCursor, ItemSearchCriteria
+
+
+def _seed(db_session) -> None:
+    rows = [
+        ("Keyboard", "Mechanical, brown switches", 99.0, 5),
+        ("Mouse", "Wireless", 25.0, 0),
+        ("Book", "Clean Architecture", 19.99, 3),
+        ("Key_ring", "Metal", 2.0, 9),
+    ]
+    db_session.add_all(
+        Item(name=name, description=description, price=price, quantity=quantity)
+        for name, description, price, quantity in rows
+    )
+    db_session.commit()
+
+
+def _names(db_session, limit=10, after=None, **criteria) -> list[str]:
+    repository = SqlAlchemyItemRepository(db_session)
+    items = repository.search_items(ItemSearchCriteria(**criteria), limit, after)
+    return [item.name for item in items]
+
+
+def test_should_match_word_prefixes_of_name_and_description(db_session):
+    _seed(db_session)
+
+    assert _names(db_session, text="mech") == ["Keyboard"]
+    assert _names(db_session, text="clean arch") == ["Book"]
+    assert _names(db_session, text="clean wireless") == []
+
+
+def test_should_match_substrings_of_name_literally(db_session):
+    _seed(db_session)
+
+    assert _names(db_session, text="BOARD") == ["Keyboard"]
+    assert _names(db_session, text="y_r") == ["Key_ring"]
+    assert _names(db_session, text="%") == []
+
+
+def test_should_filter_by_price_and_stock(db_session):
+    _seed(db_session)
+
+    assert _names(db_session, min_price=10, max_price=50) == ["Book", "Mouse"]
+    assert _names(db_session, in_stock=True, max_price=50) == ["Book", "Key_ring"]
+    assert _names(db_session, in_stock=False) == ["Mouse"]
+
+
+def test_should_page_matches_in_name_order(db_session):
+    _seed(db_session)
+    first_page = SqlAlchemyItemRepository(db_session).search_items(
+        ItemSearchCriteria(text="key"), limit=1
+    )
+    after = ItemCursor(name=first_page[0].name, id=first_page[0].id)
+
+    assert [item.name for item in first_page] == ["Key_ring"]
+    assert _names(db_session, after=after, text="key") == ["Keyboard"]
+
+
+def test_should_query_indexed_expressions_on_postgres():
+    query = search_items_query(
+        "postgresql", ItemSearchCriteria(text="Clean arch", min_price=1), limit=10
+    )
+
+    sql = str(
+        query.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+    assert (
+        "to_tsvector('simple'::regconfig, (items.name || ' ') || items.description)"
+        " @@ to_tsquery('simple'::regconfig, 'clean:* & arch:*')" in sql
+    )
+    assert "items.name ILIKE '%%Clean arch%%'" in sql
+    assert "items.price >= 1" in sql
@@ -0,0 +1,81 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from be_task_ca.item.application.dto import CreateItemCommand
+from be_task_ca.item.application.exceptions import ItemAlreadyExistsError
+from be_task_ca.item.application.usecases.create_item import AsyncCreateItemUseCase
+from be_task_ca.item.application.usecases.list_items import AsyncListItemsUseCase
+from be_task_ca.item.domain.entities import ItemEntity
+from be_task_ca.unit_of_work import AsyncInMemoryUnitOfWork
+
+
+class MockAsyncItemRepository:
+    def __init__(self, items: list[ItemEntity] | None = None) -> None:
+        self.saved_items: list[ItemEntity] = list(items or [])
+
+    async def save_item(self, item: ItemEntity) -> ItemEntity:
+        saved_item = ItemEntity(
+            id=uuid4(),
+            name=item.name,
+            description=item.description,
+            price=item.price,
+            quantity=item.quantity,
+        )
+        self.saved_items.append(saved_item)
+        return saved_item
+
+    async def save_item_if_absent(self, item: ItemEntity) -> ItemEntity | None:
+        if await self.find_item_by_name(item.name) is not None:
+            return None
+        return await self.save_item(item)
+
+    async def get_all_items(self) -> list[ItemEntity]:
+        return self.saved_items
+
+    async def find_item_by_name(self, name: str) -> ItemEntity | None:
+        return next((item for item in self.saved_items if item.name == name), None)
+
+    async def find_item_by_id(self, item_id):
+        return None
+
+
+def _command(name: str = "Book") -> CreateItemCommand:
+    return CreateItemCommand(
+        name=name,
+        description="Clean Architecture",
+        price=19.99,
+        quantity=3,
+    )
+
+
+def test_should_create_item_when_name_is_unique():
+    repository = MockAsyncItemRepository()
+    unit_of_work = AsyncInMemoryUnitOfWork()
+    use_case = AsyncCreateItemUseCase(repository, unit_of_work)
+
+    result = asyncio.run(use_case.execute(_command()))
+
+    assert result.name == "Book"
+    assert len(repository.saved_items) == 1
+    assert unit_of_work.commits == 1
+
+
+def test_should_raise_when_item_name_already_exists():
+    repository = MockAsyncItemRepository()
+    use_case = AsyncCreateItemUseCase(repository, AsyncInMemoryUnitOfWork())
+    asyncio.run(use_case.execute(_command()))
+
+    with pytest.raises(ItemAlreadyExistsError):
+        asyncio.run(use_case.execute(_command()))
+
+
+def test_should_list_items_as_result_dto():
+    repository = MockAsyncItemRepository()
+    use_case = AsyncCreateItemUseCase(repository, AsyncInMemoryUnitOfWork())
+    asyncio.run(use_case.execute(_command("Pen")))
+
+    result = asyncio.run(AsyncListItemsUseCase(repository).execute())
+
+    assert [item.name for item in result.items] == ["Pen"]
@@ -6,6 +6,7 @@ from be_task_ca.item.application.dto import CreateItemCommand
 from be_task_ca.item.application.exceptions import ItemAlreadyExistsError
 from be_task_ca.item.application.usecases.create_item import CreateItemUseCase
 from be_task_ca.item.domain.entities import ItemEntity
+from be_task_ca.unit_of_work import InMemoryUnitOfWork
 
 
 class MockItemRepository:
@@ -24,6 +25,11 @@ class MockItemRepository:
         self.saved_items.append(saved_item)
         return saved_item
 
+    def save_item_if_absent(self, item: ItemEntity) -> ItemEntity | None:
+        if self.find_item_by_name(item.name) is not None:
+            return None
+        return self.save_item(item)
+
     def get_all_items(self) -> list[ItemEntity]:
         return self.saved_items
 
@@ -38,7 +44,8 @@ class MockItemRepository:
 
 def test_should_create_item_when_name_is_unique():
     repository = MockItemRepository(existing_item=None)
-    use_case = CreateItemUseCase(repository)
+    unit_of_work = InMemoryUnitOfWork()
+    use_case = CreateItemUseCase(repository, unit_of_work)
 
     result = use_case.execute(
         CreateItemCommand(
@@ -52,6 +59,7 @@ def test_should_create_item_when_name_is_unique():
     assert result.name == "Book"
     assert result.quantity == 3
     assert len(repository.saved_items) == 1
+    assert unit_of_work.commits == 1
 
 
 def test_should_raise_when_item_name_already_exists():
@@ -64,7 +72,7 @@ def test_should_raise_when_item_name_already_exists():
             quantity=1,
         )
     )
-    use_case = CreateItemUseCase(repository)
+    use_case = CreateItemUseCase(repository, InMemoryUnitOfWork())
 
     with pytest.raises(ItemAlreadyExistsError):
         use_case.execute(
@@ -0,0 +1,67 @@
+from uuid import uuid4
+
+from be_task_ca.item.application.dto import CreateItemCommand, ItemImportStatus
+from be_task_ca.item.application.usecases.import_items import ImportItemsUseCase
+from be_task_ca.item.domain.entities import ItemEntity
+from be_task_ca.unit_of_work import InMemoryUnitOfWork
+
+
+class MockItemRepository:
+    def __init__(self, existing_names=()) -> None:
+        self._names = set(existing_names)
+        self.batches: list[list[ItemEntity]] = []
+
+    def save_items(self, items: list[ItemEntity]) -> list[ItemEntity]:
+        self.batches.append(items)
+        saved_items = []
+        for item in items:
+            if item.name not in self._names:
+                self._names.add(item.name)
+                saved_items.append(
+                    ItemEntity(
+                        id=uuid4(),
+                        name=item.name,
+                        description=item.description,
+                        price=item.price,
+                        quantity=item.quantity,
+                    )
+                )
+        return saved_items
+
+
+def _command(name: str) -> CreateItemCommand:
+    return CreateItemCommand(name=name, description="Desc", price=1.0, quantity=1)
+
+
+def test_should_report_created_and_conflicting_rows_in_input_order():
+    repository = MockItemRepository(existing_names=["Pen"])
+    unit_of_work = InMemoryUnitOfWork()
+    use_case = ImportItemsUseCase(repository, unit_of_work, batch_size=2)
+
+    result = use_case.execute(
+        _command(name) for name in ["Book", "Pen", "Lamp", "Book", "Desk"]
+    )
+
+    assert [(row.name, row.status) for row in result.rows] == [
+        ("Book", ItemImportStatus.CREATED),
+        ("Pen", ItemImportStatus.CONFLICT),
+        ("Lamp", ItemImportStatus.CREATED),
+        ("Book", ItemImportStatus.CONFLICT),
+        ("Desk", ItemImportStatus.CREATED),
+    ]
+    assert (result.created, result.conflicts) == (3, 2)
+    assert [len(batch) for batch in repository.batches] == [2, 2, 1]
+    assert unit_of_work.commits == 3
+    assert result.rows[0].item.id is not None
+    assert result.rows[1].item is None
+
+
+def test_should_mark_repeated_name_within_one_batch_as_conflict():
+    use_case = ImportItemsUseCase(MockItemRepository(), InMemoryUnitOfWork())
+
+    result = use_case.execute([_command("Book"), _command("Book")])
+
+    assert [row.status for row in result.rows] == [
+        ItemImportStatus.CREATED,
+        ItemImportStatus.CONFLICT,
+    ]
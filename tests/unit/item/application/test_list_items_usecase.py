@@ -1,19 +1,33 @@
 from uuid import uuid4
 
+from be_task_ca.item.application.dto import ItemCursor, ItemView
 from be_task_ca.item.application.usecases.list_items import ListItemsUseCase
 from be_task_ca.item.domain.entities import ItemEntity
 
 
 class MockItemRepository:
-    def __init__(self, items: list[ItemEntity]) -> None:
+    def __init__(self, items: list[ItemView]) -> None:
         self._items = items
 
     def save_item(self, item: ItemEntity) -> ItemEntity:
         return item
 
-    def get_all_items(self) -> list[ItemEntity]:
+    def get_all_items(self) -> list[ItemView]:
         return self._items
 
+    def get_items_page(self, limit, after=None):
+        ordered = sorted(self._items, key=lambda item: (item.name, item.id))
+        if after is not None:
+            ordered = [
+                item
+                for item in ordered
+                if (item.name, item.id) > (after.name, after.id)
+            ]
+        return ordered[:limit]
+
+    def iter_all_items(self, batch_size):
+        yield from sorted(self._items, key=lambda item: (item.name, item.id))
+
     def find_item_by_name(self, name: str) -> ItemEntity | None:
         return None
 
@@ -21,9 +35,9 @@ class MockItemRepository:
         return None
 
 
-def test_should_map_repository_items_to_result_dto():
+def test_should_return_repository_item_views():
     items = [
-        ItemEntity(
+        ItemView(
             id=uuid4(),
             name="Book",
             description="Paper",
@@ -38,3 +52,30 @@ def test_should_map_repository_items_to_result_dto():
     assert len(result.items) == 1
     assert result.items[0].name == "Book"
     assert result.items[0].quantity == 7
+
+
+def _build_items(*names: str) -> list[ItemView]:
+    return [
+        ItemView(id=uuid4(), name=name, description=None, price=1.0, quantity=1)
+        for name in names
+    ]
+
+
+def test_should_return_page_with_cursor_when_more_items_exist():
+    use_case = ListItemsUseCase(MockItemRepository(_build_items("C", "A", "B")))
+
+    first_page = use_case.execute_page(limit=2)
+    second_page = use_case.execute_page(limit=2, after=first_page.next_cursor)
+
+    assert [item.name for item in first_page.items] == ["A", "B"]
+    assert first_page.next_cursor == ItemCursor(
+        name="B", id=first_page.items[1].id
+    )
+    assert [item.name for item in second_page.items] == ["C"]
+    assert second_page.next_cursor is None
+
+
+def test_should_stream_all_items():
+    use_case = ListItemsUseCase(MockItemRepository(_build_items("B", "A")))
+
+    assert [item.name for item in use_case.stream()] == ["A", "B"]
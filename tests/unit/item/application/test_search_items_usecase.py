@@ -0,0 +1,29 @@
+from uuid import uuid4
+
+from be_task_ca.item.application.dto import ItemCursor, ItemSearchCriteria, ItemView
+from be_task_ca.item.application.usecases.search_items import SearchItemsUseCase
+
+
+class MockItemRepository:
+    def __init__(self, items: list[ItemView]) -> None:
+        self._items = items
+        self.searches = []
+
+    def search_items(self, criteria, limit, after=None):
+        self.searches.append((criteria, limit, after))
+        return self._items[:limit]
+
+
+def test_should_return_page_of_matches_with_cursor():
+    items = [
+        ItemView(id=uuid4(), name=name, description=None, price=1.0, quantity=1)
+        for name in ("Desk lamp", "Floor lamp")
+    ]
+    repository = MockItemRepository(items)
+    criteria = ItemSearchCriteria(text="lamp", in_stock=True)
+
+    result = SearchItemsUseCase(repository).execute(criteria, limit=1)
+
+    assert [item.name for item in result.items] == ["Desk lamp"]
+    assert result.next_cursor == ItemCursor(name="Desk lamp", id=items[0].id)
+    assert repository.searches == [(criteria, 2, None)]
@@ -0,0 +1,59 @@
+import asyncio
+
+import httpx
+import pytest
+
+from be_task_ca.app import create_app
+from be_task_ca.observability.queries import query_instrumentation
+from be_task_ca.settings import settings
+
+
+async def _request(method: str, path: str, **kwargs) -> httpx.Response:
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.request(method, path, **kwargs)
+
+
+@pytest.fixture
+def restore_query_instrumentation():
+    saved = vars(query_instrumentation).copy()
+    yield
+    vars(query_instrumentation).update(saved)
+
+
+def test_admin_routes_should_be_disabled_without_configured_token(monkeypatch):
+    monkeypatch.setattr(settings, "admin_token", None)
+
+    response = asyncio.run(_request("GET", "/admin/query-instrumentation"))
+
+    assert response.status_code == 403
+
+
+def test_should_toggle_query_instrumentation_at_runtime(
+    monkeypatch, restore_query_instrumentation
+):
+    monkeypatch.setattr(settings, "admin_token", "secret")
+
+    rejected = asyncio.run(
+        _request(
+            "PATCH",
+            "/admin/query-instrumentation",
+            json={"enabled": False},
+            headers={"X-Admin-Token": "wrong"},
+        )
+    )
+    updated = asyncio.run(
+        _request(
+            "PATCH",
+            "/admin/query-instrumentation",
+            json={"enabled": False, "sample_rate": 0.25},
+            headers={"X-Admin-Token": "secret"},
+        )
+    )
+
+    assert rejected.status_code == 403
+    assert updated.status_code == 200
+    assert updated.json()["enabled"] is False
+    assert updated.json()["sample_rate"] == 0.25
+    assert query_instrumentation.enabled is False
+    assert query_instrumentation.sample_rate == 0.25
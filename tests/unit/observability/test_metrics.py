@@ -0,0 +1,58 @@
+import threading
+
+from be_task_ca.observability.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+
+def test_should_render_labelled_counter_and_gauge_samples():
+    registry = MetricsRegistry()
+    requests = Counter("requests_total", "Requests.", ["route"], registry=registry)
+    in_flight = Gauge("in_flight", "In flight.", registry=registry)
+
+    requests.labels("/items/").inc()
+    requests.labels(route="/items/").inc(2)
+    in_flight.labels().set_function(lambda: 3)
+
+    rendered = registry.render()
+
+    assert "# TYPE requests_total counter" in rendered
+    assert 'requests_total{route="/items/"} 3' in rendered
+    assert "in_flight 3" in rendered
+
+
+def test_should_render_cumulative_histogram_buckets():
+    registry = MetricsRegistry()
+    latency = Histogram(
+        "latency_seconds", "Latency.", buckets=(0.1, 1.0), registry=registry
+    )
+
+    for value in (0.05, 0.5, 5.0):
+        latency.observe(value)
+
+    rendered = registry.render().splitlines()
+
+    assert 'latency_seconds_bucket{le="0.1"} 1' in rendered
+    assert 'latency_seconds_bucket{le="1"} 2' in rendered
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in rendered
+    assert "latency_seconds_count 3" in rendered
+    assert "latency_seconds_sum 5.55" in rendered
+
+
+def test_should_sum_updates_made_from_many_threads():
+    registry = MetricsRegistry()
+    calls = Counter("calls_total", "Calls.", registry=registry)
+    latency = Histogram("work_seconds", "Work.", buckets=(1.0,), registry=registry)
+
+    def work():
+        for _ in range(1000):
+            calls.inc()
+            latency.observe(0.5)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls.labels().value == 8000
+    assert latency.labels().count == 8000
+    assert latency.labels().counts == [8000]
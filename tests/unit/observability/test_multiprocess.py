@@ -0,0 +1,36 @@
+import json
+import os
+
+from be_task_ca.observability.metrics import Counter, Gauge, Histogram, MetricsRegistry
+from be_task_ca.observability.multiprocess import render_aggregated
+
+EXITED_PID = 2**22 + 1  # above the default pid_max, so never a live process
+
+
+def test_should_sum_counters_across_workers_and_label_live_gauges(tmp_path):
+    registry = MetricsRegistry()
+    requests = Counter("requests_total", "Requests.", ["route"], registry=registry)
+    latency = Histogram(
+        "latency_seconds", "Latency.", buckets=(1.0,), registry=registry
+    )
+    in_flight = Gauge("in_flight", "In flight.", registry=registry)
+    requests.labels("/items/").inc(2)
+    latency.observe(0.5)
+    in_flight.labels().set(3)
+    (tmp_path / f"{EXITED_PID}.json").write_text(
+        json.dumps(
+            {
+                "requests_total": [[["/items/"], 5]],
+                "latency_seconds": [[[], [0, 1, 2.0]]],
+                "in_flight": [[[], 7]],
+            }
+        )
+    )
+
+    rendered = render_aggregated(registry, str(tmp_path)).splitlines()
+
+    assert 'requests_total{route="/items/"} 7' in rendered
+    assert 'latency_seconds_bucket{le="1"} 1' in rendered
+    assert "latency_seconds_count 2" in rendered
+    assert f'in_flight{{pid="{os.getpid()}"}} 3' in rendered
+    assert not any(f'pid="{EXITED_PID}"' in line for line in rendered)
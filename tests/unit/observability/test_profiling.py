@@ -0,0 +1,132 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from be_task_ca.app import create_app
+from be_task_ca.observability.profiling import (
+    Frame,
+    RequestProfile,
+    StackSampler,
+    profile_store,
+    to_collapsed,
+    to_speedscope,
+)
+from be_task_ca.settings import settings
+
+
+def _spin(started: threading.Event, stop: threading.Event) -> None:
+    started.set()
+    while not stop.is_set():
+        pass
+
+
+def test_sampler_should_record_stacks_of_the_profiled_thread():
+    started, stop = threading.Event(), threading.Event()
+    thread = threading.Thread(target=_spin, args=(started, stop), name="spinner")
+    thread.start()
+    started.wait()
+    sampler = StackSampler(thread.ident, interval=0.001)
+    try:
+        sampler.sample(0.002)
+        sampler.sample(0.003)
+    finally:
+        stop.set()
+        thread.join()
+
+    spinner_stacks = {
+        stack: weight
+        for stack, weight in sampler.weights.items()
+        if stack[0] == Frame("spinner")
+    }
+    assert sampler.samples == 2
+    assert sum(spinner_stacks.values()) == pytest.approx(0.005)
+    assert all("_spin" in [frame.name for frame in stack] for stack in spinner_stacks)
+
+
+def test_sampler_should_skip_pool_threads_waiting_for_work():
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="idle-pool") as pool:
+        pool.submit(lambda: None).result()
+        sampler = StackSampler(threading.get_ident(), interval=0.001)
+        sampler.sample(0.001)
+
+    thread_names = {stack[0].name for stack in sampler.weights}
+    assert threading.current_thread().name in thread_names
+    assert not any(name.startswith("idle-pool") for name in thread_names)
+
+
+def test_should_render_collapsed_stacks_and_speedscope():
+    root = Frame("MainThread")
+    handler = Frame("handler", "app.py", 10)
+    query = Frame("query", "db.py", 20)
+    profile = RequestProfile(
+        id="p1",
+        method="GET",
+        path="/items/",
+        route="/items/",
+        status=200,
+        started_at=datetime.now(timezone.utc),
+        duration_seconds=0.01,
+        db_seconds=0.004,
+        db_statements=1,
+        samples=3,
+        weights={(root, handler): 0.002, (root, handler, query): 0.004},
+    )
+
+    speedscope = to_speedscope(profile)
+
+    assert to_collapsed(profile) == (
+        "MainThread;handler (app.py:10) 2000\n"
+        "MainThread;handler (app.py:10);query (db.py:20) 4000\n"
+    )
+    assert profile.python_seconds == pytest.approx(0.006)
+    assert speedscope["shared"]["frames"] == [
+        {"name": "MainThread"},
+        {"name": "handler", "file": "app.py", "line": 10},
+        {"name": "query", "file": "db.py", "line": 20},
+    ]
+    assert speedscope["profiles"][0]["samples"] == [[0, 1], [0, 1, 2]]
+    assert speedscope["profiles"][0]["weights"] == pytest.approx([2.0, 4.0])
+
+
+def test_should_profile_requests_asking_for_it_with_the_admin_token(monkeypatch):
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    profile_store.clear()
+    app = create_app()
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            unprofiled = await client.get("/", headers={"X-Profile": "1"})
+            profiled = await client.get(
+                "/", headers={"X-Profile": "1", "X-Admin-Token": "secret"}
+            )
+            admin = {"X-Admin-Token": "secret"}
+            profile_id = profiled.headers["X-Profile-Id"]
+            listed = await client.get("/admin/profiles", headers=admin)
+            speedscope = await client.get(
+                f"/admin/profiles/{profile_id}", headers=admin
+            )
+            collapsed = await client.get(
+                f"/admin/profiles/{profile_id}?format=collapsed", headers=admin
+            )
+            missing = await client.get("/admin/profiles/unknown", headers=admin)
+            return unprofiled, profiled, listed, speedscope, collapsed, missing
+
+    unprofiled, profiled, listed, speedscope, collapsed, missing = asyncio.run(run())
+
+    assert "X-Profile-Id" not in unprofiled.headers
+    assert profiled.status_code == 200
+    [summary] = listed.json()
+    assert summary["id"] == profiled.headers["X-Profile-Id"]
+    assert summary["route"] == "/"
+    assert summary["status"] == 200
+    assert summary["python_ms"] <= summary["duration_ms"]
+    assert speedscope.json()["profiles"][0]["type"] == "sampled"
+    assert collapsed.headers["content-type"].startswith("text/plain")
+    assert missing.status_code == 404
@@ -0,0 +1,61 @@
+import logging
+
+from sqlalchemy import create_engine, text
+
+from be_task_ca.observability.queries import (
+    QUERY_SECONDS,
+    SLOW_QUERIES,
+    QueryInstrumentation,
+    normalize_sql,
+)
+
+
+def _observed(statement: str) -> int:
+    return QUERY_SECONDS.labels(statement).count
+
+
+def test_should_normalize_literals_parameters_and_lists():
+    statement = (
+        "SELECT users.id\n  FROM users WHERE users.email = %(email_1)s"
+        " AND users.id IN (%(id_1)s, %(id_2)s) AND name = 'O''Hara' LIMIT 10"
+    )
+
+    assert normalize_sql(statement) == (
+        "SELECT users.id FROM users WHERE users.email = ? AND users.id IN (?...)"
+        " AND name = ? LIMIT ?"
+    )
+    assert normalize_sql("INSERT INTO t (a, b) VALUES (?, ?), (?, ?), (?, ?)") == (
+        "INSERT INTO t (a, b) VALUES (?...), ..."
+    )
+
+
+def test_should_time_sampled_statements_and_log_slow_ones(caplog):
+    engine = create_engine("sqlite://")
+    QueryInstrumentation(slow_query_ms=0).install(engine)
+    statement = "SELECT ? AS instrumented_probe"
+    observed_before = _observed(statement)
+
+    with caplog.at_level(logging.WARNING, logger="be_task_ca.observability.queries"):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1 AS instrumented_probe"))
+
+    assert _observed(statement) == observed_before + 1
+    assert SLOW_QUERIES.labels(statement).value >= 1
+    assert caplog.records[-1].statement == statement
+
+
+def test_should_skip_unsampled_statements_and_honor_runtime_toggle():
+    engine = create_engine("sqlite://")
+    instrumentation = QueryInstrumentation(sample_rate=0.5, sample=lambda: 0.7)
+    instrumentation.install(engine)
+    statement = "SELECT ? AS unsampled_probe"
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1 AS unsampled_probe"))
+        instrumentation.sample_rate = 1.0
+        instrumentation.enabled = False
+        connection.execute(text("SELECT 1 AS unsampled_probe"))
+        instrumentation.enabled = True
+        connection.execute(text("SELECT 1 AS unsampled_probe"))
+
+    assert _observed(statement) == 1
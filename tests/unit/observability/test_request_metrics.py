@@ -0,0 +1,70 @@
+import asyncio
+
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from be_task_ca.app import DB_MODE_ASYNC, create_app
+from be_task_ca.common import get_async_db
+from be_task_ca.database import Base
+from be_task_ca.observability.http import (
+    HTTP_REQUEST_DB_STATEMENTS,
+    HTTP_REQUEST_REPOSITORY_CALLS,
+    HTTP_REQUESTS,
+)
+from be_task_ca.observability.instrument import REPOSITORY_CALLS, USE_CASE_SECONDS
+from be_task_ca.observability.queries import QueryInstrumentation
+
+
+def _create_instrumented_async_app():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    QueryInstrumentation().install(engine.sync_engine)
+    session_local = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def create_schema():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    async def override_get_async_db():
+        async with session_local() as db:
+            yield db
+
+    asyncio.run(create_schema())
+    app = create_app(DB_MODE_ASYNC)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return app
+
+
+def test_should_record_route_use_case_repository_and_db_metrics():
+    route = "/users/{user_id}/cart"
+    requests_before = HTTP_REQUESTS.labels("GET", route, 200).value
+    statements_before = HTTP_REQUEST_DB_STATEMENTS.labels("GET", route).sum
+    calls_before = HTTP_REQUEST_REPOSITORY_CALLS.labels("GET", route).sum
+    repository_calls = REPOSITORY_CALLS.labels(
+        "AsyncSqlAlchemyCartViewReader", "get_cart_lines"
+    )
+    repository_calls_before = repository_calls.value
+    use_case = USE_CASE_SECONDS.labels("AsyncListCartItemsUseCase", "execute")
+    use_case_before = use_case.count
+
+    async def run(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await client.get(
+                "/users/00000000-0000-0000-0000-000000000001/cart"
+            )
+
+    response = asyncio.run(run(_create_instrumented_async_app()))
+
+    assert response.status_code == 200
+    assert HTTP_REQUESTS.labels("GET", route, 200).value == requests_before + 1
+    assert HTTP_REQUEST_DB_STATEMENTS.labels("GET", route).sum > statements_before
+    assert HTTP_REQUEST_REPOSITORY_CALLS.labels("GET", route).sum == calls_before + 1
+    assert repository_calls.value == repository_calls_before + 1
+    assert use_case.count == use_case_before + 1
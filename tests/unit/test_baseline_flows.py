@@ -1,8 +1,12 @@
+import json
+from datetime import datetime, timezone
+
 from be_task_ca.item.adapters.db.repository import SqlAlchemyItemRepository
 from be_task_ca.item.adapters.api.schema import CreateItemRequest
 from be_task_ca.item.adapters.api.handlers import create_item, get_all
 from be_task_ca.item.application.usecases.create_item import CreateItemUseCase
 from be_task_ca.item.application.usecases.list_items import ListItemsUseCase
+from be_task_ca.transactions import SqlAlchemyUnitOfWork
 from be_task_ca.user.adapters.api.schema import AddToCartRequest, CreateUserRequest
 from be_task_ca.user.adapters.api.handlers import (
     add_item_to_cart,
@@ -10,6 +14,7 @@ from be_task_ca.user.adapters.api.handlers import (
     list_items_in_cart,
 )
 from be_task_ca.user.adapters.db.cart_repository import SqlAlchemyCartRepository
+from be_task_ca.user.adapters.db.cart_view_reader import SqlAlchemyCartViewReader
 from be_task_ca.user.adapters.db.inventory_gateway import SqlAlchemyInventoryGateway
 from be_task_ca.user.adapters.db.user_repository import SqlAlchemyUserRepository
 from be_task_ca.user.application.usecases.add_item_to_cart import AddItemToCartUseCase
@@ -17,7 +22,7 @@ from be_task_ca.user.application.usecases.create_user import CreateUserUseCase
 from be_task_ca.user.application.usecases.list_cart_items import ListCartItemsUseCase
 
 
-def test_should_create_user_when_payload_is_valid(db_session):
+def test_should_create_user_when_payload_is_valid(db_session, password_hasher):
     request = CreateUserRequest(
         first_name="Marko",
         last_name="Crnic",
@@ -26,7 +31,14 @@ def test_should_create_user_when_payload_is_valid(db_session):
         shipping_address="Street 1",
     )
 
-    response = create_user(request, CreateUserUseCase(SqlAlchemyUserRepository(db_session)))
+    response = create_user(
+        request,
+        CreateUserUseCase(
+            SqlAlchemyUserRepository(db_session),
+            password_hasher,
+            SqlAlchemyUnitOfWork(db_session),
+        ),
+    )
 
     assert response.email == "marko@example.com"
     assert response.first_name == "Marko"
@@ -42,15 +54,17 @@ def test_should_create_and_list_item_when_payload_is_valid(db_session):
 
     create_response = create_item(
         request,
-        CreateItemUseCase(SqlAlchemyItemRepository(db_session)),
+        CreateItemUseCase(
+            SqlAlchemyItemRepository(db_session), SqlAlchemyUnitOfWork(db_session)
+        ),
     )
     list_response = get_all(ListItemsUseCase(SqlAlchemyItemRepository(db_session)))
 
     assert create_response.name == "Book"
-    assert len(list_response.items) == 1
+    assert len(json.loads(list_response.body)["items"]) == 1
 
 
-def test_should_add_item_to_cart_when_user_and_item_exist(db_session):
+def test_should_add_item_to_cart_when_user_and_item_exist(db_session, password_hasher):
     created_user = create_user(
         CreateUserRequest(
             first_name="Marko",
@@ -59,7 +73,11 @@ def test_should_add_item_to_cart_when_user_and_item_exist(db_session):
             password="password",
             shipping_address="Test 2",
         ),
-        CreateUserUseCase(SqlAlchemyUserRepository(db_session)),
+        CreateUserUseCase(
+            SqlAlchemyUserRepository(db_session),
+            password_hasher,
+            SqlAlchemyUnitOfWork(db_session),
+        ),
     )
     created_item = create_item(
         CreateItemRequest(
@@ -68,16 +86,18 @@ def test_should_add_item_to_cart_when_user_and_item_exist(db_session):
             price=99.0,
             quantity=5,
         ),
-        CreateItemUseCase(SqlAlchemyItemRepository(db_session)),
+        CreateItemUseCase(
+            SqlAlchemyItemRepository(db_session), SqlAlchemyUnitOfWork(db_session)
+        ),
     )
 
     response = add_item_to_cart(
         created_user.id,
         AddToCartRequest(item_id=created_item.id, quantity=2),
         AddItemToCartUseCase(
-            user_repository=SqlAlchemyUserRepository(db_session),
-            cart_repository=SqlAlchemyCartRepository(db_session),
-            inventory_gateway=SqlAlchemyInventoryGateway(db_session),
+            SqlAlchemyCartRepository(db_session),
+            SqlAlchemyInventoryGateway(db_session),
+            SqlAlchemyUnitOfWork(db_session),
         ),
     )
 
@@ -85,7 +105,7 @@ def test_should_add_item_to_cart_when_user_and_item_exist(db_session):
     assert response.items[0].quantity == 2
 
 
-def test_should_list_cart_items_for_existing_user(db_session):
+def test_should_list_cart_items_for_existing_user(db_session, password_hasher):
     created_user = create_user(
         CreateUserRequest(
             first_name="Marko",
@@ -94,7 +114,11 @@ def test_should_list_cart_items_for_existing_user(db_session):
             password="password",
             shipping_address="Test 3",
         ),
-        CreateUserUseCase(SqlAlchemyUserRepository(db_session)),
+        CreateUserUseCase(
+            SqlAlchemyUserRepository(db_session),
+            password_hasher,
+            SqlAlchemyUnitOfWork(db_session),
+        ),
     )
     created_item = create_item(
         CreateItemRequest(
@@ -103,22 +127,37 @@ def test_should_list_cart_items_for_existing_user(db_session):
             price=99.0,
             quantity=5,
         ),
-        CreateItemUseCase(SqlAlchemyItemRepository(db_session)),
+        CreateItemUseCase(
+            SqlAlchemyItemRepository(db_session), SqlAlchemyUnitOfWork(db_session)
+        ),
     )
     add_item_to_cart(
         created_user.id,
         AddToCartRequest(item_id=created_item.id, quantity=1),
         AddItemToCartUseCase(
-            user_repository=SqlAlchemyUserRepository(db_session),
-            cart_repository=SqlAlchemyCartRepository(db_session),
-            inventory_gateway=SqlAlchemyInventoryGateway(db_session),
+            SqlAlchemyCartRepository(db_session),
+            SqlAlchemyInventoryGateway(db_session),
+            SqlAlchemyUnitOfWork(db_session),
         ),
     )
 
     response = list_items_in_cart(
         created_user.id,
-        ListCartItemsUseCase(SqlAlchemyCartRepository(db_session)),
+        ListCartItemsUseCase(SqlAlchemyCartViewReader(db_session)),
     )
 
-    assert len(response.items) == 1
-    assert response.items[0].item_id == created_item.id
+    body = json.loads(response.body)
+    expires_at = datetime.fromisoformat(body["items"][0].pop("expires_at"))
+    assert body == {
+        "items": [
+            {
+                "item_id": str(created_item.id),
+                "quantity": 1,
+                "name": "Keyboard",
+                "price": 99.0,
+                "line_total": 99.0,
+            }
+        ],
+        "total": 99.0,
+    }
+    assert expires_at > datetime.now(timezone.utc)
@@ -0,0 +1,42 @@
+import pytest
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from be_task_ca.batching import batches
+from be_task_ca.bulk_bodies import NDJSON_MEDIA_TYPE, parse_bulk_body
+
+
+class Entry(BaseModel):
+    name: str
+
+
+def _parse(body: bytes, content_type: str | None, max_count: int = 10):
+    return parse_bulk_body(body, content_type, Entry, max_count, "Too many")
+
+
+def test_should_parse_json_array_and_ndjson_alike():
+    from_json = _parse(b'[{"name": "a"}, {"name": "b"}]', "application/json")
+    from_ndjson = _parse(b'{"name": "a"}\n\n{"name": "b"}\n', NDJSON_MEDIA_TYPE)
+
+    assert from_json == from_ndjson == [Entry(name="a"), Entry(name="b")]
+
+
+def test_should_name_the_invalid_ndjson_line():
+    with pytest.raises(HTTPException) as exc_info:
+        _parse(b'{"name": "a"}\n{}\n', NDJSON_MEDIA_TYPE)
+
+    assert exc_info.value.status_code == 422
+    assert exc_info.value.detail.startswith("Line 2:")
+
+
+def test_should_reject_more_entries_than_allowed():
+    with pytest.raises(HTTPException) as exc_info:
+        _parse(b'[{"name": "a"}, {"name": "b"}]', None, max_count=1)
+
+    assert exc_info.value.status_code == 413
+    assert exc_info.value.detail == "Too many"
+
+
+def test_batches_should_split_lazily_into_lists_of_the_given_size():
+    assert list(batches(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(batches([], 2)) == []
@@ -0,0 +1,46 @@
+from be_task_ca.cache import InMemoryCacheBackend, TieredCache, TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_should_evict_least_recently_used_entry():
+    cache = TTLCache("test-lru", maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_ttl_cache_should_expire_entries_and_count_hits_and_misses():
+    clock = FakeClock()
+    cache = TTLCache("test-ttl", maxsize=10, ttl=5, clock=clock)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    clock.now = 5
+    assert cache.get("a") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_tiered_cache_should_backfill_local_tier_from_shared_backend():
+    shared = InMemoryCacheBackend()
+    writer = TieredCache(TTLCache("test-writer", maxsize=10, ttl=60), shared)
+    reader = TieredCache(TTLCache("test-reader", maxsize=10, ttl=60), shared)
+    writer.set("a", 1)
+
+    assert reader.get("a") == 1
+    assert reader.local.get("a") == 1
+
+    writer.delete_many(["a"])
+    assert shared.get("a") is None
@@ -0,0 +1,133 @@
+import asyncio
+import gzip
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+
+from be_task_ca.cache import TTLCache
+from be_task_ca.compression import CompressionMiddleware, negotiate_content_coding
+
+LARGE_BODY = b'{"items":[' + b",".join([b'{"name":"Book"}'] * 200) + b"]}"
+
+
+def _create_app(**options) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large():
+        return Response(
+            LARGE_BODY, media_type="application/json", headers={"ETag": '"v1"'}
+        )
+
+    @app.get("/small")
+    async def small():
+        return Response(b'{"ok":true}', media_type="application/json")
+
+    @app.get("/encoded")
+    async def encoded():
+        body = gzip.compress(LARGE_BODY)
+        return Response(
+            body, media_type="application/json", headers={"Content-Encoding": "gzip"}
+        )
+
+    @app.get("/stream")
+    async def stream():
+        chunks = (b'{"name":"Book"}\n' for _ in range(100))
+        return StreamingResponse(chunks, media_type="application/x-ndjson")
+
+    app.add_middleware(CompressionMiddleware, **options)
+    return app
+
+
+def _get(app: FastAPI, path: str, accept_encoding: str) -> httpx.Response:
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        headers = {"Accept-Encoding": accept_encoding}
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await client.get(path, headers=headers)
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip, br", "br"),
+        ("gzip;q=1.0, br;q=0", "gzip"),
+        ("*", "zstd"),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_should_negotiate_first_accepted_offered_coding(accept_encoding, expected):
+    offered = ("zstd", "br", "gzip")
+
+    assert negotiate_content_coding(accept_encoding, offered) == expected
+
+
+@pytest.mark.parametrize("coding", ["zstd", "br", "gzip"])
+def test_should_compress_large_responses_with_negotiated_coding(coding):
+    response = _get(_create_app(), "/large", f"{coding}, gzip")
+
+    assert response.headers["Content-Encoding"] == coding
+    assert int(response.headers["Content-Length"]) < len(LARGE_BODY)
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["ETag"] == 'W/"v1"'
+    assert response.content == LARGE_BODY
+
+
+def test_should_not_compress_small_or_already_encoded_responses():
+    app = _create_app()
+
+    small = _get(app, "/small", "gzip")
+    encoded = _get(app, "/encoded", "br")
+    identity = _get(app, "/large", "identity")
+
+    assert "Content-Encoding" not in small.headers
+    assert small.headers["Vary"] == "Accept-Encoding"
+    assert encoded.headers["Content-Encoding"] == "gzip"
+    assert encoded.content == LARGE_BODY
+    assert "Content-Encoding" not in identity.headers
+    assert identity.headers["ETag"] == '"v1"'
+
+
+def test_should_compress_streamed_responses_chunk_by_chunk():
+    response = _get(_create_app(), "/stream", "gzip")
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert response.content == b'{"name":"Book"}\n' * 100
+
+
+def test_should_reuse_compressed_body_of_response_with_strong_etag():
+    cache = TTLCache("test-compressed-responses", maxsize=10, ttl=60)
+    app = _create_app(cache=cache)
+
+    first = _get(app, "/large", "br")
+    second = _get(app, "/large", "br")
+    _get(app, "/large", "gzip")
+
+    assert second.content == first.content == LARGE_BODY
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_should_use_route_level_over_coding_level():
+    middleware = CompressionMiddleware(
+        app=None, levels={"br": 4}, route_levels={"/items/": {"br": 9}}
+    )
+
+    items_scope = {"route": SimpleNamespace(path="/items/")}
+    assert middleware.level(items_scope, "br") == 9
+    assert middleware.level(items_scope, "gzip") == 6
+    assert middleware.level({}, "br") == 4
+
+
+def test_should_reject_unknown_codings():
+    with pytest.raises(ValueError):
+        CompressionMiddleware(app=None, encodings=["deflate"])
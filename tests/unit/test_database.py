@@ -0,0 +1,58 @@
+import pytest
+from sqlalchemy import exc
+
+from be_task_ca.database import create_db_engine
+from be_task_ca.observability.metrics import REGISTRY
+from be_task_ca.settings import Settings
+
+
+def _sample(name: str, pool_name: str) -> float:
+    prefix = f'{name}{{pool="{pool_name}"}} '
+    line = next(
+        line for line in REGISTRY.render().splitlines() if line.startswith(prefix)
+    )
+    return float(line[len(prefix):])
+
+
+def test_should_build_engine_from_settings(tmp_path):
+    engine = create_db_engine(
+        Settings(
+            database_url=f"sqlite:///{tmp_path / 'settings.db'}",
+            db_pool_size=3,
+            db_max_overflow=2,
+            db_pool_recycle=600,
+        ),
+        pool_name="test-settings",
+    )
+
+    assert engine.pool.size() == 3
+    assert engine.pool._max_overflow == 2
+    assert engine.pool._recycle == 600
+    assert _sample("db_pool_size", "test-settings") == 3
+
+
+def test_should_record_pool_occupancy_overflow_and_timeouts(tmp_path):
+    engine = create_db_engine(
+        Settings(
+            database_url=f"sqlite:///{tmp_path / 'pool.db'}",
+            db_pool_size=1,
+            db_max_overflow=1,
+            db_pool_timeout=0.05,
+        ),
+        pool_name="test-pool",
+    )
+
+    first = engine.connect()
+    second = engine.connect()
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+
+    assert _sample("db_pool_connections_in_use", "test-pool") == 2
+    assert _sample("db_pool_saturation", "test-pool") == 1.0
+    assert _sample("db_pool_overflow_events_total", "test-pool") == 1
+    assert _sample("db_pool_checkout_timeouts_total", "test-pool") == 1
+    assert _sample("db_pool_checkout_wait_seconds_count", "test-pool") == 3
+
+    first.close()
+    second.close()
+    assert _sample("db_pool_connections_in_use", "test-pool") == 0
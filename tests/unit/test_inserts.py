@@ -0,0 +1,22 @@
+import pytest
+from sqlalchemy.dialects import postgresql, sqlite
+
+from be_task_ca.inserts import insert_skipping_conflicts
+from be_task_ca.item.adapters.db.model import Item
+
+_items = Item.__table__
+
+
+@pytest.mark.parametrize("dialect", [postgresql.dialect(), sqlite.dialect()])
+def test_insert_skipping_conflicts_should_target_the_given_columns(dialect):
+    statement = insert_skipping_conflicts(_items, dialect.name, [_items.c.name])
+
+    sql = str(statement.compile(dialect=dialect))
+
+    assert sql.startswith("INSERT INTO items")
+    assert "ON CONFLICT (name) DO NOTHING" in sql
+
+
+def test_insert_skipping_conflicts_should_reject_unsupported_dialects():
+    with pytest.raises(NotImplementedError, match="'items'.*'mysql'"):
+        insert_skipping_conflicts(_items, "mysql", [_items.c.name])
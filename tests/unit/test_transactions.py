@@ -0,0 +1,44 @@
+import pytest
+
+from be_task_ca.events import ChangeNotifier
+from be_task_ca.item.adapters.db.model import Item
+from be_task_ca.item.adapters.db.repository import SqlAlchemyItemRepository
+from be_task_ca.item.domain.entities import ItemEntity
+from be_task_ca.transactions import SqlAlchemyUnitOfWork
+
+
+def _item(name: str) -> ItemEntity:
+    return ItemEntity(id=None, name=name, description="Desc", price=1.0, quantity=1)
+
+
+def _repository(db_session) -> tuple[SqlAlchemyItemRepository, list]:
+    changed_ids = []
+    notifier = ChangeNotifier()
+    notifier.subscribe(changed_ids.extend)
+    return SqlAlchemyItemRepository(db_session, notifier=notifier), changed_ids
+
+
+def test_should_commit_writes_together_and_notify_after_commit(db_session):
+    repository, changed_ids = _repository(db_session)
+
+    with SqlAlchemyUnitOfWork(db_session) as unit_of_work:
+        book = repository.save_item(_item("Book"))
+        pen = repository.save_item(_item("Pen"))
+        assert changed_ids == []
+        unit_of_work.commit()
+
+    assert changed_ids == [book.id, pen.id]
+    assert db_session.query(Item).count() == 2
+
+
+def test_should_roll_back_writes_and_notifications_when_use_case_raises(db_session):
+    repository, changed_ids = _repository(db_session)
+
+    with pytest.raises(RuntimeError):
+        with SqlAlchemyUnitOfWork(db_session):
+            repository.save_item(_item("Book"))
+            raise RuntimeError("failed after the write")
+    db_session.commit()
+
+    assert changed_ids == []
+    assert db_session.query(Item).count() == 0
@@ -10,6 +10,7 @@ from be_task_ca.user.application.exceptions import (
     ItemAlreadyInCartError,
     ItemNotFoundError,
     NotEnoughStockError,
+    PasswordHasherBusyError,
     UserAlreadyExistsError,
     UserNotFoundError,
 )
@@ -83,6 +84,25 @@ def test_should_map_create_user_already_exists_error_to_http_409():
     assert exc_info.value.detail == "duplicate user"
 
 
+def test_should_map_password_hasher_busy_error_to_http_503():
+    use_case = MockCreateUserUseCase(error=PasswordHasherBusyError("saturated"))
+
+    with pytest.raises(HTTPException) as exc_info:
+        create_user(
+            CreateUserRequest(
+                first_name="Marko",
+                last_name="Crnic",
+                email="marko@example.com",
+                password="pass",
+                shipping_address="Street 1",
+            ),
+            use_case,
+        )
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "1"}
+
+
 def test_should_return_create_user_response_when_use_case_succeeds():
     use_case = MockCreateUserUseCase(
         result=CreateUserResult(
@@ -0,0 +1,141 @@
+import asyncio
+from uuid import uuid4
+
+from be_task_ca.cache import TieredCache, TTLCache
+from be_task_ca.item.adapters.db.events import item_changes, item_detail_changes
+from be_task_ca.user.adapters.cache.cart_view import (
+    AsyncCachingCartViewReader,
+    CachingCartViewReader,
+    CartViewCache,
+    cart_view_cache,
+)
+from be_task_ca.user.application.dto import CartLineView
+
+
+class CountingCartViewReader:
+    def __init__(self, lines: list[CartLineView]) -> None:
+        self.lines = lines
+        self.calls = 0
+
+    def get_cart_lines(self, user_id):
+        self.calls += 1
+        return list(self.lines)
+
+
+class AsyncCountingCartViewReader(CountingCartViewReader):
+    async def get_cart_lines(self, user_id):
+        return super().get_cart_lines(user_id)
+
+
+def _line(price: float = 10.0) -> CartLineView:
+    return CartLineView(item_id=uuid4(), name="Item", price=price, quantity=1)
+
+
+def _cache(name: str, maxsize: int = 10) -> CartViewCache:
+    return CartViewCache(TieredCache(TTLCache(name, maxsize=maxsize, ttl=60)))
+
+
+def test_should_serve_repeated_reads_from_cache():
+    user_id = uuid4()
+    inner = CountingCartViewReader([_line()])
+    reader = CachingCartViewReader(inner, _cache("test-cart-hit"))
+
+    assert reader.get_cart_lines(user_id) == inner.lines
+    assert reader.get_cart_lines(user_id) == inner.lines
+    assert inner.calls == 1
+
+
+def test_should_reload_after_cart_or_item_change():
+    user_id, other_user_id = uuid4(), uuid4()
+    line = _line()
+    inner = CountingCartViewReader([line])
+    cache = _cache("test-cart-invalidate")
+    reader = CachingCartViewReader(inner, cache)
+    reader.get_cart_lines(user_id)
+
+    cache.invalidate_users([other_user_id])
+    reader.get_cart_lines(user_id)
+    cache.invalidate_users([user_id])
+    reader.get_cart_lines(user_id)
+    cache.invalidate_items([uuid4()])
+    reader.get_cart_lines(user_id)
+    inner.lines = [line._replace(price=12.0)]
+    cache.invalidate_items([line.item_id])
+
+    assert reader.get_cart_lines(user_id) == inner.lines
+    assert inner.calls == 3
+
+
+def test_should_not_store_lines_read_across_an_invalidation():
+    user_id = uuid4()
+    cache = _cache("test-cart-race")
+
+    class InvalidatedMidRead(CountingCartViewReader):
+        def get_cart_lines(self, user_id):
+            lines = super().get_cart_lines(user_id)
+            cache.invalidate_users([user_id])
+            return lines
+
+    inner = InvalidatedMidRead([_line()])
+    reader = CachingCartViewReader(inner, cache)
+    reader.get_cart_lines(user_id)
+
+    assert cache.get(user_id) is None
+
+
+def test_should_store_lines_read_across_another_users_invalidation():
+    user_id, other_user_id = uuid4(), uuid4()
+    cache = _cache("test-cart-race-other")
+
+    class OtherInvalidatedMidRead(CountingCartViewReader):
+        def get_cart_lines(self, user_id):
+            lines = super().get_cart_lines(user_id)
+            cache.invalidate_users([other_user_id])
+            return lines
+
+    inner = OtherInvalidatedMidRead([_line()])
+    CachingCartViewReader(inner, cache).get_cart_lines(user_id)
+
+    assert cache.get(user_id) == inner.lines
+    assert cache._fills == {}
+
+
+def test_should_keep_cached_carts_across_stock_only_item_writes():
+    user_id = uuid4()
+    line = _line()
+    cart_view_cache.set(user_id, [line], cart_view_cache.begin_fill(user_id))
+
+    item_changes.notify([line.item_id])
+    kept = cart_view_cache.get(user_id)
+    item_detail_changes.notify([line.item_id])
+
+    assert kept == [line]
+    assert cart_view_cache.get(user_id) is None
+    assert user_id not in cart_view_cache._cart_items
+
+
+def test_should_bound_item_index_to_twice_the_cache_size():
+    cache = _cache("test-cart-index", maxsize=1)
+    first_line = _line()
+    for line in (first_line, _line(), _line()):
+        user_id = uuid4()
+        cache.set(user_id, [line], cache.begin_fill(user_id))
+
+    assert len(cache._cart_items) == 2
+    assert first_line.item_id not in cache._holders
+
+
+def test_async_reader_should_share_cache_semantics():
+    user_id = uuid4()
+    inner = AsyncCountingCartViewReader([_line()])
+    cache = _cache("test-cart-async")
+    reader = AsyncCachingCartViewReader(inner, cache)
+
+    async def run():
+        await reader.get_cart_lines(user_id)
+        await reader.get_cart_lines(user_id)
+        cache.invalidate_users([user_id])
+        return await reader.get_cart_lines(user_id)
+
+    assert asyncio.run(run()) == inner.lines
+    assert inner.calls == 2
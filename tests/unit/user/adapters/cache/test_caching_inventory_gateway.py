@@ -0,0 +1,155 @@
+import asyncio
+from uuid import uuid4
+
+from be_task_ca.cache import TieredCache, TTLCache
+from be_task_ca.events import ChangeNotifier
+from be_task_ca.item.adapters.db.events import item_changes
+from be_task_ca.item.adapters.db.repository import SqlAlchemyItemRepository
+from be_task_ca.item.domain.entities import ItemEntity
+from be_task_ca.user.adapters.cache.inventory_gateway import (
+    AsyncCachingInventoryGateway,
+    CachingInventoryGateway,
+    InventoryCache,
+    inventory_cache,
+)
+from be_task_ca.user.application.interfaces.inventory_gateway_interface import (
+    InventoryItemSnapshot,
+)
+
+
+class CountingInventoryGateway:
+    def __init__(self, item: InventoryItemSnapshot | None) -> None:
+        self.item = item
+        self.item_calls = 0
+        self.quantity_calls = 0
+        self.batches = []
+
+    def find_item_by_id(self, item_id):
+        self.item_calls += 1
+        return self.item
+
+    def find_items_by_ids(self, item_ids):
+        self.batches.append(list(item_ids))
+        return {item_id: self.item for item_id in item_ids if item_id == self.item.id}
+
+    def find_item_quantity(self, item_id):
+        self.quantity_calls += 1
+        return self.item.quantity if self.item else None
+
+
+class AsyncCountingInventoryGateway(CountingInventoryGateway):
+    async def find_item_by_id(self, item_id):
+        return super().find_item_by_id(item_id)
+
+    async def find_item_quantity(self, item_id):
+        return super().find_item_quantity(item_id)
+
+
+def _snapshot(quantity: int = 5) -> InventoryItemSnapshot:
+    return InventoryItemSnapshot(
+        id=uuid4(), name="Item", description="Desc", price=10.0, quantity=quantity
+    )
+
+
+def _cache(name: str) -> InventoryCache:
+    return InventoryCache(TieredCache(TTLCache(name, maxsize=10, ttl=60)))
+
+
+def test_should_serve_repeated_lookups_from_cache():
+    item = _snapshot()
+    inner = CountingInventoryGateway(item)
+    gateway = CachingInventoryGateway(inner, _cache("test-gw-hit"))
+
+    assert gateway.find_item_by_id(item.id) == item
+    assert gateway.find_item_by_id(item.id) == item
+    assert inner.item_calls == 1
+
+
+def test_should_not_cache_missing_items():
+    inner = CountingInventoryGateway(None)
+    gateway = CachingInventoryGateway(inner, _cache("test-gw-miss"))
+    item_id = uuid4()
+
+    assert gateway.find_item_by_id(item_id) is None
+    assert gateway.find_item_by_id(item_id) is None
+    assert inner.item_calls == 2
+
+
+def test_should_read_fresh_quantity_in_bypass_mode():
+    item = _snapshot(quantity=5)
+    inner = CountingInventoryGateway(item)
+    gateway = CachingInventoryGateway(
+        inner, _cache("test-gw-bypass"), bypass_quantity=True
+    )
+    gateway.find_item_by_id(item.id)
+    inner.item = InventoryItemSnapshot(**{**item.__dict__, "quantity": 1})
+
+    assert gateway.find_item_by_id(item.id).quantity == 1
+    assert inner.item_calls == 1
+    assert inner.quantity_calls == 1
+
+
+def test_async_gateway_should_serve_repeated_lookups_from_cache():
+    item = _snapshot()
+    inner = AsyncCountingInventoryGateway(item)
+    gateway = AsyncCachingInventoryGateway(inner, _cache("test-gw-async"))
+
+    async def lookup_twice():
+        await gateway.find_item_by_id(item.id)
+        return await gateway.find_item_by_id(item.id)
+
+    assert asyncio.run(lookup_twice()) == item
+    assert inner.item_calls == 1
+
+
+def test_should_load_only_uncached_items_of_a_batch():
+    item = _snapshot()
+    inner = CountingInventoryGateway(item)
+    gateway = CachingInventoryGateway(inner, _cache("test-gw-batch"))
+    missing_id = uuid4()
+    gateway.find_item_by_id(item.id)
+
+    assert gateway.find_items_by_ids([item.id, missing_id]) == {item.id: item}
+    assert gateway.find_items_by_ids([item.id]) == {item.id: item}
+    assert inner.batches == [[missing_id]]
+
+
+def test_save_item_should_notify_written_item_ids_once_committed(db_session):
+    notifier = ChangeNotifier()
+    changed_ids = []
+    notifier.subscribe(changed_ids.extend)
+    repository = SqlAlchemyItemRepository(db_session, notifier=notifier)
+
+    item = repository.save_item(
+        ItemEntity(id=uuid4(), name="Item", description="Desc", price=10.0, quantity=2)
+    )
+
+    assert changed_ids == []
+    db_session.commit()
+    assert changed_ids == [item.id]
+
+
+def test_should_not_store_items_read_across_an_invalidation():
+    item, other = _snapshot(), _snapshot()
+    cache = _cache("test-gw-race")
+
+    class InvalidatedMidRead(CountingInventoryGateway):
+        def find_items_by_ids(self, item_ids):
+            cache.invalidate([item.id])
+            return {item.id: item, other.id: other}
+
+    gateway = CachingInventoryGateway(InvalidatedMidRead(item), cache)
+    gateway.find_items_by_ids([item.id, other.id])
+
+    assert cache.get(item.id) is None
+    assert cache.get(other.id) == other
+    assert cache._fills == {}
+
+
+def test_item_change_should_invalidate_shared_inventory_cache():
+    stale = _snapshot(quantity=99)
+    inventory_cache.set(stale.id, stale, inventory_cache.begin_fill([stale.id]))
+
+    item_changes.notify([stale.id])
+
+    assert inventory_cache.get(stale.id) is None
@@ -0,0 +1,93 @@
+from uuid import uuid4
+
+from be_task_ca.events import ChangeNotifier
+from be_task_ca.item.adapters.db.model import Item
+from be_task_ca.user.adapters.db.cart_repository import SqlAlchemyCartRepository
+from be_task_ca.user.adapters.db.model import CartItem, User
+from be_task_ca.user.application.interfaces.cart_repository_interface import (
+    AddToCartOutcome,
+)
+from be_task_ca.user.domain.entities import CartItemEntity
+
+
+def _seed(db_session):
+    user = User(
+        email="marko@example.com",
+        first_name="Marko",
+        last_name="Crnic",
+        hashed_password="hash",
+        shipping_address="Street 1",
+    )
+    item = Item(name="Keyboard", description="Mechanical", price=99.0, quantity=5)
+    db_session.add_all([user, item])
+    db_session.commit()
+    return user.id, item.id
+
+
+def test_should_add_item_and_return_updated_cart(db_session):
+    user_id, item_id = _seed(db_session)
+    repository = SqlAlchemyCartRepository(db_session)
+
+    attempt = repository.add_item_to_cart(
+        CartItemEntity(user_id=user_id, item_id=item_id, quantity=2)
+    )
+
+    assert attempt.outcome is AddToCartOutcome.ADDED
+    assert attempt.cart_items == [
+        CartItemEntity(user_id=user_id, item_id=item_id, quantity=2)
+    ]
+
+
+def test_should_report_failed_checks_without_inserting(db_session):
+    user_id, item_id = _seed(db_session)
+    repository = SqlAlchemyCartRepository(db_session)
+    repository.add_item_to_cart(
+        CartItemEntity(user_id=user_id, item_id=item_id, quantity=1)
+    )
+
+    attempts = {
+        AddToCartOutcome.USER_NOT_FOUND: CartItemEntity(uuid4(), item_id, 1),
+        AddToCartOutcome.ITEM_NOT_FOUND: CartItemEntity(user_id, uuid4(), 1),
+        AddToCartOutcome.NOT_ENOUGH_STOCK: CartItemEntity(user_id, item_id, 6),
+        AddToCartOutcome.ALREADY_IN_CART: CartItemEntity(user_id, item_id, 2),
+    }
+
+    for expected, cart_item in attempts.items():
+        assert repository.add_item_to_cart(cart_item).outcome is expected
+    assert db_session.query(CartItem).count() == 1
+
+
+def test_should_notify_cart_changes_after_committed_writes(db_session):
+    user_id, item_id = _seed(db_session)
+    changed_users = []
+    notifier = ChangeNotifier()
+    notifier.subscribe(changed_users.extend)
+    repository = SqlAlchemyCartRepository(db_session, notifier=notifier)
+
+    repository.add_item_to_cart(CartItemEntity(user_id, item_id, 1))
+    db_session.rollback()
+    repository.add_item_to_cart(CartItemEntity(user_id, item_id, 1))
+    repository.add_item_to_cart(CartItemEntity(user_id, item_id, 1))
+
+    assert changed_users == []
+    db_session.commit()
+    assert changed_users == [user_id]
+
+
+def test_should_add_several_items_in_one_transaction_or_none(db_session):
+    user_id, item_id = _seed(db_session)
+    other = Item(name="Mouse", description="Wireless", price=25.0, quantity=5)
+    db_session.add(other)
+    db_session.commit()
+    repository = SqlAlchemyCartRepository(db_session)
+    lines = [CartItemEntity(user_id, item_id, 1), CartItemEntity(user_id, other.id, 2)]
+
+    added = repository.add_items_to_cart(user_id, lines)
+    again = repository.add_items_to_cart(user_id, lines[1:])
+    missing_user = repository.add_items_to_cart(uuid4(), lines)
+
+    assert added.outcome is AddToCartOutcome.ADDED
+    assert added.cart_items == lines
+    assert again.outcome is AddToCartOutcome.ALREADY_IN_CART
+    assert missing_user.outcome is AddToCartOutcome.USER_NOT_FOUND
+    assert db_session.query(CartItem).count() == 2
@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from be_task_ca.item.adapters.db.model import Item, StockReservation
+from be_task_ca.user.adapters.db.cart_view_reader import SqlAlchemyCartViewReader
+from be_task_ca.user.adapters.db.model import CartItem
+from be_task_ca.user.application.dto import CartLineView
+
+
+def test_should_join_cart_items_with_items_in_name_order(db_session):
+    user_id, other_user_id = uuid4(), uuid4()
+    pen = Item(name="Pen", description="Blue", price=1.5, quantity=10)
+    book = Item(name="Book", description="Novel", price=12.0, quantity=3)
+    db_session.add_all([pen, book])
+    db_session.flush()
+    db_session.add_all(
+        [
+            CartItem(user_id=user_id, item_id=pen.id, quantity=4),
+            CartItem(user_id=user_id, item_id=book.id, quantity=1),
+            CartItem(user_id=other_user_id, item_id=pen.id, quantity=2),
+        ]
+    )
+    db_session.commit()
+
+    lines = SqlAlchemyCartViewReader(db_session).get_cart_lines(user_id)
+
+    assert lines == [
+        CartLineView(item_id=book.id, name="Book", price=12.0, quantity=1),
+        CartLineView(item_id=pen.id, name="Pen", price=1.5, quantity=4),
+    ]
+
+
+def test_should_report_when_each_cart_line_reservation_expires(db_session):
+    user_id = uuid4()
+    pen = Item(name="Pen", description="Blue", price=1.5, quantity=10)
+    book = Item(name="Book", description="Novel", price=12.0, quantity=3)
+    db_session.add_all([pen, book])
+    db_session.flush()
+    expires_at = datetime(2030, 1, 1, 12, 0, tzinfo=timezone.utc)
+    db_session.add_all(
+        [
+            CartItem(user_id=user_id, item_id=pen.id, quantity=4),
+            CartItem(user_id=user_id, item_id=book.id, quantity=1),
+            StockReservation(
+                item_id=pen.id, holder_id=user_id, quantity=4, expires_at=expires_at
+            ),
+        ]
+    )
+    db_session.commit()
+
+    lines = SqlAlchemyCartViewReader(db_session).get_cart_lines(user_id)
+
+    assert [line.expires_at for line in lines] == [None, expires_at]
@@ -0,0 +1,30 @@
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from be_task_ca.item.adapters.db.model import Item
+from be_task_ca.user.adapters.db.inventory_gateway import SqlAlchemyInventoryGateway
+from be_task_ca.user.adapters.db.inventory_queries import items_by_ids_statement
+
+
+def test_should_find_existing_items_by_ids_in_one_query(db_session):
+    pen = Item(name="Pen", description="Blue", price=1.5, quantity=10)
+    book = Item(name="Book", description="Novel", price=12.0, quantity=3)
+    db_session.add_all([pen, book])
+    db_session.commit()
+    gateway = SqlAlchemyInventoryGateway(db_session)
+
+    items = gateway.find_items_by_ids([pen.id, uuid4(), book.id, pen.id])
+
+    assert set(items) == {pen.id, book.id}
+    assert items[book.id].name == "Book"
+    assert items[pen.id].quantity == 10
+    assert gateway.find_items_by_ids([]) == {}
+
+
+def test_should_bind_ids_as_one_array_on_postgres():
+    statement = items_by_ids_statement("postgresql", [uuid4(), uuid4(), uuid4()])
+
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "WHERE items.id = ANY (%(item_ids)s::UUID[])" in sql
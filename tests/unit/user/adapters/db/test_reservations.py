@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from be_task_ca.events import ChangeNotifier
+from be_task_ca.item.adapters.db.model import Item, StockReservation
+from be_task_ca.user.adapters.db.cart_repository import SqlAlchemyCartRepository
+from be_task_ca.user.adapters.db.inventory_gateway import SqlAlchemyInventoryGateway
+from be_task_ca.user.adapters.db.model import CartItem, User
+from be_task_ca.user.adapters.db.reservations import release_expired_reservations
+from be_task_ca.user.domain.entities import CartItemEntity
+
+
+def _seed(db_session, quantity=5):
+    user = User(
+        email="marko@example.com",
+        first_name="Marko",
+        last_name="Crnic",
+        hashed_password="hash",
+        shipping_address="Street 1",
+    )
+    item = Item(
+        name="Keyboard", description="Mechanical", price=99.0, quantity=quantity
+    )
+    db_session.add_all([user, item])
+    db_session.commit()
+    return user.id, item.id
+
+
+def _stock(db_session, item_id) -> int:
+    db_session.expire_all()
+    return db_session.get(Item, item_id).quantity
+
+
+def test_should_reserve_stock_only_while_it_covers_the_quantity(db_session):
+    user_id, item_id = _seed(db_session, quantity=5)
+    changed_ids = []
+    notifier = ChangeNotifier()
+    notifier.subscribe(changed_ids.extend)
+    gateway = SqlAlchemyInventoryGateway(db_session, notifier=notifier)
+
+    reservation = gateway.reserve_stock(item_id, user_id, 3)
+
+    assert reservation.quantity == 3
+    assert reservation.expires_at > datetime.now(timezone.utc)
+    assert gateway.reserve_stock(item_id, user_id, 3) is None
+    assert _stock(db_session, item_id) == 2
+    assert db_session.query(StockReservation).count() == 1
+    assert changed_ids == []
+    db_session.commit()
+    assert changed_ids == [item_id]
+
+
+def test_should_release_expired_reservations_in_batches(db_session):
+    user_id, item_id = _seed(db_session, quantity=5)
+    expired = SqlAlchemyInventoryGateway(db_session, reservation_ttl=timedelta(0))
+    active = SqlAlchemyInventoryGateway(db_session)
+    SqlAlchemyCartRepository(db_session).add_item_to_cart(
+        CartItemEntity(user_id=user_id, item_id=item_id, quantity=2)
+    )
+    expired.reserve_stock(item_id, user_id, 2)
+    expired.reserve_stock(item_id, user_id, 1)
+    active.reserve_stock(item_id, user_id, 1)
+    now = datetime.now(timezone.utc) + timedelta(seconds=1)
+    changed_carts = []
+    cart_notifier = ChangeNotifier()
+    cart_notifier.subscribe(changed_carts.extend)
+
+    def release(batch_size):
+        return release_expired_reservations(
+            db_session, batch_size, now=now, cart_notifier=cart_notifier
+        )
+
+    assert release(batch_size=1) == 1
+    assert release(batch_size=10) == 1
+    assert release(batch_size=10) == 0
+    assert changed_carts == [user_id, user_id]
+    assert _stock(db_session, item_id) == 4
+    assert db_session.query(StockReservation).count() == 1
+    assert db_session.query(CartItem).count() == 0
+
+
+def test_should_reserve_several_stocks_all_or_nothing(db_session):
+    user_id, item_id = _seed(db_session, quantity=5)
+    other = Item(name="Mouse", description="Wireless", price=25.0, quantity=1)
+    db_session.add(other)
+    db_session.commit()
+    gateway = SqlAlchemyInventoryGateway(db_session)
+
+    assert gateway.reserve_stocks(user_id, {item_id: 2, other.id: 2}) is None
+    db_session.rollback()
+    assert _stock(db_session, item_id) == 5
+    reservations = gateway.reserve_stocks(user_id, {item_id: 2, other.id: 1})
+
+    assert [reservation.item_id for reservation in reservations] == [item_id, other.id]
+    assert _stock(db_session, item_id) == 3
+    assert _stock(db_session, other.id) == 0
+    assert db_session.query(StockReservation).count() == 2
+
+
+def test_should_refuse_to_reserve_non_positive_quantities(db_session):
+    user_id, item_id = _seed(db_session, quantity=5)
+    gateway = SqlAlchemyInventoryGateway(db_session)
+
+    for quantity in (0, -3):
+        with pytest.raises(ValueError):
+            gateway.reserve_stock(item_id, user_id, quantity)
+        with pytest.raises(ValueError):
+            gateway.reserve_stocks(user_id, {item_id: quantity})
+
+    assert _stock(db_session, item_id) == 5
+    assert db_session.query(StockReservation).count() == 0
@@ -0,0 +1,27 @@
+from be_task_ca.user.adapters.db.model import User
+from be_task_ca.user.adapters.db.user_repository import SqlAlchemyUserRepository
+from be_task_ca.user.domain.entities import UserEntity
+
+
+def _user(first_name: str) -> UserEntity:
+    return UserEntity(
+        id=None,
+        email="marko@example.com",
+        first_name=first_name,
+        last_name="Crnic",
+        hashed_password="hash",
+        shipping_address="Street 1",
+    )
+
+
+def test_should_insert_user_only_when_email_is_free(db_session):
+    repository = SqlAlchemyUserRepository(db_session)
+
+    saved = repository.save_user_if_absent(_user("Marko"))
+    duplicate = repository.save_user_if_absent(_user("Other"))
+    db_session.commit()
+
+    assert saved.id is not None
+    assert saved.first_name == "Marko"
+    assert duplicate is None
+    assert db_session.query(User).count() == 1
@@ -0,0 +1,56 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from be_task_ca.user.adapters.password_hashing import (
+    HASH_CHUNK_SIZE,
+    PASSWORD_HASH_REJECTED,
+    AsyncPooledPasswordHasher,
+    HashQueue,
+    PooledPasswordHasher,
+)
+from be_task_ca.user.application.exceptions import PasswordHasherBusyError
+from be_task_ca.user.application.passwords import hash_password, hash_passwords
+
+
+def test_should_hash_many_passwords_in_input_order_across_chunks():
+    passwords = [f"password-{number}" for number in range(HASH_CHUNK_SIZE + 3)]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        queue = HashQueue(executor, max_pending=4)
+        hashed = PooledPasswordHasher(queue).hash_many(passwords)
+
+    assert hashed == list(map(hash_password, passwords))
+    assert queue.pending == 0
+
+
+def test_should_reject_work_once_queue_is_full():
+    release = threading.Event()
+
+    def blocking_hash(passwords):
+        release.wait()
+        return hash_passwords(passwords)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        queue = HashQueue(executor, max_pending=1, hash_function=blocking_hash)
+        in_flight = queue.submit(["first"])
+        rejected_before = PASSWORD_HASH_REJECTED.labels().value
+
+        with pytest.raises(PasswordHasherBusyError):
+            PooledPasswordHasher(queue).hash("second")
+
+        release.set()
+        assert in_flight[0].result() == [hash_password("first")]
+
+    assert PASSWORD_HASH_REJECTED.labels().value == rejected_before + 1
+    assert queue.pending == 0
+
+
+def test_async_hasher_should_await_pool_results():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        hasher = AsyncPooledPasswordHasher(HashQueue(executor, max_pending=4))
+        hashed = asyncio.run(hasher.hash("secret"))
+
+    assert hashed == hash_password("secret")
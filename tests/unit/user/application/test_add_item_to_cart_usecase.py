@@ -1,7 +1,9 @@
+from datetime import datetime, timezone
 from uuid import uuid4
 
 import pytest
 
+from be_task_ca.unit_of_work import InMemoryUnitOfWork
 from be_task_ca.user.application.dto import AddToCartCommand
 from be_task_ca.user.application.exceptions import (
     ItemAlreadyInCartError,
@@ -9,31 +11,26 @@ from be_task_ca.user.application.exceptions import (
     NotEnoughStockError,
     UserNotFoundError,
 )
+from be_task_ca.user.application.interfaces.cart_repository_interface import (
+    AddToCartAttempt,
+    AddToCartOutcome,
+)
 from be_task_ca.user.application.interfaces.inventory_gateway_interface import (
-    InventoryItemSnapshot,
+    InventoryReservation,
 )
 from be_task_ca.user.application.usecases.add_item_to_cart import AddItemToCartUseCase
-from be_task_ca.user.domain.entities import CartItemEntity, UserEntity
-
-
-class MockUserRepository:
-    def __init__(self, user: UserEntity | None) -> None:
-        self._user = user
-
-    def save_user(self, user: UserEntity) -> UserEntity:
-        return user
-
-    def find_user_by_email(self, email: str) -> UserEntity | None:
-        return None
-
-    def find_user_by_id(self, user_id):
-        if self._user and self._user.id == user_id:
-            return self._user
-        return None
+from be_task_ca.user.domain.entities import CartItemEntity
 
 
 class MockCartRepository:
-    def __init__(self, existing_items: list[CartItemEntity] | None = None) -> None:
+    def __init__(
+        self,
+        user_ids=(),
+        stock: dict | None = None,
+        existing_items: list[CartItemEntity] | None = None,
+    ) -> None:
+        self._user_ids = set(user_ids)
+        self._stock = stock or {}
         self._items = existing_items or []
         self.saved_items: list[CartItemEntity] = []
 
@@ -45,43 +42,46 @@ class MockCartRepository:
         self.saved_items.append(cart_item)
         return cart_item
 
-
-class MockInventoryGateway:
-    def __init__(self, item: InventoryItemSnapshot | None) -> None:
-        self._item = item
-
-    def find_item_by_id(self, item_id):
-        if self._item and self._item.id == item_id:
-            return self._item
-        return None
-
-
-def _build_user() -> UserEntity:
-    return UserEntity(
-        id=uuid4(),
-        email="marko@example.com",
-        first_name="Marko",
-        last_name="Crnic",
-        hashed_password="hash",
-        shipping_address="Street 1",
-    )
+    def add_item_to_cart(self, cart_item: CartItemEntity) -> AddToCartAttempt:
+        cart = self.find_cart_items_for_user_id(cart_item.user_id)
+        if cart_item.user_id not in self._user_ids:
+            outcome = AddToCartOutcome.USER_NOT_FOUND
+        elif cart_item.item_id not in self._stock:
+            outcome = AddToCartOutcome.ITEM_NOT_FOUND
+        elif self._stock[cart_item.item_id] < cart_item.quantity:
+            outcome = AddToCartOutcome.NOT_ENOUGH_STOCK
+        elif any(item.item_id == cart_item.item_id for item in cart):
+            outcome = AddToCartOutcome.ALREADY_IN_CART
+        else:
+            self.save_cart_item(cart_item)
+            outcome = AddToCartOutcome.ADDED
+        return AddToCartAttempt(
+            outcome=outcome,
+            cart_items=self.find_cart_items_for_user_id(cart_item.user_id),
+        )
 
 
-def _build_inventory_item(item_id):
-    return InventoryItemSnapshot(
-        id=item_id,
-        name="Keyboard",
-        description="Mechanical",
-        price=99.0,
-        quantity=5,
-    )
+class MockInventoryGateway:
+    def __init__(self, stock_available: bool = True) -> None:
+        self._stock_available = stock_available
+        self.reserved = []
+
+    def reserve_stock(self, item_id, holder_id, quantity):
+        if not self._stock_available:
+            return None
+        self.reserved.append((item_id, holder_id, quantity))
+        return InventoryReservation(
+            id=uuid4(),
+            item_id=item_id,
+            holder_id=holder_id,
+            quantity=quantity,
+            expires_at=datetime.now(timezone.utc),
+        )
 
 
 def test_should_raise_when_user_does_not_exist():
     use_case = AddItemToCartUseCase(
-        user_repository=MockUserRepository(user=None),
-        cart_repository=MockCartRepository(),
-        inventory_gateway=MockInventoryGateway(item=None),
+        MockCartRepository(), MockInventoryGateway(), InMemoryUnitOfWork()
     )
 
     with pytest.raises(UserNotFoundError):
@@ -91,60 +91,85 @@ def test_should_raise_when_user_does_not_exist():
 
 
 def test_should_raise_when_item_does_not_exist():
-    user = _build_user()
+    user_id = uuid4()
     use_case = AddItemToCartUseCase(
-        user_repository=MockUserRepository(user=user),
-        cart_repository=MockCartRepository(),
-        inventory_gateway=MockInventoryGateway(item=None),
+        MockCartRepository(user_ids=[user_id]),
+        MockInventoryGateway(),
+        InMemoryUnitOfWork(),
     )
 
     with pytest.raises(ItemNotFoundError):
         use_case.execute(
-            AddToCartCommand(user_id=user.id, item_id=uuid4(), quantity=1)
+            AddToCartCommand(user_id=user_id, item_id=uuid4(), quantity=1)
         )
 
 
 def test_should_raise_when_not_enough_stock():
-    user = _build_user()
+    user_id = uuid4()
     item_id = uuid4()
     use_case = AddItemToCartUseCase(
-        user_repository=MockUserRepository(user=user),
-        cart_repository=MockCartRepository(),
-        inventory_gateway=MockInventoryGateway(item=_build_inventory_item(item_id)),
+        MockCartRepository(user_ids=[user_id], stock={item_id: 5}),
+        MockInventoryGateway(),
+        InMemoryUnitOfWork(),
     )
 
     with pytest.raises(NotEnoughStockError):
-        use_case.execute(AddToCartCommand(user_id=user.id, item_id=item_id, quantity=10))
+        use_case.execute(AddToCartCommand(
+            user_id=user_id, item_id=item_id, quantity=10
+        ))
 
 
 def test_should_raise_when_item_is_already_in_cart():
-    user = _build_user()
+    user_id = uuid4()
     item_id = uuid4()
     use_case = AddItemToCartUseCase(
-        user_repository=MockUserRepository(user=user),
-        cart_repository=MockCartRepository(
-            existing_items=[CartItemEntity(user_id=user.id, item_id=item_id, quantity=1)]
+        MockCartRepository(
+            user_ids=[user_id],
+            stock={item_id: 5},
+            existing_items=[
+                CartItemEntity(user_id=user_id, item_id=item_id, quantity=1)
+            ],
         ),
-        inventory_gateway=MockInventoryGateway(item=_build_inventory_item(item_id)),
+        MockInventoryGateway(),
+        InMemoryUnitOfWork(),
     )
 
     with pytest.raises(ItemAlreadyInCartError):
-        use_case.execute(AddToCartCommand(user_id=user.id, item_id=item_id, quantity=2))
+        use_case.execute(AddToCartCommand(user_id=user_id, item_id=item_id, quantity=2))
 
 
 def test_should_save_cart_item_and_return_updated_cart_when_valid_request():
-    user = _build_user()
+    user_id = uuid4()
     item_id = uuid4()
-    cart_repository = MockCartRepository()
-    use_case = AddItemToCartUseCase(
-        user_repository=MockUserRepository(user=user),
-        cart_repository=cart_repository,
-        inventory_gateway=MockInventoryGateway(item=_build_inventory_item(item_id)),
-    )
+    cart_repository = MockCartRepository(user_ids=[user_id], stock={item_id: 5})
+    inventory_gateway = MockInventoryGateway()
+    unit_of_work = InMemoryUnitOfWork()
+    use_case = AddItemToCartUseCase(cart_repository, inventory_gateway, unit_of_work)
 
-    result = use_case.execute(AddToCartCommand(user_id=user.id, item_id=item_id, quantity=2))
+    result = use_case.execute(AddToCartCommand(
+        user_id=user_id, item_id=item_id, quantity=2
+    ))
 
     assert len(cart_repository.saved_items) == 1
     assert len(result.items) == 1
     assert result.items[0].item_id == item_id
     assert result.items[0].quantity == 2
+    assert inventory_gateway.reserved == [(item_id, user_id, 2)]
+    assert unit_of_work.commits == 1
+
+
+def test_should_roll_back_cart_item_when_stock_is_taken_before_reservation():
+    user_id = uuid4()
+    item_id = uuid4()
+    unit_of_work = InMemoryUnitOfWork()
+    use_case = AddItemToCartUseCase(
+        MockCartRepository(user_ids=[user_id], stock={item_id: 5}),
+        MockInventoryGateway(stock_available=False),
+        unit_of_work,
+    )
+
+    with pytest.raises(NotEnoughStockError):
+        use_case.execute(AddToCartCommand(user_id=user_id, item_id=item_id, quantity=2))
+
+    assert unit_of_work.commits == 0
+    assert unit_of_work.rolled_back
@@ -0,0 +1,157 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from be_task_ca.unit_of_work import InMemoryUnitOfWork
+from be_task_ca.user.application.dto import AddItemsToCartCommand, CartLineCommand
+from be_task_ca.user.application.exceptions import (
+    CartItemsRejectedError,
+    ItemAlreadyInCartError,
+    ItemNotFoundError,
+    NotEnoughStockError,
+    UserNotFoundError,
+)
+from be_task_ca.user.application.interfaces.cart_repository_interface import (
+    AddItemsToCartAttempt,
+    AddToCartOutcome,
+)
+from be_task_ca.user.application.interfaces.inventory_gateway_interface import (
+    InventoryItemSnapshot,
+    InventoryReservation,
+)
+from be_task_ca.user.application.usecases.add_items_to_cart import (
+    AddItemsToCartUseCase,
+)
+from be_task_ca.user.domain.entities import CartItemEntity
+
+
+class MockCartRepository:
+    def __init__(self, user_ids=(), existing_items=()) -> None:
+        self._user_ids = set(user_ids)
+        self.items = list(existing_items)
+
+    def add_items_to_cart(self, user_id, cart_items):
+        cart = [item for item in self.items if item.user_id == user_id]
+        if user_id not in self._user_ids:
+            return AddItemsToCartAttempt(AddToCartOutcome.USER_NOT_FOUND, [])
+        in_cart = {item.item_id for item in cart}
+        if any(item.item_id in in_cart for item in cart_items):
+            return AddItemsToCartAttempt(AddToCartOutcome.ALREADY_IN_CART, cart)
+        self.items.extend(cart_items)
+        return AddItemsToCartAttempt(AddToCartOutcome.ADDED, cart + cart_items)
+
+
+class MockInventoryGateway:
+    def __init__(self, stock: dict, taken_after_lookup: dict | None = None) -> None:
+        self.stock = dict(stock)
+        self._taken_after_lookup = taken_after_lookup or {}
+        self.lookups = 0
+
+    def find_items_by_ids(self, item_ids):
+        self.lookups += 1
+        return {
+            item_id: InventoryItemSnapshot(item_id, "Item", None, 1.0, quantity)
+            for item_id, quantity in self.stock.items()
+            if item_id in set(item_ids)
+        }
+
+    def reserve_stocks(self, holder_id, quantities):
+        self.stock.update(self._taken_after_lookup)
+        if any(self.stock[item_id] < needed for item_id, needed in quantities.items()):
+            return None
+        return [
+            InventoryReservation(
+                uuid4(), item_id, holder_id, quantity, datetime.now(timezone.utc)
+            )
+            for item_id, quantity in quantities.items()
+        ]
+
+
+def _command(user_id, *lines) -> AddItemsToCartCommand:
+    return AddItemsToCartCommand(
+        user_id=user_id,
+        items=[CartLineCommand(item_id, quantity) for item_id, quantity in lines],
+    )
+
+
+def _rejected(use_case, command) -> dict[int, type]:
+    with pytest.raises(CartItemsRejectedError) as exc_info:
+        use_case.execute(command)
+    return {index: type(error) for index, error in exc_info.value.errors.items()}
+
+
+def test_should_add_all_lines_with_one_inventory_lookup():
+    user_id, pen, book = uuid4(), uuid4(), uuid4()
+    inventory = MockInventoryGateway({pen: 5, book: 1})
+    unit_of_work = InMemoryUnitOfWork()
+    use_case = AddItemsToCartUseCase(
+        MockCartRepository([user_id]), inventory, unit_of_work
+    )
+
+    result = use_case.execute(_command(user_id, (pen, 2), (book, 1)))
+
+    assert [(item.item_id, item.quantity) for item in result.items] == [
+        (pen, 2),
+        (book, 1),
+    ]
+    assert inventory.lookups == 1
+    assert unit_of_work.commits == 1
+
+
+def test_should_reject_failing_lines_and_add_nothing():
+    user_id, pen, book = uuid4(), uuid4(), uuid4()
+    cart = MockCartRepository([user_id])
+    use_case = AddItemsToCartUseCase(
+        cart, MockInventoryGateway({pen: 5, book: 1}), InMemoryUnitOfWork()
+    )
+
+    errors = _rejected(
+        use_case,
+        _command(user_id, (pen, 1), (uuid4(), 1), (book, 2), (pen, 1)),
+    )
+
+    assert errors == {
+        1: ItemNotFoundError,
+        2: NotEnoughStockError,
+        3: ItemAlreadyInCartError,
+    }
+    assert cart.items == []
+
+
+def test_should_reject_lines_already_in_cart():
+    user_id, pen, book = uuid4(), uuid4(), uuid4()
+    cart = MockCartRepository([user_id], [CartItemEntity(user_id, book, 1)])
+    use_case = AddItemsToCartUseCase(
+        cart, MockInventoryGateway({pen: 5, book: 5}), InMemoryUnitOfWork()
+    )
+
+    assert _rejected(use_case, _command(user_id, (pen, 1), (book, 1))) == {
+        1: ItemAlreadyInCartError
+    }
+    assert len(cart.items) == 1
+
+
+def test_should_raise_when_user_does_not_exist():
+    pen = uuid4()
+    use_case = AddItemsToCartUseCase(
+        MockCartRepository(), MockInventoryGateway({pen: 5}), InMemoryUnitOfWork()
+    )
+
+    with pytest.raises(UserNotFoundError):
+        use_case.execute(_command(uuid4(), (pen, 1)))
+
+
+def test_should_roll_back_added_lines_when_stock_was_taken_concurrently():
+    user_id, pen, book = uuid4(), uuid4(), uuid4()
+    inventory = MockInventoryGateway({pen: 5, book: 5}, taken_after_lookup={book: 0})
+    unit_of_work = InMemoryUnitOfWork()
+    use_case = AddItemsToCartUseCase(
+        MockCartRepository([user_id]), inventory, unit_of_work
+    )
+
+    assert _rejected(use_case, _command(user_id, (pen, 1), (book, 1))) == {
+        1: NotEnoughStockError
+    }
+    assert unit_of_work.commits == 0
+    assert unit_of_work.rolled_back
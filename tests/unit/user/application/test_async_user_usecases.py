@@ -0,0 +1,184 @@
+import asyncio
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from be_task_ca.unit_of_work import AsyncInMemoryUnitOfWork
+from be_task_ca.user.application.dto import AddToCartCommand, CreateUserCommand
+from be_task_ca.user.application.exceptions import (
+    ItemAlreadyInCartError,
+    NotEnoughStockError,
+    UserAlreadyExistsError,
+    UserNotFoundError,
+)
+from be_task_ca.user.application.interfaces.cart_repository_interface import (
+    AddToCartAttempt,
+    AddToCartOutcome,
+)
+from be_task_ca.user.application.interfaces.inventory_gateway_interface import (
+    InventoryReservation,
+)
+from be_task_ca.user.application.passwords import hash_password
+from be_task_ca.user.application.usecases.add_item_to_cart import (
+    AsyncAddItemToCartUseCase,
+)
+from be_task_ca.user.application.usecases.create_user import AsyncCreateUserUseCase
+from be_task_ca.user.domain.entities import CartItemEntity, UserEntity
+
+
+class MockAsyncUserRepository:
+    def __init__(self) -> None:
+        self.saved_users: list[UserEntity] = []
+
+    async def save_user(self, user: UserEntity) -> UserEntity:
+        saved_user = UserEntity(
+            id=uuid4(),
+            email=user.email,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            hashed_password=user.hashed_password,
+            shipping_address=user.shipping_address,
+        )
+        self.saved_users.append(saved_user)
+        return saved_user
+
+    async def save_user_if_absent(self, user: UserEntity) -> UserEntity | None:
+        if await self.find_user_by_email(user.email) is not None:
+            return None
+        return await self.save_user(user)
+
+    async def find_user_by_email(self, email: str) -> UserEntity | None:
+        return next((user for user in self.saved_users if user.email == email), None)
+
+    async def find_user_by_id(self, user_id):
+        return next((user for user in self.saved_users if user.id == user_id), None)
+
+
+class InlineAsyncPasswordHasher:
+    async def hash(self, password: str) -> str:
+        return hash_password(password)
+
+    async def hash_many(self, passwords: list[str]) -> list[str]:
+        return list(map(hash_password, passwords))
+
+
+class MockAsyncCartRepository:
+    def __init__(self, user_repository: MockAsyncUserRepository, item_id) -> None:
+        self.saved_items: list[CartItemEntity] = []
+        self._user_repository = user_repository
+        self._stock = {item_id: 5}
+
+    async def find_cart_items_for_user_id(self, user_id):
+        return [item for item in self.saved_items if item.user_id == user_id]
+
+    async def save_cart_item(self, cart_item: CartItemEntity) -> CartItemEntity:
+        self.saved_items.append(cart_item)
+        return cart_item
+
+    async def add_item_to_cart(self, cart_item: CartItemEntity) -> AddToCartAttempt:
+        cart = await self.find_cart_items_for_user_id(cart_item.user_id)
+        if await self._user_repository.find_user_by_id(cart_item.user_id) is None:
+            outcome = AddToCartOutcome.USER_NOT_FOUND
+        elif self._stock.get(cart_item.item_id, 0) < cart_item.quantity:
+            outcome = AddToCartOutcome.NOT_ENOUGH_STOCK
+        elif any(item.item_id == cart_item.item_id for item in cart):
+            outcome = AddToCartOutcome.ALREADY_IN_CART
+        else:
+            await self.save_cart_item(cart_item)
+            outcome = AddToCartOutcome.ADDED
+        return AddToCartAttempt(
+            outcome=outcome,
+            cart_items=await self.find_cart_items_for_user_id(cart_item.user_id),
+        )
+
+
+class MockAsyncInventoryGateway:
+    async def reserve_stock(self, item_id, holder_id, quantity):
+        return InventoryReservation(
+            id=uuid4(),
+            item_id=item_id,
+            holder_id=holder_id,
+            quantity=quantity,
+            expires_at=datetime.now(timezone.utc),
+        )
+
+
+def _create_user_command() -> CreateUserCommand:
+    return CreateUserCommand(
+        first_name="Marko",
+        last_name="Crnic",
+        email="marko@example.com",
+        password="secret-password",
+        shipping_address="Street 1",
+    )
+
+
+def _build_add_to_cart_use_case(user_repository, item_id):
+    return AsyncAddItemToCartUseCase(
+        MockAsyncCartRepository(user_repository, item_id),
+        MockAsyncInventoryGateway(),
+        AsyncInMemoryUnitOfWork(),
+    )
+
+
+async def _create_user(user_repository):
+    use_case = AsyncCreateUserUseCase(
+        user_repository, InlineAsyncPasswordHasher(), AsyncInMemoryUnitOfWork()
+    )
+    return await use_case.execute(_create_user_command())
+
+
+def test_should_create_user_and_reject_duplicate_email():
+    repository = MockAsyncUserRepository()
+    unit_of_work = AsyncInMemoryUnitOfWork()
+    use_case = AsyncCreateUserUseCase(
+        repository, InlineAsyncPasswordHasher(), unit_of_work
+    )
+
+    result = asyncio.run(use_case.execute(_create_user_command()))
+
+    assert result.email == "marko@example.com"
+    assert repository.saved_users[0].hashed_password != "secret-password"
+    assert unit_of_work.commits == 1
+    with pytest.raises(UserAlreadyExistsError):
+        asyncio.run(use_case.execute(_create_user_command()))
+
+
+def test_should_add_item_to_cart_and_return_updated_cart():
+    user_repository = MockAsyncUserRepository()
+    user = asyncio.run(_create_user(user_repository))
+    item_id = uuid4()
+    use_case = _build_add_to_cart_use_case(user_repository, item_id)
+
+    result = asyncio.run(
+        use_case.execute(AddToCartCommand(user_id=user.id, item_id=item_id, quantity=2))
+    )
+
+    assert [(item.item_id, item.quantity) for item in result.items] == [(item_id, 2)]
+    with pytest.raises(ItemAlreadyInCartError):
+        asyncio.run(
+            use_case.execute(AddToCartCommand(
+                user_id=user.id, item_id=item_id, quantity=1
+            ))
+        )
+
+
+def test_should_raise_when_user_missing_or_stock_insufficient():
+    user_repository = MockAsyncUserRepository()
+    user = asyncio.run(_create_user(user_repository))
+    item_id = uuid4()
+    use_case = _build_add_to_cart_use_case(user_repository, item_id)
+
+    with pytest.raises(UserNotFoundError):
+        asyncio.run(
+            use_case.execute(AddToCartCommand(
+                user_id=uuid4(), item_id=item_id, quantity=1
+            ))
+        )
+    with pytest.raises(NotEnoughStockError):
+        asyncio.run(
+            use_case.execute(AddToCartCommand(
+                user_id=user.id, item_id=item_id, quantity=9
+            ))
+        )
@@ -3,8 +3,10 @@ from uuid import uuid4
 
 import pytest
 
+from be_task_ca.unit_of_work import InMemoryUnitOfWork
 from be_task_ca.user.application.dto import CreateUserCommand
 from be_task_ca.user.application.exceptions import UserAlreadyExistsError
+from be_task_ca.user.application.passwords import hash_password
 from be_task_ca.user.application.usecases.create_user import CreateUserUseCase
 from be_task_ca.user.domain.entities import UserEntity
 
@@ -26,6 +28,11 @@ class MockUserRepository:
         self.saved_users.append(saved_user)
         return saved_user
 
+    def save_user_if_absent(self, user: UserEntity) -> UserEntity | None:
+        if self.find_user_by_email(user.email) is not None:
+            return None
+        return self.save_user(user)
+
     def find_user_by_email(self, email: str) -> UserEntity | None:
         if self._existing_user and self._existing_user.email == email:
             return self._existing_user
@@ -35,9 +42,18 @@ class MockUserRepository:
         return None
 
 
+class InlinePasswordHasher:
+    def hash(self, password: str) -> str:
+        return hash_password(password)
+
+    def hash_many(self, passwords: list[str]) -> list[str]:
+        return list(map(hash_password, passwords))
+
+
 def test_should_create_user_and_hash_password_when_email_is_unique():
     repository = MockUserRepository(existing_user=None)
-    use_case = CreateUserUseCase(repository)
+    unit_of_work = InMemoryUnitOfWork()
+    use_case = CreateUserUseCase(repository, InlinePasswordHasher(), unit_of_work)
 
     result = use_case.execute(
         CreateUserCommand(
@@ -51,6 +67,7 @@ def test_should_create_user_and_hash_password_when_email_is_unique():
 
     assert result.email == "marko@example.com"
     assert len(repository.saved_users) == 1
+    assert unit_of_work.commits == 1
     assert repository.saved_users[0].hashed_password != "secret-password"
     assert repository.saved_users[0].hashed_password == hashlib.sha512(
         "secret-password".encode("UTF-8")
@@ -68,7 +85,9 @@ def test_should_raise_when_user_email_already_exists():
             shipping_address="Street 2",
         )
     )
-    use_case = CreateUserUseCase(repository)
+    use_case = CreateUserUseCase(
+        repository, InlinePasswordHasher(), InMemoryUnitOfWork()
+    )
 
     with pytest.raises(UserAlreadyExistsError):
         use_case.execute(
@@ -0,0 +1,118 @@
+import asyncio
+from uuid import uuid4
+
+from be_task_ca.unit_of_work import AsyncInMemoryUnitOfWork, InMemoryUnitOfWork
+from be_task_ca.user.application.dto import CreateUserCommand, UserImportStatus
+from be_task_ca.user.application.passwords import hash_password
+from be_task_ca.user.application.usecases.create_users import (
+    AsyncCreateUsersUseCase,
+    CreateUsersUseCase,
+)
+from be_task_ca.user.domain.entities import UserEntity
+
+
+class MockUserRepository:
+    def __init__(self, existing_emails=()) -> None:
+        self._emails = set(existing_emails)
+        self.batches: list[list[UserEntity]] = []
+
+    def find_existing_emails(self, emails: list[str]) -> set[str]:
+        return self._emails.intersection(emails)
+
+    def save_users(self, users: list[UserEntity]) -> list[UserEntity]:
+        self.batches.append(users)
+        saved_users = []
+        for user in users:
+            if user.email not in self._emails:
+                self._emails.add(user.email)
+                saved_users.append(
+                    UserEntity(
+                        id=uuid4(),
+                        email=user.email,
+                        first_name=user.first_name,
+                        last_name=user.last_name,
+                        hashed_password=user.hashed_password,
+                        shipping_address=user.shipping_address,
+                    )
+                )
+        return saved_users
+
+
+class RecordingPasswordHasher:
+    def __init__(self) -> None:
+        self.hashed: list[str] = []
+
+    def hash(self, password: str) -> str:
+        return self.hash_many([password])[0]
+
+    def hash_many(self, passwords: list[str]) -> list[str]:
+        self.hashed.extend(passwords)
+        return list(map(hash_password, passwords))
+
+
+class AsyncRecordingPasswordHasher(RecordingPasswordHasher):
+    async def hash(self, password: str) -> str:
+        return super().hash(password)
+
+    async def hash_many(self, passwords: list[str]) -> list[str]:
+        return super().hash_many(passwords)
+
+
+class AsyncMockUserRepository(MockUserRepository):
+    async def find_existing_emails(self, emails: list[str]) -> set[str]:
+        return super().find_existing_emails(emails)
+
+    async def save_users(self, users: list[UserEntity]) -> list[UserEntity]:
+        return super().save_users(users)
+
+
+def _command(email: str) -> CreateUserCommand:
+    return CreateUserCommand(
+        first_name="Marko",
+        last_name="Crnic",
+        email=email,
+        password=f"secret-{email}",
+        shipping_address=None,
+    )
+
+
+def test_should_report_rows_in_input_order_and_hash_only_new_users():
+    repository = MockUserRepository(existing_emails=["taken@example.com"])
+    emails = ["a@example.com", "taken@example.com", "b@example.com", "a@example.com"]
+
+    hasher = RecordingPasswordHasher()
+    unit_of_work = InMemoryUnitOfWork()
+    use_case = CreateUsersUseCase(repository, hasher, unit_of_work, batch_size=2)
+
+    result = use_case.execute(_command(email) for email in emails)
+
+    assert [(row.email, row.status) for row in result.rows] == [
+        ("a@example.com", UserImportStatus.CREATED),
+        ("taken@example.com", UserImportStatus.CONFLICT),
+        ("b@example.com", UserImportStatus.CREATED),
+        ("a@example.com", UserImportStatus.CONFLICT),
+    ]
+    assert (result.created, result.conflicts) == (2, 2)
+    saved = [user for batch in repository.batches for user in batch]
+    assert [user.email for user in saved] == ["a@example.com", "b@example.com"]
+    assert saved[0].hashed_password == hash_password("secret-a@example.com")
+    assert hasher.hashed == ["secret-a@example.com", "secret-b@example.com"]
+    assert unit_of_work.commits == len(repository.batches) == 2
+
+
+def test_async_should_drop_repeated_email_within_one_batch():
+    repository = AsyncMockUserRepository()
+
+    use_case = AsyncCreateUsersUseCase(
+        repository, AsyncRecordingPasswordHasher(), AsyncInMemoryUnitOfWork()
+    )
+
+    result = asyncio.run(
+        use_case.execute([_command("a@example.com"), _command("a@example.com")])
+    )
+
+    assert [row.status for row in result.rows] == [
+        UserImportStatus.CREATED,
+        UserImportStatus.CONFLICT,
+    ]
+    assert len(repository.batches[0]) == 1
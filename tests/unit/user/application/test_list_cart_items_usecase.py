@@ -1,32 +1,44 @@
 from uuid import uuid4
 
+from be_task_ca.user.application.dto import CartLineView
 from be_task_ca.user.application.usecases.list_cart_items import ListCartItemsUseCase
-from be_task_ca.user.domain.entities import CartItemEntity
 
 
-class MockCartRepository:
-    def __init__(self, items: list[CartItemEntity]) -> None:
-        self._items = items
+class MockCartViewReader:
+    def __init__(self, lines: dict) -> None:
+        self._lines = lines
 
-    def find_cart_items_for_user_id(self, user_id):
-        return [item for item in self._items if item.user_id == user_id]
+    def get_cart_lines(self, user_id):
+        return self._lines.get(user_id, [])
 
-    def save_cart_item(self, cart_item: CartItemEntity) -> CartItemEntity:
-        return cart_item
 
-
-def test_should_map_cart_entities_to_result_dto():
+def test_should_price_cart_lines_and_total():
     user_id = uuid4()
     use_case = ListCartItemsUseCase(
-        MockCartRepository(
-            items=[
-                CartItemEntity(user_id=user_id, item_id=uuid4(), quantity=2),
-                CartItemEntity(user_id=uuid4(), item_id=uuid4(), quantity=5),
-            ]
+        MockCartViewReader(
+            {
+                user_id: [
+                    CartLineView(item_id=uuid4(), name="Pen", price=0.1, quantity=3),
+                    CartLineView(item_id=uuid4(), name="Book", price=19.99, quantity=2),
+                ],
+                uuid4(): [
+                    CartLineView(item_id=uuid4(), name="Lamp", price=5.0, quantity=1)
+                ],
+            }
         )
     )
 
     result = use_case.execute(user_id)
 
-    assert len(result.items) == 1
-    assert result.items[0].quantity == 2
+    assert [(item.name, item.line_total) for item in result.items] == [
+        ("Pen", 0.3),
+        ("Book", 39.98),
+    ]
+    assert result.total == 40.28
+
+
+def test_should_return_empty_cart_with_zero_total():
+    result = ListCartItemsUseCase(MockCartViewReader({})).execute(uuid4())
+
+    assert result.items == []
+    assert result.total == 0